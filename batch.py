@@ -0,0 +1,180 @@
+# batch.py
+"""
+Headless batch runner: every workload file x every policy, on all cores.
+
+    python batch.py workloads/*.csv --policies FCFSScheduler RRScheduler --quantum 4 --out results.csv
+
+Workload files are CSV or JSON (see utils/workload_files.py). The metrics
+table is written as CSV, or JSON when --out ends with .json. Rows are written
+as they finish, in input order, so an interrupted run keeps what it had.
+
+With --stream, files are arrival-sorted traces (CSV or binary, see
+utils/trace.py) read lazily with bounded memory; percentiles are then
+approximate (see utils.metrics.StreamingMetrics).
+
+With --schedules DIR, every run also streams its slices to
+DIR/<workload>.<policy>.sched (see utils/schedule_file.py) for offline analysis,
+<workload> being the file's path relative to the inputs' common directory,
+extension included, with '/' replaced by '__'.
+"""
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import sys
+import time
+
+from core.engine.engine import Engine
+from core.engine.policies import POLICIES, policy_by_name
+from core.engine.stream import StreamingEngine
+from utils.metrics import engine_metrics
+from utils.schedule_file import record_schedule
+from utils.trace import read_trace
+from utils.workload_files import read_workload
+
+COLUMNS = [
+    'workload', 'policy', 'status', 'error', 'count',
+    'avg_waiting', 'p95_waiting', 'max_waiting',
+    'avg_turnaround', 'p95_turnaround', 'max_turnaround',
+    'avg_response', 'p95_response', 'max_response',
+    'makespan', 'throughput', 'cpu_utilization', 'context_switches', 'seconds',
+]
+
+# Tasks are ordered file by file, so a worker usually gets every policy of
+# the same file in a row: keep the last parsed file instead of re-reading it
+_last_workload = (None, None)
+
+
+def _load(path):
+    global _last_workload
+    if _last_workload[0] != path:
+        _last_workload = (path, read_workload(path))
+    return _last_workload[1]
+
+
+def _row(path, policy, metrics, seconds):
+    row = {'workload': path, 'policy': policy, 'status': 'ok', 'error': '', 'count': metrics['count']}
+    for field in ('waiting', 'turnaround', 'response'):
+        row[f'avg_{field}'] = metrics[field]['mean']
+        row[f'p95_{field}'] = metrics[field]['p95']
+        row[f'max_{field}'] = metrics[field]['max']
+    for field in ('makespan', 'throughput', 'cpu_utilization', 'context_switches'):
+        row[field] = metrics[field]
+    row['seconds'] = seconds
+    return row
+
+
+def _schedule_names(paths):
+    """
+    Maps every workload path to the name its schedule files start with.
+    Raises ValueError if two paths would share one (e.g. the same file given twice)
+    """
+    full = [os.path.abspath(path) for path in paths]
+    root = os.path.commonpath([os.path.dirname(path) for path in full])
+    names, taken = {}, set()
+    for path, absolute in zip(paths, full):
+        name = os.path.relpath(absolute, root).replace(os.sep, '__')
+        if name in taken:
+            raise ValueError(f"{path}: its schedule files would overwrite another workload's")
+        taken.add(name)
+        names[path] = name
+    return names
+
+
+def run_one(task):
+    """
+    Runs one (workload path, policy name, quantum, stream, schedule file or
+    None) task and returns its metrics row
+    """
+    path, policy, quantum, stream, schedule = task
+    writer = None
+    try:
+        if stream:
+            start = time.perf_counter()
+            engine = StreamingEngine(policy_by_name(policy, quantum))
+            if schedule:
+                writer = record_schedule(engine, schedule)
+            metrics = engine.feed(read_trace(path))
+            return _row(path, policy, metrics, time.perf_counter() - start)
+        processes = _load(path)
+        start = time.perf_counter()
+        engine = Engine(policy_by_name(policy, quantum), processes)
+        if schedule:
+            writer = record_schedule(engine, schedule)
+        engine.run()
+        metrics = engine_metrics(engine)
+        return _row(path, policy, metrics, time.perf_counter() - start)
+    except (OSError, ValueError) as e:
+        return {'workload': path, 'policy': policy, 'status': 'error', 'error': str(e)}
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def run_batch(paths, policies, quantum=None, jobs=None, stream=False, schedules=None):
+    """
+    Yields one metrics row per (path, policy), in input order.
+    Raises ValueError (before running anything) if schedules would collide
+    """
+    schedule = dict.fromkeys(paths)
+    if schedules and paths:
+        names = _schedule_names(paths)
+        os.makedirs(schedules, exist_ok=True)
+        schedule = {path: os.path.join(schedules, names[path]) for path in paths}
+    tasks = [(path, policy, quantum, stream, schedule[path] and f"{schedule[path]}.{policy}.sched")
+             for path in paths for policy in policies]
+    if not tasks:
+        return
+    jobs = jobs or os.cpu_count() or 1
+    with multiprocessing.Pool(jobs) as pool:
+        # Small chunks keep all cores busy when file sizes vary a lot
+        chunksize = max(1, min(len(policies), len(tasks) // (jobs * 4)))
+        yield from pool.imap(run_one, tasks, chunksize)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run workload files through the CPU schedulers")
+    parser.add_argument('workloads', nargs='+', help="CSV or JSON workload files")
+    parser.add_argument('--policies', nargs='+', default=list(POLICIES), choices=list(POLICIES))
+    parser.add_argument('--quantum', type=int, default=2, help="Round Robin quantum")
+    parser.add_argument('--jobs', type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument('--stream', action='store_true', help="read arrival-sorted traces lazily (bounded memory)")
+    parser.add_argument('--schedules', metavar='DIR', help="also write every run's slices to DIR")
+    parser.add_argument('--out', default='batch_results.csv')
+    args = parser.parse_args(argv)
+    if args.schedules:
+        try:
+            _schedule_names(args.workloads)
+        except ValueError as e:
+            parser.error(str(e))
+
+    failed = 0
+    as_json = args.out.lower().endswith('.json')
+    with open(args.out, 'w', newline='') as f:
+        if as_json:
+            rows = []
+        else:
+            writer = csv.DictWriter(f, COLUMNS, restval='')
+            writer.writeheader()
+
+        for row in run_batch(args.workloads, args.policies, args.quantum, args.jobs, args.stream,
+                             args.schedules):
+            if row['status'] != 'ok':
+                failed += 1
+                print(f"{row['workload']} [{row['policy']}]: {row['error']}", file=sys.stderr)
+            if as_json:
+                rows.append(row)
+            else:
+                writer.writerow(row)
+                f.flush()
+
+        if as_json:
+            json.dump(rows, f, indent=1)
+
+    print(f"Results written to {args.out}" + (f" ({failed} failed)" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""
+Benchmarks every scheduler's schedule() and the headless (engine) path of
+every simulator over synthetic workloads.
+
+    python -m benchmarks.run --sizes 10 1000 100000 --horizons 1000 1000000 --out bench_results.json
+    python -m benchmarks.run --compare old.json new.json
+    python -m benchmarks.run --compare old.json new.json --max-slowdown 1.25
+
+With --max-slowdown the comparison exits with status 1 when a case got
+slower than that ratio, so it can guard a change in CI.
+
+Each case runs in its own process so a slow case can be cut off with
+--timeout and peak memory (tracemalloc) is measured in isolation.
+events = arrivals + emitted slices.
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.workloads import WORKLOADS
+from core.engine.engine import Engine
+from core.engine.policies import policy_for
+from core.engine.smp import SMPEngine
+from core.schedulers.fcfs import FCFSScheduler
+from core.schedulers.sjf import SJFScheduler
+from core.schedulers.srtf import SRTFScheduler
+from core.schedulers.priority_preem import priority_preem
+from core.schedulers.priority_nonpreem import PriorityNonPreemptiveScheduler
+from core.schedulers.round_robin import RRScheduler
+from core.schedulers.mlfq import MLFQScheduler
+
+
+def _scheduler(factory):
+    return lambda processes, quantum: factory(quantum).schedule(processes)
+
+
+def _headless(factory):
+    # What the simulator's run loop computes, minus the Qt pacing
+    return lambda processes, quantum: Engine(policy_for(factory(quantum), quantum), processes).run()['timeline']
+
+
+def _smp(factory, cpus, per_core_queues):
+    return lambda processes, quantum: SMPEngine(policy_for(factory(quantum), quantum), processes, cpus,
+                                                migration_cost=1, per_core_queues=per_core_queues).run()['timeline']
+
+
+FACTORIES = {
+    'FCFS': lambda q: FCFSScheduler(),
+    'SJF': lambda q: SJFScheduler(),
+    'SRTF': lambda q: SRTFScheduler(),
+    'PriorityPreemptive': lambda q: priority_preem(),
+    'PriorityNonPreemptive': lambda q: PriorityNonPreemptiveScheduler(),
+    'RR': lambda q: RRScheduler(q),
+    'MLFQ': lambda q: MLFQScheduler((q, 2 * q, 4 * q)),
+}
+
+TARGETS = {
+    'FCFSScheduler.schedule': _scheduler(FACTORIES['FCFS']),
+    'SJFScheduler.schedule': _scheduler(FACTORIES['SJF']),
+    'SRTFScheduler.schedule': _scheduler(FACTORIES['SRTF']),
+    'priority_preem.schedule': _scheduler(FACTORIES['PriorityPreemptive']),
+    'PriorityNonPreemptiveScheduler.schedule': _scheduler(FACTORIES['PriorityNonPreemptive']),
+    'RRScheduler.schedule': _scheduler(FACTORIES['RR']),
+    'Simulator[FCFS]': _headless(FACTORIES['FCFS']),
+    'Simulator[SJF]': _headless(FACTORIES['SJF']),
+    'SimulatorPreemitives[SRTF]': _headless(FACTORIES['SRTF']),
+    'SimulatorPriority[preemptive]': _headless(FACTORIES['PriorityPreemptive']),
+    'SimulatorPriority[non-preemptive]': _headless(FACTORIES['PriorityNonPreemptive']),
+    'SimulatorPreem[RR]': _headless(FACTORIES['RR']),
+    'SimulatorMLFQ[MLFQ]': _headless(FACTORIES['MLFQ']),
+    'SMPEngine[SRTF x64]': _smp(FACTORIES['SRTF'], 64, False),
+    'SMPEngine[RR x64 per-core]': _smp(FACTORIES['RR'], 64, True),
+}
+
+
+def _measure(case, memory, queue):
+    processes = WORKLOADS[case['workload']](case['n'], case['horizon'], seed=case['seed'])
+    run = TARGETS[case['target']]
+
+    start = time.perf_counter()
+    timeline = run(processes, case['quantum'])
+    seconds = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        tracemalloc.start()
+        run(processes, case['quantum'])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    events = case['n'] + len(timeline)
+    queue.put({'seconds': seconds, 'peak_bytes': peak, 'events': events,
+               'events_per_sec': events / seconds if seconds > 0 else None})
+
+
+def run_case(case, timeout, memory=True):
+    queue = multiprocessing.Queue()
+    worker = multiprocessing.Process(target=_measure, args=(case, memory, queue))
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        worker.terminate()
+        worker.join()
+        return dict(case, status='timeout')
+    if worker.exitcode != 0 or queue.empty():
+        return dict(case, status='error')
+    return dict(case, status='ok', **queue.get())
+
+
+def run_all(targets, workloads, sizes, horizons, quantum=2, seed=0, timeout=60.0, memory=True):
+    results = []
+    for target in targets:
+        for workload in workloads:
+            for horizon in horizons:
+                timed_out = False
+                for n in sorted(sizes):
+                    case = {'target': target, 'workload': workload, 'n': n,
+                            'horizon': horizon, 'quantum': quantum, 'seed': seed}
+                    if timed_out:
+                        # Bigger n would only time out again
+                        results.append(dict(case, status='skipped'))
+                        continue
+                    result = run_case(case, timeout, memory)
+                    timed_out = result['status'] == 'timeout'
+                    results.append(result)
+                    print(_format(result), flush=True)
+    return results
+
+
+def _format(result):
+    head = f"{result['target']:<40} {result['workload']:<13} n={result['n']:<8} horizon={result['horizon']:<11}"
+    if result['status'] != 'ok':
+        return f"{head} {result['status']}"
+    peak = f"{result['peak_bytes'] / 2 ** 20:8.1f} MiB" if result['peak_bytes'] is not None else ""
+    return f"{head} {result['seconds']:9.4f} s {result['events_per_sec'] or 0:12.0f} ev/s {peak}"
+
+
+def _key(result):
+    return (result['target'], result['workload'], result['n'], result['horizon'])
+
+
+def compare(old_path, new_path, max_slowdown=None):
+    """
+    Prints new/old ratios of wall time and peak memory for the cases both
+    files share. Returns the cases slower than max_slowdown times before.
+    """
+    with open(old_path) as f:
+        old = {_key(r): r for r in json.load(f)['results']}
+    with open(new_path) as f:
+        new = json.load(f)['results']
+
+    regressions = []
+    for result in new:
+        before = old.get(_key(result))
+        if not before or before['status'] != 'ok' or result['status'] != 'ok':
+            continue
+        speed = result['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+        line = f"{result['target']:<40} {result['workload']:<13} n={result['n']:<8} horizon={result['horizon']:<11} time x{speed:.2f}"
+        if before.get('peak_bytes') and result.get('peak_bytes') is not None:
+            line += f"  memory x{result['peak_bytes'] / before['peak_bytes']:.2f}"
+        if max_slowdown is not None and speed > max_slowdown:
+            line += "  SLOWER"
+            regressions.append(result)
+        print(line)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CPU scheduler benchmarks")
+    parser.add_argument('--targets', nargs='+', default=list(TARGETS), choices=list(TARGETS))
+    parser.add_argument('--workloads', nargs='+', default=list(WORKLOADS), choices=list(WORKLOADS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10, 100, 1000, 10000, 100000, 1000000])
+    parser.add_argument('--horizons', nargs='+', type=int, default=[1000, 1000000, 1000000000])
+    parser.add_argument('--quantum', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=60.0, help="seconds per case")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc pass")
+    parser.add_argument('--out', default='bench_results.json')
+    parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+    parser.add_argument('--max-slowdown', type=float, help="with --compare: fail when a case is this many times slower")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        if compare(*args.compare, max_slowdown=args.max_slowdown):
+            sys.exit(f"Cases slower than x{args.max_slowdown}")
+        return
+
+    results = run_all(args.targets, args.workloads, args.sizes, args.horizons,
+                      args.quantum, args.seed, args.timeout, not args.no_memory)
+    with open(args.out, 'w') as f:
+        json.dump({'python': platform.python_version(), 'platform': platform.platform(),
+                   'created': time.strftime('%Y-%m-%dT%H:%M:%S'), 'results': results}, f, indent=1)
+    print(f"Results written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+from utils.generator import generate_columns
+
+# Synthetic workloads for the benchmarks, drawn by utils.generator.
+# Every generator returns a list of process dicts (name, arrival, burst, priority)
+# sorted by arrival, whose arrivals span roughly [0, horizon) and whose bursts
+# keep the CPU about `load` busy over that span.
+
+
+def _processes(n, horizon, load, seed, **options):
+    mean = max(1.0, load * horizon / max(n, 1))
+    # Arrival rate n / horizon (above `load` once bursts cannot get shorter than 1)
+    arrival, burst, priority = generate_columns(n, mean_burst=mean, load=mean * max(n, 1) / max(horizon, 1),
+                                                levels=10, seed=seed, **options)
+    return [{'name': f'P{i}', 'arrival': a, 'burst': b, 'priority': p}
+            for i, (a, b, p) in enumerate(zip(arrival.tolist(), burst.tolist(), priority.tolist()))]
+
+
+def uniform(n, horizon, load=0.9, seed=0):
+    return _processes(n, horizon, load, seed, arrivals='uniform', bursts='uniform')
+
+
+def poisson(n, horizon, load=0.9, seed=0):
+    # Exponential inter-arrival times and exponential bursts
+    return _processes(n, horizon, load, seed, arrivals='poisson', bursts='exponential')
+
+
+def heavy_tailed(n, horizon, load=0.9, seed=0, alpha=1.5):
+    # Pareto bursts: most jobs are short, a few are huge
+    return _processes(n, horizon, load, seed, arrivals='uniform', bursts='pareto', alpha=alpha)
+
+
+def bursty(n, horizon, load=0.9, seed=0, clusters=10):
+    # Arrivals packed into about `clusters` windows, 20 times denser than average
+    return _processes(n, horizon, load, seed, arrivals='bursty', bursts='uniform',
+                      cluster=max(1, n // clusters), spread=20.0)
+
+
+def all_at_zero(n, horizon, load=0.9, seed=0):
+    return _processes(n, horizon, load, seed, arrivals='zero', bursts='uniform')
+
+
+WORKLOADS = {
+    'uniform': uniform,
+    'poisson': poisson,
+    'heavy_tailed': heavy_tailed,
+    'bursty': bursty,
+    'all_at_zero': all_at_zero,
+}
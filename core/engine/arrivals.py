@@ -0,0 +1,79 @@
+import heapq
+from array import array
+from itertools import islice
+
+INF = float('inf')
+
+
+def arrival_order(arrival):
+    """pids sorted by (arrival, pid), as an array('q'): the order Arrivals consumes"""
+    if all(a <= b for a, b in zip(arrival, islice(arrival, 1, None))):
+        return array('q', range(len(arrival)))   # already sorted (traces, generated workloads)
+    return array('q', sorted(range(len(arrival)), key=arrival.__getitem__))
+
+
+def check_arrival(engine, process):
+    """
+    Raises ValueError if a process added to a running engine arrives before
+    engine.earliest_arrival(): the decisions already taken at the engine's
+    time would not account for it
+    """
+    earliest = engine.earliest_arrival()
+    if process['arrival'] < earliest:
+        raise ValueError(f"Process {process['name']} arrives at {process['arrival']}, "
+                         f"before the engine can admit it (t={earliest})")
+
+
+class Arrivals:
+    """
+    Arrivals an engine has not admitted yet, in (time, pid) order.
+    The processes the engine starts with are an array of pids sorted by
+    arrival (arrival_order) read through a cursor, 8 bytes per process and
+    never modified, so one order can serve many runs of the same table.
+    Processes added while the engine runs go to a heap of (time, pid), time
+    being their arrival (see check_arrival).
+    """
+    __slots__ = ('arrival', 'order', 'cursor', 'added')
+
+    def __init__(self, arrival, order=None):
+        self.arrival = arrival
+        self.order = arrival_order(arrival) if order is None else order
+        self.cursor = 0
+        self.added = []
+
+    def __bool__(self):
+        return self.cursor < len(self.order) or bool(self.added)
+
+    def push(self, time, pid):
+        """Queues an added process, due at time; returns its (time, pid) entry"""
+        entry = (time, pid)
+        heapq.heappush(self.added, entry)
+        return entry
+
+    def next_time(self):
+        t = self.arrival[self.order[self.cursor]] if self.cursor < len(self.order) else INF
+        if self.added and self.added[0][0] < t:
+            t = self.added[0][0]
+        return t
+
+    def due(self, t):
+        """Removes and returns the pids due at or before t, in (time, pid) order"""
+        order, arrival = self.order, self.arrival
+        i = j = self.cursor
+        n = len(order)
+        while j < n and arrival[order[j]] <= t:
+            j += 1
+        self.cursor = j
+        added = self.added
+        if not added or added[0][0] > t:
+            return order[i:j]
+        # Merge with the added processes due
+        pids = []
+        heappop = heapq.heappop
+        while i < j or (added and added[0][0] <= t):
+            if i < j and (not added or added[0][0] > t or (arrival[order[i]], order[i]) < added[0]):
+                pids.append(order[i])
+                i += 1
+            else:
+                pids.append(heappop(added)[1])
+        return pids
@@ -0,0 +1,155 @@
+from array import array
+from bisect import bisect_right, insort
+
+
+class Checkpoints:
+    """
+    Snapshots of an engine's state taken every `every` events, plus one at
+    the start, so the engine can be put back at any instant by restoring the
+    last snapshot before it and replaying at most `every` events.
+
+    The engine names its state in CHECKPOINT_VALUES (plain values),
+    CHECKPOINT_SEQUENCES (short lists, e.g. one entry per CPU, restored in
+    place) and CHECKPOINT_COLUMNS (the per-process arrays of its process
+    table), returns its ready queues from _ready_queues() and the pids on its
+    CPUs from _running_pids(). The timeline is output, not state: it keeps
+    every slice up to the furthest point reached and is never cut back.
+
+    Columns are saved as deltas: the rows of the processes that ran or
+    arrived since the previous snapshot (the only rows an event changes),
+    with a whole copy once the deltas since the last one add up to the number
+    of processes. A snapshot thus costs O(every) memory on average and a
+    restore O(processes). Arrivals (core.engine.arrivals) are saved as the
+    cursor into the initial processes' order and the number of added
+    processes admitted: those leave their heap in (time, pid) order, so the
+    rest is a suffix of every added arrival, sorted.
+
+    Processes added while the engine runs (see added()) keep every snapshot:
+    restoring one taken before they were added puts their rows back as they
+    were when added and queues their arrivals again.
+    """
+
+    def __init__(self, engine, every):
+        if every < 1:
+            raise ValueError("Checkpoint interval must be at least 1 event")
+        self.engine = engine
+        self.every = every
+        self.times = []
+        self._states = []
+        self._next = 0
+        self._entries = sorted(engine._arrivals.added)   # every (time, pid) added so far
+        self._added = {}         # pid -> its column values when added
+        self._delta_rows = 0     # rows saved as deltas since the last whole copy
+        self._touched = set()    # pids whose rows may have changed since the last save()
+        self._admitted = (0, 0)  # (cursor, added arrivals admitted) at the last save()
+        self.save()
+
+    def __len__(self):
+        return len(self.times)
+
+    def added(self, pid, entry):
+        """Records a process the engine just added, and the (arrival, pid) entry it queued"""
+        engine = self.engine
+        self._added[pid] = [getattr(engine, name)[pid] for name in engine.CHECKPOINT_COLUMNS]
+        # Arrivals admitted so far all come before it (they were due by now)
+        insort(self._entries, entry)
+
+    def save(self):
+        engine = self.engine
+        self._next = engine.events + self.every
+        arrivals = engine._arrivals
+        admitted = arrivals.cursor, len(self._entries) - len(arrivals.added)
+        if not self.times or engine.time > self.times[-1]:
+            columns = [getattr(engine, name) for name in engine.CHECKPOINT_COLUMNS]
+            pids = self._touched
+            pids.update(arrivals.order[self._admitted[0]:admitted[0]])
+            pids.update(pid for _, pid in self._entries[self._admitted[1]:admitted[1]])
+            self._delta_rows += len(pids)
+            if not self.times or self._delta_rows >= len(engine):
+                self._delta_rows = 0
+                rows = None, [column[:] for column in columns]
+            else:
+                pids = array('q', sorted(pids))
+                rows = pids, [array('q', [column[pid] for pid in pids]) for column in columns]
+            self.times.append(engine.time)
+            self._states.append((
+                [getattr(engine, name) for name in engine.CHECKPOINT_VALUES],
+                [list(getattr(engine, name)) for name in engine.CHECKPOINT_SEQUENCES],
+                [queue.snapshot() for queue in engine._ready_queues()],
+                admitted,
+                len(engine),
+                rows,
+            ))
+        # else: already covered (replaying after a restore); rows changed
+        # since then belong to processes that run from now on
+        self._touched = set(engine._running_pids())
+        self._admitted = admitted
+
+    def step(self):
+        # Called by the engine after every event
+        self._touched.update(self.engine._running_pids())
+        if self.engine.events >= self._next:
+            self.save()
+
+    def before(self, t):
+        """Time of the last snapshot taken at or before time t"""
+        i = bisect_right(self.times, t) - 1
+        if i < 0:
+            raise ValueError(f"No checkpoint at or before t={t}")
+        return self.times[i]
+
+    def restore(self, t):
+        """Restores the last snapshot taken at or before time t and returns its time"""
+        i = bisect_right(self.times, t) - 1
+        if i < 0:
+            raise ValueError(f"No checkpoint at or before t={t}")
+        engine = self.engine
+        values, sequences, queues, admitted, count, _ = self._states[i]
+        for name, value in zip(engine.CHECKPOINT_VALUES, values):
+            setattr(engine, name, value)
+        for name, value in zip(engine.CHECKPOINT_SEQUENCES, sequences):
+            getattr(engine, name)[:] = value
+        for queue, state in zip(engine._ready_queues(), queues):
+            queue.restore(state)
+        self._restore_columns(i)
+        # A sorted list is a heap; it holds the arrivals of processes added since
+        engine._arrivals.cursor = admitted[0]
+        engine._arrivals.added[:] = self._entries[admitted[1]:]
+        if count < len(engine):
+            engine._added_arrivals()
+
+        self._next = engine.events + self.every
+        self._touched = set(engine._running_pids())
+        self._admitted = admitted
+        return self.times[i]
+
+    def _restore_columns(self, i):
+        engine = self.engine
+        columns = [getattr(engine, name) for name in engine.CHECKPOINT_COLUMNS]
+        # Last whole copy, then the deltas from there to snapshot i
+        first = i
+        while self._states[first][5][0] is not None:
+            first -= 1
+        count = self._states[first][4]
+        for column, saved in zip(columns, self._states[first][5][1]):
+            column[:count] = saved
+        for pid in range(count, len(engine)):
+            for column, value in zip(columns, self._added[pid]):
+                column[pid] = value
+        for j in range(first + 1, i + 1):
+            pids, rows = self._states[j][5]
+            for column, values in zip(columns, rows):
+                for pid, value in zip(pids, values):
+                    column[pid] = value
+
+    def seek(self, t):
+        """
+        Puts the engine in its state at time t: restores the last snapshot at
+        or before t unless the engine can get there by moving forward without
+        passing one, then advances to t. Replayed slices are not recorded
+        (nor sent to on_slice) a second time.
+        """
+        engine = self.engine
+        if t < engine.time or self.before(t) > engine.time:
+            self.restore(t)
+        engine.advance(t)
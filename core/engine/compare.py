@@ -0,0 +1,108 @@
+import os
+import time
+from array import array
+
+from core.engine.engine import Engine
+from core.engine.policies import (FCFSPolicy, SJFPolicy, SRTFPolicy, PriorityPolicy, RRPolicy,
+                                  MLFQPolicy, mlfq_quanta)
+from core.engine.pool import Cancelled, workload, workload_pool
+from utils.metrics import engine_metrics
+
+# Runs one workload under several policies side by side.
+# Every worker gets the workload once (see core.engine.pool) and only resets
+# the per-run columns between policies, so the wall time of a comparison is
+# close to that of its slowest policy. Slices come back as three compact
+# columns (pid, start, duration) instead of one dict per slice.
+
+
+def _run(task):
+    label, policy = task
+    start = time.perf_counter()
+    table, arrivals = workload()
+    pids, starts, durations = array('q'), array('q'), array('q')
+
+    def on_slice(pid, cpu, begin, duration, migration):
+        pids.append(pid)
+        starts.append(begin)
+        durations.append(duration)
+
+    engine = Engine(policy, table, arrivals=arrivals, record_timeline=False, on_slice=on_slice)
+    engine.advance()
+    return {
+        'policy': label,
+        'metrics': engine_metrics(engine),
+        'pid': pids,
+        'start': starts,
+        'duration': durations,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def all_policies(quantum=2, quanta=None, boost=50, priorities=True):
+    """
+    (label, policy) for every policy, labelled as in the GUI's scheduler list.
+    priorities=False leaves out the priority policies (processes without
+    priorities would all tie at 0 and run in FCFS / SJF-like order)
+    """
+    policies = [
+        ("FCFS", FCFSPolicy()),
+        ("SJF", SJFPolicy()),
+        ("SRTF", SRTFPolicy()),
+        ("Priority (preemptive)", PriorityPolicy(preemptive=True)),
+        ("Priority (non-preemptive)", PriorityPolicy(preemptive=False)),
+        ("Round Robin", RRPolicy(quantum)),
+        ("MLFQ", MLFQPolicy(quanta or mlfq_quanta(3, quantum), boost)),
+    ]
+    if not priorities:
+        policies = [(label, policy) for label, policy in policies if policy.rank != 'priority']
+    return policies
+
+
+class PolicyComparison:
+    """
+    Runs the same processes under every (label, policy) pair of `policies`
+    on a process pool (jobs=1 runs in this process). Use as a context
+    manager so the pool is shut down. close() from another thread cancels
+    run() (in this process, at the next policy): it raises
+    core.engine.pool.Cancelled.
+    """
+
+    def __init__(self, processes, policies, jobs=None):
+        self.policies = list(policies)
+        self.jobs = min(jobs or os.cpu_count() or 1, len(self.policies))
+        self._closed = False
+        self._pool = workload_pool(processes, self.jobs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._closed = True
+        if self._pool is not None:
+            self._pool.close()
+
+    def run(self):
+        """
+        Returns one dict per policy, in input order:
+        {'policy': label, 'metrics': utils.metrics.engine_metrics result,
+         'pid', 'start', 'duration': the slices as parallel arrays (pid indexes processes),
+         'seconds': time the run took}
+        """
+        if self._pool is not None:
+            # One policy per task: runs differ too much in length for bigger chunks
+            return self._pool.map(_run, self.policies, chunksize=1)
+        results = []
+        for task in self.policies:
+            if self._closed:
+                raise Cancelled()
+            results.append(_run(task))
+        return results
+
+
+def compare_policies(processes, policies, jobs=None):
+    """PolicyComparison(processes, policies, jobs).run(), pool shut down afterwards"""
+    with PolicyComparison(processes, policies, jobs) as comparison:
+        return comparison.run()
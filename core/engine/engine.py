@@ -0,0 +1,297 @@
+from core.engine.arrivals import Arrivals, check_arrival
+from core.engine.checkpoint import Checkpoints
+from core.process_table import ProcessTable
+
+INF = float('inf')
+
+
+class Engine:
+    """
+    Qt-free, event-driven scheduling engine.
+
+    The clock jumps from one event to the next (arrival, completion, quantum
+    expiry, preemption) instead of ticking, so the cost of a run depends on
+    the number of processes and not on the length of the timeline.
+    Processes live in a core.process_table.ProcessTable and are referred to
+    by integer id (pid) everywhere in the loop. Every policy is driven the
+    same way, through its ready queue's protocol (on_arrival, pick_next,
+    should_preempt, on_tick_budget; see core/engine/ready_queue.py).
+    """
+    cpus = 1
+
+    # State saved by core.engine.checkpoint.Checkpoints
+    CHECKPOINT_VALUES = ('time', 'running', '_slice_start', '_run_from', '_budget_end', '_last_pid',
+                         'context_switches', 'events', '_charged_from', '_next_boost', '_processed_at')
+    CHECKPOINT_SEQUENCES = ()
+    CHECKPOINT_COLUMNS = ('remaining', 'first_run', 'completion')
+
+    def __init__(self, policy, processes=(), arrivals=None, record_timeline=True, on_slice=None,
+                 checkpoint_every=None):
+        """
+        arrivals optionally gives the pids already sorted by arrival
+        (core.engine.arrivals.arrival_order), e.g. when one table is
+        scheduled many times; it is shared, not consumed.
+        record_timeline=False skips building the slice list when only the
+        metrics are wanted. on_slice(pid, cpu, start, duration, migration) is
+        called for every slice as it ends (see utils.schedule_file).
+        checkpoint_every=K snapshots the state every K events so that seek()
+        costs at most K events.
+        """
+        self.policy = policy
+        self.record_timeline = record_timeline
+        self.on_slice = on_slice
+        self.time = 0
+
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable(processes)
+        self.table = processes
+        # Shortcuts to the table columns (same array objects)
+        self.names = processes.names
+        self.arrival = processes.arrival
+        self.burst = processes.burst
+        self.priority = processes.priority
+        self.remaining = processes.remaining
+        self.first_run = processes.first_run
+        self.completion = processes.completion
+
+        self.timeline = []
+        self.context_switches = 0
+        self.events = 0         # event times processed, for instrumentation
+        self._processed_at = -1     # last time whose events were processed (see earliest_arrival)
+        self._recorded_until = -1   # slices ending up to here are recorded (not again after a seek)
+        self._last_pid = None
+
+        # Processes not admitted yet (see core.engine.arrivals)
+        self._arrivals = Arrivals(self.arrival, arrivals)
+        self._ready = policy.ready_queue(self)
+        self.running = None     # pid on the CPU
+        self._slice_start = 0   # when the running process was dispatched
+        self._run_from = 0      # last time remaining[running] was brought up to date
+        self._budget_end = INF  # when the running process's budget runs out (quantum, allotment)
+
+        # The ready queue is charged the CPU time the running process used
+        # since _charged_from (see on_tick_budget in core/engine/ready_queue.py)
+        self._charged_from = 0
+        self._next_boost = policy.boost or INF
+
+        self.checkpoints = Checkpoints(self, checkpoint_every) if checkpoint_every else None
+
+    def __contains__(self, name):
+        return name in self.table
+
+    def __len__(self):
+        return len(self.table)
+
+    def add(self, process):
+        """
+        Adds a process dict (name, arrival, burst, optional priority) and returns its pid.
+        Processes may be added while the engine is running, arriving no earlier
+        than earliest_arrival(): ValueError otherwise.
+        """
+        check_arrival(self, process)
+        pid = self.table.add(process)
+        entry = self._arrivals.push(self.arrival[pid], pid)
+        if self.checkpoints is not None:
+            self.checkpoints.added(pid, entry)
+        self._added_arrivals()
+        return pid
+
+    def earliest_arrival(self):
+        """
+        Earliest arrival add() accepts: the current time, or the next time unit
+        once the events at the current time have been processed (what ran,
+        what was preempted and dispatched then is decided).
+        """
+        return self.time + 1 if self._processed_at == self.time else self.time
+
+    def pid(self, name):
+        return self.table.pid(name)
+
+    def remaining_of(self, pid):
+        if pid == self.running:
+            return self.remaining[pid] - (self.time - self._run_from)
+        return self.remaining[pid]
+
+    def queue_length(self):
+        return len(self._ready)
+
+    def running_slices(self):
+        """(cpu, pid, slice start) of the process on the CPU, if any"""
+        return [] if self.running is None else [(0, self.running, self._slice_start)]
+
+    def running_name(self):
+        return None if self.running is None else self.names[self.running]
+
+    def done(self):
+        return self.running is None and not self._ready and not self._arrivals
+
+    def next_event_time(self):
+        t = self._arrivals.next_time()
+        if self.running is not None:
+            t = min(t, self._run_from + self.remaining[self.running], self._budget_end, self._next_boost)
+        return t
+
+    def advance(self, until=INF):
+        """
+        Processes every event up to and including time `until` and leaves the
+        clock at `until` (or at the last event when running to completion).
+        """
+        while True:
+            self._process_events()
+            self.events += 1
+            self._recorded_until = max(self._recorded_until, self.time)
+            if self.checkpoints is not None:
+                self.checkpoints.step()
+            t = self.next_event_time()
+            if t > until or t == INF:
+                break
+            self._settle(t)
+
+        if until != INF and until > self.time:
+            self._settle(until)
+
+    def run(self):
+        self.advance()
+        return self.result()
+
+    def seek(self, t):
+        """Puts the engine in its state at time t, earlier or later than now (see Checkpoints.seek)"""
+        if self.checkpoints is None:
+            raise ValueError("Seeking needs an engine created with checkpoint_every")
+        self.checkpoints.seek(t)
+
+    def result(self):
+        """
+        Returns a dict with the coalesced timeline (list of slices with
+        name, arrival, burst, start, duration), the completion time per name and
+        the average waiting / turnaround times of the finished processes.
+        """
+        waiting = turnaround = count = 0
+        completion = {}
+        for pid, finished in enumerate(self.completion):
+            if finished < 0:
+                continue
+            completion[self.names[pid]] = finished
+            tat = finished - self.arrival[pid]
+            turnaround += tat
+            waiting += tat - self.burst[pid]
+            count += 1
+
+        return {
+            'timeline': self.timeline,
+            'completion': completion,
+            'avg_waiting': waiting / count if count else 0,
+            'avg_turnaround': turnaround / count if count else 0,
+        }
+
+    # ---- internals -------------------------------------------------------
+
+    def _settle(self, t):
+        # Move the clock to t, charging the elapsed time to the running process
+        if self.running is not None:
+            self.remaining[self.running] -= t - self._run_from
+            self._run_from = t
+        self.time = t
+
+    def _end_slice(self):
+        pid = self.running
+        if self.time > self._slice_start and self.time > self._recorded_until:
+            if self.record_timeline:
+                self.timeline.append({
+                    'name': self.names[pid],
+                    'arrival': self.arrival[pid],
+                    'burst': self.burst[pid],
+                    'start': self._slice_start,
+                    'duration': self.time - self._slice_start
+                })
+            if self.on_slice is not None:
+                self.on_slice(pid, 0, self._slice_start, self.time - self._slice_start, 0)
+        self.running = None
+
+    def _ready_queues(self):
+        return [self._ready]
+
+    def _running_pids(self):
+        return () if self.running is None else (self.running,)
+
+    def _added_arrivals(self):
+        # Arrivals were queued by add() (or again by a restore to before it): a
+        # budget stretched over an empty queue may now have to stop at one
+        if self.running is not None:
+            self._budget_end = min(self._budget_end, self._tick_budget())
+
+    def _finish(self, pid):
+        self.completion[pid] = self.time
+        self._ready.discard(pid)
+
+    def _charge(self):
+        # Charges the running process up to now when it leaves the CPU (no budget needed)
+        self._ready.on_tick_budget(self.running, self.time - self._charged_from, INF)
+        self._charged_from = self.time
+
+    def _tick_budget(self):
+        # Charges the running process up to now and returns when its budget runs out
+        t = self.time
+        if self._ready:
+            quiet = 0
+        else:
+            quiet = self._arrivals.next_time() - t
+        left = self._ready.on_tick_budget(self.running, t - self._charged_from, quiet)
+        self._charged_from = t
+        return t + left
+
+    def _boost(self):
+        # Every process back to the top level; boosts fall on multiples of policy.boost
+        t = self.time
+        self._ready.boost(self.running)
+        if self.running is not None:
+            self._charged_from = t
+            self._budget_end = self._tick_budget()
+        self._next_boost = (t // self.policy.boost + 1) * self.policy.boost
+
+    def _process_events(self):
+        t = self.time
+        ready = self._ready
+        self._processed_at = t
+
+        if self.running is not None and self.remaining[self.running] <= 0:
+            self._finish(self.running)
+            self._end_slice()
+
+        if t >= self._next_boost:
+            self._boost()
+
+        for pid in self._arrivals.due(t):
+            if self.burst[pid] <= 0:
+                self._finish(pid)
+            else:
+                ready.on_arrival(pid)
+
+        if self.running is not None:
+            spent = t >= self._budget_end
+            if ready and ready.should_preempt(self.running, spent):
+                pid = self.running
+                self._charge()   # before it queues again (MLFQ may demote it)
+                self._end_slice()
+                ready.on_arrival(pid)
+            elif spent:
+                # Budget used up with nobody to take over: charge it and start the next one
+                self._budget_end = self._tick_budget()
+
+        if self.running is None and ready:
+            self.running = ready.pick_next()
+            if self.first_run[self.running] < 0:
+                self.first_run[self.running] = t
+            if self.running != self._last_pid:
+                if self._last_pid is not None:
+                    self.context_switches += 1
+                self._last_pid = self.running
+            self._slice_start = self._run_from = self._charged_from = t
+            self._budget_end = self._tick_budget()
+
+
+def simulate(processes, policy):
+    """
+    Runs a whole workload under a policy and returns Engine.result()
+    """
+    return Engine(policy, processes).run()
@@ -0,0 +1,155 @@
+from core.schedulers.fcfs import FCFSScheduler
+from core.schedulers.sjf import SJFScheduler
+from core.schedulers.srtf import SRTFScheduler
+from core.schedulers.priority_preem import priority_preem
+from core.schedulers.priority_nonpreem import PriorityNonPreemptiveScheduler
+from core.schedulers.round_robin import RRScheduler
+from core.schedulers.mlfq import MLFQScheduler
+from core.engine.ready_queue import FIFOQueue, KeyedQueue, MLFQQueue, RRQueue
+
+
+# A policy hands the engine its ready queue, and the queue's protocol
+# (on_arrival, pick_next, should_preempt, on_tick_budget; see
+# core/engine/ready_queue.py) is all the engine knows of the policy.
+# Policies without a quantum order their queue by rank alone: the process
+# column a smaller value of which runs first ('burst', 'remaining' or
+# 'priority'), ties going to the earlier arrival, then the lower pid; None
+# is arrival order (FIFO). key(engine, pid) is that order as a tuple whose
+# first field decides preemption (None for FIFO), and the schedulers' heap
+# fast path (core/schedulers/base.py) follows the same rank.
+# A feedback policy's queue tracks a level per process and is charged the
+# CPU time each process uses (see MLFQQueue).
+
+RANK_KEYS = {
+    'burst': lambda engine, pid: (engine.burst[pid], engine.arrival[pid], pid),
+    'remaining': lambda engine, pid: (engine.remaining_of(pid), engine.arrival[pid], pid),
+    'priority': lambda engine, pid: (engine.priority[pid], engine.arrival[pid], pid),
+}
+
+
+class Policy:
+    is_preemptive = False
+    quantum = None
+    rank = None
+    feedback = False
+    boost = None
+
+    @property
+    def key(self):
+        return RANK_KEYS.get(self.rank)
+
+    def ready_queue(self, engine):
+        """New persistent ready queue for one engine run (see core/engine/ready_queue.py)"""
+        if self.rank is None:
+            return FIFOQueue()
+        return KeyedQueue(engine, self.key, self.is_preemptive)
+
+
+class FCFSPolicy(Policy):
+    pass
+
+
+class SJFPolicy(Policy):
+    rank = 'burst'
+
+
+class SRTFPolicy(Policy):
+    is_preemptive = True
+    rank = 'remaining'
+
+
+class PriorityPolicy(Policy):
+    rank = 'priority'
+
+    def __init__(self, preemptive=False):
+        self.is_preemptive = preemptive
+
+
+class RRPolicy(Policy):
+    is_preemptive = True
+
+    def __init__(self, quantum=2):
+        if quantum < 1:
+            raise ValueError("Quantum must be at least 1")
+        self.quantum = quantum
+
+    def ready_queue(self, engine):
+        return RRQueue(self.quantum)
+
+
+class MLFQPolicy(Policy):
+    """
+    Multilevel feedback queue: quanta[i] is the time a process may use on
+    level i before moving down a level (the last level is round robin).
+    A waiting process on a higher level preempts a lower one. Every `boost`
+    time units all processes go back to level 0 (None: never).
+    """
+    is_preemptive = True
+    feedback = True
+
+    def __init__(self, quanta=(2, 4, 8), boost=50):
+        quanta = tuple(quanta)
+        if not quanta:
+            raise ValueError("MLFQ needs at least one level")
+        if min(quanta) < 1:
+            raise ValueError("Quantum must be at least 1")
+        if boost is not None and boost < 1:
+            raise ValueError("Boost period must be at least 1")
+        self.quanta = quanta
+        self.quantum = quanta[0]
+        self.boost = boost
+
+    @property
+    def levels(self):
+        return len(self.quanta)
+
+    def ready_queue(self, engine):
+        return MLFQQueue(self.quanta)
+
+
+def mlfq_quanta(levels=3, quantum=2):
+    """Quanta doubling from one level to the next, the usual MLFQ setup"""
+    return tuple(quantum << level for level in range(levels))
+
+
+def policy_for(scheduler, quantum=None):
+    """
+    Returns the engine policy matching one of the scheduler classes in core/schedulers
+    (a policy is returned as is)
+    """
+    if isinstance(scheduler, Policy):
+        return scheduler
+    if isinstance(scheduler, MLFQScheduler):
+        return MLFQPolicy(scheduler.quanta, scheduler.boost)
+    if isinstance(scheduler, RRScheduler):
+        return RRPolicy(quantum or scheduler.quantum)
+    if isinstance(scheduler, SRTFScheduler):
+        return SRTFPolicy()
+    if isinstance(scheduler, SJFScheduler):
+        return SJFPolicy()
+    if isinstance(scheduler, priority_preem):
+        return PriorityPolicy(preemptive=True)
+    if isinstance(scheduler, PriorityNonPreemptiveScheduler):
+        return PriorityPolicy(preemptive=False)
+    if isinstance(scheduler, FCFSScheduler):
+        return FCFSPolicy()
+    raise ValueError(f"Unsupported scheduler: {type(scheduler).__name__}")
+
+
+# Scheduler class name -> policy factory, for callers that pick a policy by
+# name (command line, config files) without building the scheduler object
+POLICIES = {
+    'FCFSScheduler': lambda quantum: FCFSPolicy(),
+    'SJFScheduler': lambda quantum: SJFPolicy(),
+    'SRTFScheduler': lambda quantum: SRTFPolicy(),
+    'priority_preem': lambda quantum: PriorityPolicy(preemptive=True),
+    'PriorityNonPreemptiveScheduler': lambda quantum: PriorityPolicy(preemptive=False),
+    'RRScheduler': lambda quantum: RRPolicy(quantum or 2),
+    'MLFQScheduler': lambda quantum: MLFQPolicy(mlfq_quanta(3, quantum or 2)),
+}
+
+
+def policy_by_name(name, quantum=None):
+    if name not in POLICIES:
+        raise ValueError(f"Unsupported scheduler: {name}")
+    return POLICIES[name](quantum)
@@ -0,0 +1,74 @@
+import multiprocessing
+
+from core.engine.arrivals import arrival_order
+from core.process_table import ProcessTable
+
+# Process pools for the parallel runs of core.engine.sweep and
+# core.engine.compare. Workers are started with 'spawn' rather than the Unix
+# default 'fork': the GUI starts pools from a QThread, and a forked child
+# inherits every lock the parent's other threads held (Qt's included) in
+# whatever state they were. close() may be called from any thread to cancel
+# a map in progress.
+#
+# Every worker gets the workload once (pool initializer, prepare()): the
+# process table and its arrival order are built a single time per
+# worker and reused by every run, which only resets the per-run columns.
+
+_table = None
+_arrivals = None
+
+
+def prepare(processes):
+    """Builds this process's workload (pool initializer)"""
+    global _table, _arrivals
+    _table = ProcessTable(processes)
+    _arrivals = arrival_order(_table.arrival)
+
+
+def workload():
+    """(table, arrivals) set by prepare(), the table's per-run columns reset for a new run"""
+    _table.reset()
+    return _table, _arrivals
+
+
+def workload_pool(processes, jobs):
+    """
+    WorkerPool of `jobs` workers holding the processes (a list of dicts or a
+    ProcessTable), or None for jobs=1, the workload then being prepared in
+    this process
+    """
+    processes = processes.as_dicts() if isinstance(processes, ProcessTable) else list(processes)
+    if jobs > 1:
+        return WorkerPool(jobs, prepare, (processes,))
+    prepare(processes)
+    return None
+
+
+class Cancelled(Exception):
+    """The pool was closed before the results came back"""
+
+
+class WorkerPool:
+    POLL_SECONDS = 0.05   # how soon a map in progress notices close()
+
+    def __init__(self, jobs, initializer, initargs=()):
+        self._pool = multiprocessing.get_context('spawn').Pool(jobs, initializer=initializer, initargs=initargs)
+
+    def map(self, function, items, chunksize=None):
+        """Pool.map, raising Cancelled once close() is called"""
+        pool = self._pool
+        if pool is None:
+            raise Cancelled()
+        result = pool.map_async(function, items, chunksize)
+        # A terminated pool never completes its pending results: poll instead of blocking
+        while not result.ready():
+            if self._pool is None:
+                raise Cancelled()
+            result.wait(self.POLL_SECONDS)
+        return result.get()
+
+    def close(self):
+        """Terminates the workers (a no-op once closed)"""
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.terminate()
@@ -0,0 +1,290 @@
+import heapq
+from collections import deque
+
+INF = float('inf')
+
+
+# Persistent ready queues. An engine keeps one for the whole run and feeds it
+# one process at a time as they arrive or get preempted, so every operation
+# is O(1) (FIFO, MLFQ) or O(log n) (keyed) instead of a re-plan over all
+# processes.
+#
+# Every queue implements the same protocol, which is all the engine knows of
+# a policy:
+#   on_arrival(pid)              pid becomes ready (arrival, or back from the CPU)
+#   pick_next()                  removes and returns the pid to dispatch
+#   should_preempt(pid, spent)   whether a waiting process takes the CPU from the
+#                                running pid now; spent: its budget ran out (the
+#                                time is charged after this call)
+#   on_tick_budget(pid, ran, quiet)
+#                                charges `ran` time units of CPU to the running
+#                                pid and returns how long it may run before the
+#                                next should_preempt(pid, spent=True) (INF: never).
+#                                quiet is how long nobody else can be waiting
+#                                (0 if the queue is not empty), so a budget may
+#                                skip boundaries nobody would take the CPU at.
+#   discard(pid)                 pid finished
+#   rank(pid)                    where a running pid stands against the others
+#                                should_preempt(pid) holds for: the largest
+#                                rank is preempted first (several CPUs)
+# plus snapshot() / restore(state) for core.engine.checkpoint.
+
+
+class FIFOQueue:
+    """Ready queue in arrival order (FCFS): never preempts, no budget"""
+    __slots__ = ('_items',)
+
+    def __init__(self):
+        self._items = deque()
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def on_arrival(self, pid):
+        self._items.append(pid)
+
+    def pick_next(self):
+        return self._items.popleft()
+
+    def peek(self):
+        return self._items[0]
+
+    def should_preempt(self, running_pid, spent=False):
+        # Order never depends on a key, so a waiting process never outranks the running one
+        return False
+
+    def on_tick_budget(self, pid, ran, quiet=0):
+        return INF
+
+    def discard(self, pid):
+        pass
+
+    def rank(self, pid):
+        return 0
+
+    def snapshot(self):
+        return tuple(self._items)
+
+    def restore(self, state):
+        self._items = deque(state)
+
+
+class RRQueue(FIFOQueue):
+    """
+    Round robin: FIFO order, and a process that has used a quantum since its
+    dispatch goes to the back of the queue if anyone is waiting. Processes
+    join the queue when they arrive, so one arriving during a quantum or at
+    its end goes ahead of the process that quantum preempts (the original
+    RRScheduler queued the preempted process first).
+    Quantum boundaries at which nobody can be waiting are skipped, so a lone
+    process runs in one slice.
+    Budgets are kept per running process, so one queue can serve several
+    CPUs (core.engine.smp).
+    """
+    __slots__ = ('quantum', '_used')
+
+    def __init__(self, quantum):
+        super().__init__()
+        self.quantum = quantum
+        self._used = {}   # pid -> time it has run since dispatch, for processes off the queue
+
+    def on_arrival(self, pid):
+        # Back in the queue: its next dispatch starts a new quantum
+        self._used.pop(pid, None)
+        self._items.append(pid)
+
+    def should_preempt(self, running_pid, spent=False):
+        return spent and bool(self._items)
+
+    def on_tick_budget(self, pid, ran, quiet=0):
+        used = self._used.get(pid, 0) + ran
+        self._used[pid] = used
+        if quiet == INF:
+            return INF
+        q = self.quantum
+        if quiet:
+            # First boundary after now at which another process can be waiting
+            k = max(used // q + 1, -(-(used + quiet) // q))
+        else:
+            # Someone may be waiting now (e.g. added at this instant): a boundary
+            # reached just now counts, and preempts at once
+            k = max(1, -(-used // q))
+        return k * q - used
+
+    def discard(self, pid):
+        self._used.pop(pid, None)
+
+    def snapshot(self):
+        return tuple(self._items), dict(self._used)
+
+    def restore(self, state):
+        items, used = state
+        self._items = deque(items)
+        self._used = dict(used)
+
+
+class KeyedQueue:
+    """
+    Min-heap on key(engine, pid), computed once on insert.
+    should_preempt compares only the first key field (strictly smaller wins),
+    the rest of the key just breaks ties in the queue.
+    """
+    __slots__ = ('_heap', '_engine', '_key', '_preemptive')
+
+    def __init__(self, engine, key, preemptive):
+        self._heap = []
+        self._engine = engine
+        self._key = key
+        self._preemptive = preemptive
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        # pids in queue order
+        return (pid for _, pid in sorted(self._heap))
+
+    def on_arrival(self, pid):
+        heapq.heappush(self._heap, (self._key(self._engine, pid), pid))
+
+    def pick_next(self):
+        return heapq.heappop(self._heap)[1]
+
+    def peek(self):
+        return self._heap[0][1]
+
+    def should_preempt(self, running_pid, spent=False):
+        return (self._preemptive and bool(self._heap) and
+                self._heap[0][0][0] < self._key(self._engine, running_pid)[0])
+
+    def on_tick_budget(self, pid, ran, quiet=0):
+        # Only arrivals can change the order, and they are events anyway
+        return INF
+
+    def discard(self, pid):
+        pass
+
+    def rank(self, pid):
+        return self._key(self._engine, pid)[0]
+
+    def snapshot(self):
+        # Keys were computed on insert, so the heap is the whole state
+        return tuple(self._heap)
+
+    def restore(self, state):
+        self._heap = list(state)
+
+
+class MLFQQueue:
+    """
+    Multilevel feedback queue: one deque per level plus a bitmap of the
+    non-empty levels, so on_arrival and pick_next are O(1) whatever the
+    number of processes (the highest non-empty level is the lowest set bit).
+
+    A process starts at level 0 and moves one level down each time it has
+    used up the quantum of its level, counting every slice it ran there
+    (on_tick_budget). boost() puts every process back at level 0.
+    """
+    __slots__ = ('_levels', '_bits', '_count', '_quanta', '_level', '_used')
+
+    def __init__(self, quanta):
+        self._quanta = quanta
+        self._levels = [deque() for _ in quanta]
+        self._bits = 0
+        self._count = 0
+        self._level = {}   # pid -> level, for processes that have arrived
+        self._used = {}    # pid -> time used at its current level
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self):
+        # pids in dispatch order
+        for level in self._levels:
+            yield from level
+
+    def level_of(self, pid):
+        return self._level.get(pid, 0)
+
+    rank = level_of
+
+    def on_arrival(self, pid):
+        level = self._level.setdefault(pid, 0)
+        self._used.setdefault(pid, 0)
+        self._levels[level].append(pid)
+        self._bits |= 1 << level
+        self._count += 1
+
+    def pick_next(self):
+        bits = self._bits
+        level = (bits & -bits).bit_length() - 1
+        queue = self._levels[level]
+        pid = queue.popleft()
+        if not queue:
+            self._bits = bits & ~(1 << level)
+        self._count -= 1
+        return pid
+
+    def peek(self):
+        bits = self._bits
+        return self._levels[(bits & -bits).bit_length() - 1][0]
+
+    def should_preempt(self, running_pid, spent=False):
+        # A waiting process on a higher level takes the CPU at once. Once the
+        # running one has used its allotment it moves down a level, and one
+        # waiting on that level goes next too
+        bits = self._bits
+        if not bits:
+            return False
+        top = (bits & -bits).bit_length() - 1
+        level = self._level[running_pid]
+        if spent:
+            return top <= min(level + 1, len(self._quanta) - 1)
+        return top < level
+
+    def on_tick_budget(self, pid, ran, quiet=0):
+        # Charges the time run at the current level, demoting pid for every
+        # quantum used up, and returns what is left of its allotment
+        used = self._used[pid] + ran
+        level = self._level[pid]
+        quantum = self._quanta[level]
+        while used >= quantum:
+            used -= quantum
+            if level + 1 < len(self._quanta):
+                level += 1
+                quantum = self._quanta[level]
+            else:
+                used %= quantum   # last level: plain round robin
+        self._level[pid] = level
+        self._used[pid] = used
+        return quantum - used
+
+    def boost(self, running_pid=None):
+        top = self._levels[0]
+        for queue in self._levels[1:]:
+            top.extend(queue)
+            queue.clear()
+        self._bits = 1 if top else 0
+        for pid in top:
+            self._level[pid] = 0
+            self._used[pid] = 0
+        if running_pid is not None:
+            self._level[running_pid] = 0
+            self._used[running_pid] = 0
+
+    def discard(self, pid):
+        # Finished process: drop its level
+        self._level.pop(pid, None)
+        self._used.pop(pid, None)
+
+    def snapshot(self):
+        return tuple(tuple(level) for level in self._levels), self._bits, self._count, dict(self._level), dict(self._used)
+
+    def restore(self, state):
+        levels, self._bits, self._count, level, used = state
+        self._levels = [deque(pids) for pids in levels]
+        self._level = dict(level)
+        self._used = dict(used)
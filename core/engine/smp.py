@@ -0,0 +1,384 @@
+import heapq
+from array import array
+from core.engine.arrivals import Arrivals, check_arrival
+from core.engine.checkpoint import Checkpoints
+from core.process_table import ProcessTable
+
+INF = float('inf')
+
+
+class SMPEngine:
+    """
+    Event-driven scheduling engine for `cpus` identical CPUs.
+
+    Takes the same policy objects as core.engine.Engine. With one shared
+    ready queue every idle CPU takes the next process in policy order; with
+    per_core_queues=True each CPU has its own queue, arrivals go to the least
+    loaded CPU and an idle CPU with an empty queue steals from the longest one.
+    A process dispatched on a different CPU than the one it last ran on first
+    spends migration_cost time units on it without making progress.
+
+    Per-CPU completions and budget ends sit in one heap (stale entries are
+    skipped by version), so each event costs O(log cpus + log n) and only
+    preemption checks look at all CPUs. As in Engine, the ready queues'
+    protocol makes every decision: each CPU is charged its progress and told
+    its budget by on_tick_budget (migration time is not charged), a spent
+    budget or an arrival asks should_preempt, and with a shared queue the
+    running process of largest rank() is the one preempted.
+    """
+
+    # State saved by core.engine.checkpoint.Checkpoints
+    CHECKPOINT_VALUES = ('time', 'context_switches', 'migrations', 'events', '_queued', '_processed_at')
+    CHECKPOINT_SEQUENCES = ('cpu_busy', '_load', 'running', '_slice_start', '_run_from', '_charged_from',
+                            '_budget_end', '_last_pid', '_idle', '_events', '_version')
+    CHECKPOINT_COLUMNS = ('remaining', 'first_run', 'completion', 'last_cpu', '_on_cpu')
+
+    def __init__(self, policy, processes=(), cpus=2, migration_cost=0, per_core_queues=False,
+                 record_timeline=True, on_slice=None, checkpoint_every=None):
+        if cpus < 1:
+            raise ValueError("At least one CPU is needed")
+        if migration_cost < 0:
+            raise ValueError("Migration cost cannot be negative")
+        if policy.feedback:
+            raise ValueError("MLFQ is only simulated on one CPU")
+        self.policy = policy
+        self.cpus = cpus
+        self.migration_cost = migration_cost
+        self.per_core_queues = per_core_queues
+        self.record_timeline = record_timeline
+        self.on_slice = on_slice   # same hook as Engine
+        self.time = 0
+
+        if not isinstance(processes, ProcessTable):
+            processes = ProcessTable(processes)
+        self.table = processes
+        # Shortcuts to the table columns (same array objects)
+        self.names = processes.names
+        self.arrival = processes.arrival
+        self.burst = processes.burst
+        self.priority = processes.priority
+        self.remaining = processes.remaining
+        self.first_run = processes.first_run
+        self.completion = processes.completion
+        self.last_cpu = array('q', [-1]) * len(processes)   # CPU each process last ran on
+        self._on_cpu = array('q', [-1]) * len(processes)    # CPU running it now
+
+        self.timeline = []
+        self.context_switches = 0
+        self.migrations = 0
+        self.events = 0
+        self._recorded_until = -1   # as in Engine
+        self._processed_at = -1     # as in Engine
+        self.cpu_busy = [0] * cpus   # time each CPU spent making progress
+
+        # Processes not admitted yet (see core.engine.arrivals)
+        self._arrivals = Arrivals(self.arrival)
+        self._queues = [policy.ready_queue(self) for _ in range(cpus if per_core_queues else 1)]
+        self._queued = 0
+        self._load = [0] * len(self._queues)   # queued + running, per queue
+
+        self.running = [None] * cpus
+        self._slice_start = [0] * cpus
+        self._run_from = [0] * cpus      # progress starts here (later than dispatch while migrating)
+        self._charged_from = [0] * cpus  # the CPU's queue was charged its progress up to here
+        self._budget_end = [INF] * cpus
+        self._last_pid = [None] * cpus
+        self._idle = list(range(cpus))   # heap of idle CPUs, lowest id dispatched first
+        self._events = []                # heap of (time, cpu, version)
+        self._version = [0] * cpus
+
+        # Same as Engine: snapshots every checkpoint_every events, for seek()
+        self.checkpoints = Checkpoints(self, checkpoint_every) if checkpoint_every else None
+
+    def __contains__(self, name):
+        return name in self.table
+
+    def __len__(self):
+        return len(self.table)
+
+    def add(self, process):
+        """
+        Adds a process dict (name, arrival, burst, optional priority) and returns its pid,
+        arriving no earlier than earliest_arrival() (as Engine.add)
+        """
+        check_arrival(self, process)
+        pid = self.table.add(process)
+        self.last_cpu.append(-1)
+        self._on_cpu.append(-1)
+        entry = self._arrivals.push(self.arrival[pid], pid)
+        if self.checkpoints is not None:
+            self.checkpoints.added(pid, entry)
+        self._added_arrivals()
+        return pid
+
+    def earliest_arrival(self):
+        """Same as Engine.earliest_arrival"""
+        return self.time + 1 if self._processed_at == self.time else self.time
+
+    def pid(self, name):
+        return self.table.pid(name)
+
+    def remaining_of(self, pid):
+        cpu = self._on_cpu[pid]
+        if cpu < 0:
+            return self.remaining[pid]
+        return self.remaining[pid] - max(0, self.time - self._run_from[cpu])
+
+    def queue_length(self):
+        return self._queued
+
+    def running_slices(self):
+        """(cpu, pid, slice start) for every busy CPU"""
+        return [(cpu, pid, self._slice_start[cpu]) for cpu, pid in enumerate(self.running) if pid is not None]
+
+    def done(self):
+        return not self._arrivals and not self._queued and all(pid is None for pid in self.running)
+
+    def next_event_time(self):
+        t = self._arrivals.next_time()
+        events = self._events
+        while events and events[0][2] != self._version[events[0][1]]:
+            heapq.heappop(events)
+        if events:
+            t = min(t, events[0][0])
+        return t
+
+    def advance(self, until=INF):
+        """
+        Processes every event up to and including time `until` and leaves the
+        clock at `until` (or at the last event when running to completion).
+        """
+        while True:
+            t = self.next_event_time()
+            if t > until or t == INF:
+                break
+            self.time = t
+            self._process_events()
+            self.events += 1
+            self._recorded_until = max(self._recorded_until, t)
+            if self.checkpoints is not None:
+                self.checkpoints.step()
+
+        if until != INF and until > self.time:
+            self.time = until
+
+    def run(self):
+        self.advance()
+        return self.result()
+
+    def seek(self, t):
+        """Puts the engine in its state at time t, earlier or later than now (see Checkpoints.seek)"""
+        if self.checkpoints is None:
+            raise ValueError("Seeking needs an engine created with checkpoint_every")
+        self.checkpoints.seek(t)
+
+    def result(self):
+        """
+        Same as Engine.result(); timeline slices also carry 'cpu' and
+        'migration' (time spent migrating before making progress) and are
+        sorted by start time, then CPU.
+        """
+        waiting = turnaround = count = 0
+        completion = {}
+        for pid, finished in enumerate(self.completion):
+            if finished < 0:
+                continue
+            completion[self.names[pid]] = finished
+            tat = finished - self.arrival[pid]
+            turnaround += tat
+            waiting += tat - self.burst[pid]
+            count += 1
+
+        return {
+            'timeline': sorted(self.timeline, key=lambda s: (s['start'], s['cpu'])),
+            'completion': completion,
+            'avg_waiting': waiting / count if count else 0,
+            'avg_turnaround': turnaround / count if count else 0,
+        }
+
+    # ---- internals -------------------------------------------------------
+
+    def _ready_queues(self):
+        return self._queues
+
+    def _running_pids(self):
+        return [pid for pid in self.running if pid is not None]
+
+    def _added_arrivals(self):
+        # As in Engine: a budget stretched over empty queues may now have to stop at an arrival
+        for cpu, pid in enumerate(self.running):
+            if pid is not None:
+                budget = self._tick_budget(cpu)
+                if budget < self._budget_end[cpu]:
+                    self._budget_end[cpu] = budget
+                    self._schedule_event(cpu)
+
+    def _queue_of(self, cpu):
+        return cpu if self.per_core_queues else 0
+
+    def _push(self, q, pid):
+        self._queues[q].on_arrival(pid)
+        self._queued += 1
+        self._load[q] += 1
+
+    def _pop(self, q):
+        self._queued -= 1
+        self._load[q] -= 1
+        return self._queues[q].pick_next()
+
+    def _schedule_event(self, cpu):
+        self._version[cpu] += 1
+        pid = self.running[cpu]
+        if pid is not None:
+            t = min(self._run_from[cpu] + self.remaining[pid], self._budget_end[cpu])
+            heapq.heappush(self._events, (t, cpu, self._version[cpu]))
+
+    def _tick_budget(self, cpu):
+        # Charges the CPU's queue the progress made since the last charge and
+        # returns when the running process's budget runs out. Nobody can wait
+        # for this CPU before the next arrival if its queue is empty: queues
+        # only grow by arrivals (a preemption puts one process back for one)
+        t = max(self.time, self._run_from[cpu])
+        queue = self._queues[self._queue_of(cpu)]
+        if queue:
+            quiet = 0
+        else:
+            quiet = max(0, self._arrivals.next_time() - t)
+        left = queue.on_tick_budget(self.running[cpu], t - self._charged_from[cpu], quiet)
+        self._charged_from[cpu] = t
+        return t + left
+
+    def _start(self, cpu, pid):
+        t = self.time
+        self.running[cpu] = pid
+        self._on_cpu[pid] = cpu
+        self._load[self._queue_of(cpu)] += 1
+        if self.first_run[pid] < 0:
+            self.first_run[pid] = t
+        if pid != self._last_pid[cpu]:
+            if self._last_pid[cpu] is not None:
+                self.context_switches += 1
+            self._last_pid[cpu] = pid
+
+        cost = 0
+        if self.last_cpu[pid] >= 0 and self.last_cpu[pid] != cpu:
+            self.migrations += 1
+            cost = self.migration_cost
+        self.last_cpu[pid] = cpu
+
+        self._slice_start[cpu] = t
+        self._run_from[cpu] = self._charged_from[cpu] = t + cost
+        self._budget_end[cpu] = self._tick_budget(cpu)
+        self._schedule_event(cpu)
+
+    def _stop(self, cpu, idle=True):
+        # Takes the running process off the CPU, charging its progress, and returns its pid
+        t = self.time
+        pid = self.running[cpu]
+        progress = max(0, t - self._run_from[cpu])
+        self.remaining[pid] -= progress
+        self.cpu_busy[cpu] += progress
+        if t > self._slice_start[cpu] and t > self._recorded_until:
+            start = self._slice_start[cpu]
+            migration = min(t, self._run_from[cpu]) - start   # overhead at its start
+            if self.record_timeline:
+                self.timeline.append({
+                    'name': self.names[pid],
+                    'arrival': self.arrival[pid],
+                    'burst': self.burst[pid],
+                    'start': start,
+                    'duration': t - start,
+                    'cpu': cpu,
+                    'migration': migration
+                })
+            if self.on_slice is not None:
+                self.on_slice(pid, cpu, start, t - start, migration)
+        self.running[cpu] = None
+        self._on_cpu[pid] = -1
+        self._load[self._queue_of(cpu)] -= 1
+        self._version[cpu] += 1
+        if idle:
+            heapq.heappush(self._idle, cpu)
+        return pid
+
+    def _swap(self, cpu):
+        # Puts the running process back in its CPU's queue and dispatches the head of that queue
+        # (not charged on the way out: only feedback queues, refused here, would count it)
+        q = self._queue_of(cpu)
+        pid = self._stop(cpu, idle=False)
+        self._push(q, pid)
+        self._start(cpu, self._pop(q))
+
+    def _dispatch_idle(self):
+        while self._idle and self._queued:
+            cpu = heapq.heappop(self._idle)
+            q = self._queue_of(cpu)
+            if not self._queues[q]:
+                # Per-core queues: steal from the longest one
+                q = max(range(len(self._queues)), key=lambda i: len(self._queues[i]))
+            self._start(cpu, self._pop(q))
+
+    def _process_events(self):
+        t = self.time
+        self._processed_at = t
+        expired = []
+
+        events = self._events
+        while events and events[0][0] <= t:
+            _, cpu, version = heapq.heappop(events)
+            if version != self._version[cpu]:
+                continue
+            pid = self.running[cpu]
+            if self.remaining_of(pid) <= 0:
+                self._queues[self._queue_of(cpu)].discard(pid)
+                self._stop(cpu)
+                self.completion[pid] = t
+            else:
+                expired.append(cpu)
+
+        admitted = []
+        for pid in self._arrivals.due(t):
+            if self.burst[pid] <= 0:
+                self.completion[pid] = t
+                continue
+            # Least loaded queue (an idle CPU with nothing queued has load 0)
+            q = self._load.index(min(self._load)) if self.per_core_queues else 0
+            self._push(q, pid)
+            admitted.append(q)
+
+        self._dispatch_idle()
+
+        for cpu in expired:
+            if self._queues[self._queue_of(cpu)].should_preempt(self.running[cpu], True):
+                self._swap(cpu)
+            else:
+                # Budget used up with nobody to take over: charge it and start the next one
+                self._budget_end[cpu] = self._tick_budget(cpu)
+                self._schedule_event(cpu)
+
+        if admitted and self.policy.is_preemptive:
+            self._preempt(admitted)
+
+    def _preempt(self, queues):
+        # A waiting process that should take a running one's CPU does
+        if self.per_core_queues:
+            for cpu in set(queues):
+                if self.running[cpu] is not None and self._queues[cpu].should_preempt(self.running[cpu]):
+                    self._swap(cpu)
+            return
+
+        # Shared queue: the head preempts the CPU whose process ranks last
+        ready = self._queues[0]
+        while ready:
+            beaten = [(ready.rank(pid), cpu) for cpu, pid in enumerate(self.running)
+                      if pid is not None and ready.should_preempt(pid)]
+            if not beaten:
+                break
+            self._swap(max(beaten)[1])
+
+
+def simulate_smp(processes, policy, cpus=2, migration_cost=0, per_core_queues=False):
+    """
+    Runs a whole workload on `cpus` CPUs and returns SMPEngine.result()
+    """
+    return SMPEngine(policy, processes, cpus, migration_cost, per_core_queues).run()
@@ -0,0 +1,58 @@
+from core.engine.engine import Engine
+from core.process_table import StreamingProcessTable
+from utils.metrics import StreamingMetrics
+
+
+class StreamingEngine(Engine):
+    """
+    Engine for traces too long to hold in memory.
+    feed() pulls processes from an arrival-sorted iterable only when the
+    clock reaches their arrival, and finished processes are folded into a
+    utils.metrics.StreamingMetrics and dropped from the table. Memory stays
+    proportional to the processes alive at once (ready queue + running),
+    not to the length of the trace. No timeline is kept.
+    """
+
+    def __init__(self, policy):
+        super().__init__(policy, StreamingProcessTable(), record_timeline=False)
+        self.metrics = StreamingMetrics()
+        self.peak_alive = 0
+        self._finished = []
+
+    def _finish(self, pid):
+        super()._finish(pid)
+        self._finished.append(pid)
+
+    def retire_finished(self):
+        for pid in self._finished:
+            self.metrics.add(self.arrival[pid], self.burst[pid], self.completion[pid],
+                             self.first_run[pid], self.priority[pid])
+            self.table.retire(pid)
+        self._finished.clear()
+
+    def feed(self, processes):
+        """
+        Runs every process of an arrival-sorted iterable to completion and
+        returns the metrics dict (same shape as utils.metrics.compute_metrics).
+        """
+        last = None
+        for process in processes:
+            arrival = process['arrival']
+            if last is not None and arrival < last:
+                raise ValueError(f"Process {process['name']} breaks the arrival order")
+            last = arrival
+            if arrival > self.time:
+                # Everything strictly before this arrival, with the clock left just short of it
+                self.advance(arrival - 1)
+                self.retire_finished()
+            self.add(process)
+            self.peak_alive = max(self.peak_alive, len(self.table))
+
+        self.advance()
+        self.retire_finished()
+        return self.metrics.result(self.context_switches)
+
+
+def run_trace(policy, processes):
+    """Streams an arrival-sorted iterable of process dicts through a policy and returns its metrics"""
+    return StreamingEngine(policy).feed(processes)
@@ -0,0 +1,122 @@
+import os
+
+from core.engine.engine import Engine
+from core.engine.policies import RRPolicy
+from core.engine.pool import Cancelled, workload, workload_pool
+from utils.metrics import engine_metrics
+
+# Round Robin quantum sweep.
+# Workers get the workload once (see core.engine.pool) and reuse it for
+# every quantum, only the per-run columns are reset between runs.
+
+OBJECTIVES = ('avg_waiting', 'avg_turnaround', 'avg_response', 'context_switches')
+
+
+def _evaluate(quantum):
+    table, arrivals = workload()
+    engine = Engine(RRPolicy(quantum), table, arrivals=arrivals, record_timeline=False)
+    engine.advance()
+    metrics = engine_metrics(engine)
+    return {
+        'quantum': quantum,
+        'avg_waiting': metrics['waiting']['mean'],
+        'avg_turnaround': metrics['turnaround']['mean'],
+        'avg_response': metrics['response']['mean'],
+        'context_switches': metrics['context_switches'],
+    }
+
+
+class QuantumSweep:
+    """
+    Evaluates Round Robin over many quanta of the same workload on a process
+    pool (jobs=1 runs in this process). Use as a context manager so the pool
+    is shut down. close() from another thread cancels a run in progress (in
+    this process, at the next quantum): it raises core.engine.pool.Cancelled.
+    """
+
+    def __init__(self, processes, jobs=None):
+        self.jobs = jobs or os.cpu_count() or 1
+        self.points = {}  # quantum -> metrics dict
+        self._closed = False
+        self._pool = workload_pool(processes, self.jobs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._closed = True
+        if self._pool is not None:
+            self._pool.close()
+
+    def evaluate(self, quanta):
+        """Runs the quanta not evaluated yet and returns the points for all of them, sorted by quantum"""
+        todo = sorted({q for q in quanta if q not in self.points})
+        for q in todo:
+            if q < 1:
+                raise ValueError("Quantum must be at least 1")
+        if self._pool is not None:
+            results = self._pool.map(_evaluate, todo)
+        else:
+            results = []
+            for q in todo:
+                if self._closed:
+                    raise Cancelled()
+                results.append(_evaluate(q))
+        for point in results:
+            self.points[point['quantum']] = point
+        return [self.points[q] for q in sorted(set(quanta))]
+
+    def search(self, lo=1, hi=100, objective='avg_waiting', samples=None):
+        """
+        Coarse-to-fine search for the quantum minimizing `objective` in [lo, hi].
+        Evaluates `samples` evenly spaced quanta, then narrows to the two grid
+        steps around the best one and samples again, until the step is 1.
+        Assumes the objective is roughly unimodal in the quantum; use
+        evaluate(range(lo, hi + 1)) for an exhaustive sweep.
+        Returns the best point.
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}")
+        if lo < 1 or hi < lo:
+            raise ValueError("Quantum range must satisfy 1 <= lo <= hi")
+        samples = max(4, samples or 2 * self.jobs)
+
+        left, right = lo, hi
+        while True:
+            step = max(1, (right - left) // (samples - 1))
+            self.evaluate(list(range(left, right + 1, step)) + [right])
+            best = self.best(objective)
+            if step == 1:
+                return best
+            left = max(lo, best['quantum'] - step)
+            right = min(hi, best['quantum'] + step)
+
+    def run(self, lo=1, hi=100, objective='avg_waiting', exhaustive=False):
+        """search(), or every quantum of [lo, hi] with exhaustive; returns the sweep_quantum dict"""
+        if exhaustive:
+            self.evaluate(range(lo, hi + 1))
+            best = self.best(objective)
+        else:
+            best = self.search(lo, hi, objective)
+        return {'points': self.curve(), 'best': best}
+
+    def best(self, objective='avg_waiting'):
+        # Ties go to the larger quantum: fewer context switches for the same score
+        return min(self.points.values(), key=lambda p: (p[objective], -p['quantum']))
+
+    def curve(self):
+        """Every evaluated point, sorted by quantum"""
+        return [self.points[q] for q in sorted(self.points)]
+
+
+def sweep_quantum(processes, lo=1, hi=100, objective='avg_waiting', exhaustive=False, jobs=None):
+    """
+    Returns a dict:
+    {'points': [{'quantum', 'avg_waiting', 'avg_turnaround', 'avg_response', 'context_switches'}, ...],
+     'best': the point minimizing objective}
+    """
+    with QuantumSweep(processes, jobs) as sweep:
+        return sweep.run(lo, hi, objective, exhaustive)
@@ -0,0 +1,241 @@
+from array import array
+from collections.abc import Mapping
+
+
+class ProcessTable:
+    """
+    Compact process store.
+    Names are interned to integer ids (pid = insertion order) and every field
+    lives in a typed array indexed by pid, instead of one dict per process.
+    Times are integers. completion and first_run are -1 until known.
+    """
+    FIELDS = ('arrival', 'burst', 'priority', 'remaining', 'first_run', 'completion')
+
+    def __init__(self, processes=()):
+        self.names = []
+        self._ids = {}
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.priority = array('q')
+        self.remaining = array('q')
+        self.first_run = array('q')
+        self.completion = array('q')
+        for p in processes:
+            self.add(p)
+
+    def add(self, process):
+        """Adds a process dict (name, arrival, burst, optional priority) and returns its pid"""
+        name = process['name']
+        if name in self._ids:
+            raise ValueError(f"Duplicate process name: {name}")
+        pid = len(self.names)
+        self._ids[name] = pid
+        self.names.append(name)
+        self.arrival.append(process['arrival'])
+        self.burst.append(process['burst'])
+        self.priority.append(process.get('priority', 0))
+        self.remaining.append(process['burst'])
+        self.first_run.append(-1)
+        self.completion.append(-1)
+        return pid
+
+    @classmethod
+    def from_columns(cls, arrival, burst, priority=None, prefix='P'):
+        """
+        Builds a table straight from int64 columns (NumPy arrays or anything
+        else exposing a buffer), copying them in bulk: no per-process object
+        is created. Process pid is named f'{prefix}{pid}', as in binary traces.
+        """
+        table = cls()
+        table.arrival.frombytes(_int64_bytes(arrival))
+        table.burst.frombytes(_int64_bytes(burst))
+        n = len(table.burst)
+        if len(table.arrival) != n:
+            raise ValueError("arrival and burst columns differ in length")
+        if priority is None:
+            table.priority = array('q', bytes(8 * n))
+        else:
+            table.priority.frombytes(_int64_bytes(priority))
+            if len(table.priority) != n:
+                raise ValueError("priority and burst columns differ in length")
+        table.remaining.frombytes(_int64_bytes(table.burst))
+        table.first_run = array('q', [-1]) * n
+        table.completion = array('q', [-1]) * n
+        table.names = NumberedNames(n, prefix)
+        table._ids = NumberedIds(n, prefix)
+        return table
+
+    def pid(self, name):
+        return self._ids[name]
+
+    def reset(self):
+        """Forgets any run progress so the same table can be scheduled again"""
+        n = len(self.names)
+        self.remaining[:] = self.burst
+        self.first_run[:] = array('q', [-1]) * n
+        self.completion[:] = array('q', [-1]) * n
+
+    def __contains__(self, name):
+        return name in self._ids
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, pid):
+        return ProcessView(self, pid)
+
+    def __iter__(self):
+        for pid in range(len(self.names)):
+            yield ProcessView(self, pid)
+
+    def as_dicts(self):
+        return [dict(view) for view in self]
+
+
+def _int64_bytes(column):
+    # Raw bytes of a contiguous int64 column, without copying it
+    view = memoryview(column)
+    if view.itemsize != 8 or view.format not in ('q', 'l', '<q', '<l', '=q', '=l'):
+        raise ValueError("Columns must hold 64-bit integers")
+    return view.cast('B')
+
+
+class NumberedNames:
+    """
+    names column of a table built by ProcessTable.from_columns: the first
+    `count` pids are named f'{prefix}{pid}' on access instead of holding one
+    string each. Processes added afterwards keep their own names.
+    """
+    __slots__ = ('prefix', 'count', '_added')
+
+    def __init__(self, count, prefix='P'):
+        self.prefix = prefix
+        self.count = count
+        self._added = []
+
+    def __len__(self):
+        return self.count + len(self._added)
+
+    def __getitem__(self, pid):
+        if pid < 0:
+            pid += len(self)
+        if 0 <= pid < self.count:
+            return f'{self.prefix}{pid}'
+        return self._added[pid - self.count]
+
+    def __iter__(self):
+        for pid in range(self.count):
+            yield f'{self.prefix}{pid}'
+        yield from self._added
+
+    def append(self, name):
+        self._added.append(name)
+
+
+class NumberedIds:
+    """name -> pid lookup matching NumberedNames, with no entry per numbered process"""
+    __slots__ = ('prefix', 'count', '_added')
+
+    def __init__(self, count, prefix='P'):
+        self.prefix = prefix
+        self.count = count
+        self._added = {}
+
+    def _numbered(self, name):
+        # pid of a generated name ('P0', 'P17', not 'P017'), or None
+        if not isinstance(name, str) or not name.startswith(self.prefix):
+            return None
+        digits = name[len(self.prefix):]
+        if not (digits.isascii() and digits.isdigit()) or (digits[0] == '0' and len(digits) > 1):
+            return None
+        pid = int(digits)
+        return pid if pid < self.count else None
+
+    def __contains__(self, name):
+        return self._numbered(name) is not None or name in self._added
+
+    def __getitem__(self, name):
+        pid = self._numbered(name)
+        return self._added[name] if pid is None else pid
+
+    def __setitem__(self, name, pid):
+        self._added[name] = pid
+
+
+class ProcessView(Mapping):
+    """Read-only, dict-compatible view of one row, for code (and the GUI) that expects process dicts"""
+    __slots__ = ('table', 'pid')
+
+    def __init__(self, table, pid):
+        self.table = table
+        self.pid = pid
+
+    def __getitem__(self, key):
+        if key == 'name':
+            return self.table.names[self.pid]
+        if key in ProcessTable.FIELDS:
+            return getattr(self.table, key)[self.pid]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield 'name'
+        yield from ProcessTable.FIELDS
+
+    def __len__(self):
+        return 1 + len(ProcessTable.FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class StreamingProcessTable(ProcessTable):
+    """
+    ProcessTable for long traces: columns are dicts keyed by pid instead of
+    arrays, and retire(pid) drops a finished process, so memory follows the
+    processes alive at once rather than the length of the trace.
+    pids keep increasing and are never reused.
+    """
+
+    def __init__(self, processes=()):
+        self.names = {}
+        self._ids = {}
+        self._next_pid = 0
+        self.arrival = {}
+        self.burst = {}
+        self.priority = {}
+        self.remaining = {}
+        self.first_run = {}
+        self.completion = {}
+        for p in processes:
+            self.add(p)
+
+    def add(self, process):
+        name = process['name']
+        if name in self._ids:
+            raise ValueError(f"Duplicate process name: {name}")
+        pid = self._next_pid
+        self._next_pid += 1
+        self._ids[name] = pid
+        self.names[pid] = name
+        self.arrival[pid] = process['arrival']
+        self.burst[pid] = process['burst']
+        self.priority[pid] = process.get('priority', 0)
+        self.remaining[pid] = process['burst']
+        self.first_run[pid] = -1
+        self.completion[pid] = -1
+        return pid
+
+    def retire(self, pid):
+        del self._ids[self.names.pop(pid)]
+        for field in self.FIELDS:
+            del getattr(self, field)[pid]
+
+    def reset(self):
+        for pid in self.names:
+            self.remaining[pid] = self.burst[pid]
+            self.first_run[pid] = -1
+            self.completion[pid] = -1
+
+    def __iter__(self):
+        for pid in list(self.names):
+            yield ProcessView(self, pid)
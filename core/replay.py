@@ -0,0 +1,208 @@
+from PyQt5.QtCore import QObject, QTimer, QElapsedTimer, pyqtSignal
+from array import array
+from bisect import bisect_left
+from core.engine.engine import Engine
+from core.engine.smp import SMPEngine
+from core.engine.policies import policy_for
+from utils.instrument import DISABLED
+from utils.metrics import engine_metrics
+
+
+class ReplaySimulator(QObject):
+    """
+    Non-live mode: computes the whole schedule up front with the engine, then
+    plays it back on a GUI timer at `speed` time units per second.
+    Each frame jumps to wherever the wall clock says playback should be, so
+    frames are skipped instead of falling behind when rendering is slow.
+    Exposes the same signals as Simulator, so the GUI wires it the same way.
+    With cpus > 1 the schedule comes from SMPEngine and every slice, live
+    ones included, goes through update_slices with its CPU.
+    An optional utils.instrument.Instrument (probe) times the schedule and
+    each frame; the time between frames shows up as unaccounted.
+    seek(t) jumps anywhere in the schedule: the engine keeps a checkpoint
+    every CHECKPOINT_EVENTS events and replays from the nearest.
+    """
+    update_slice = pyqtSignal(str, int, int)
+    update_slices = pyqtSignal(list)   # (name, start, duration, cpu) slices of one frame
+    update_table = pyqtSignal(list)
+    update_stats = pyqtSignal(dict)
+    simulation_done = pyqtSignal()
+    time_changed = pyqtSignal(int)   # playback time, once per frame
+    rewound = pyqtSignal(int)        # playback jumped back to this time: cut the chart there
+
+    FRAME_MS = 16
+    CHECKPOINT_EVENTS = 4096
+
+    def __init__(self, scheduler, processes, quantum=None, speed=1.0, cpus=1, migration_cost=0,
+                 per_core_queues=False, probe=DISABLED):
+        super().__init__()
+        self.probe = probe
+        policy = policy_for(scheduler, quantum)
+        if cpus > 1:
+            self.engine = SMPEngine(policy, processes, cpus, migration_cost, per_core_queues,
+                                    checkpoint_every=self.CHECKPOINT_EVENTS)
+        else:
+            self.engine = Engine(policy, processes, checkpoint_every=self.CHECKPOINT_EVENTS)
+        self.speed = speed
+        self.current_time = 0
+
+        self.timeline = []
+        self._index = 0          # first slice not shown at all yet
+        self._active = []        # slices shown partially so far, by start time
+        self._end = 0
+        self._finished = False
+        self._base_time = 0      # playback time when the clock was last (re)started
+        self._clock = QElapsedTimer()
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._frame)
+
+    def start(self):
+        probe = self.probe
+        probe.start()
+        self.timeline = self.engine.run()['timeline']
+        self._starts = array('q', (entry['start'] for entry in self.timeline))
+        if probe.enabled:
+            probe.lap('schedule')
+        table = self.engine.table
+        self._end = max(table.completion, default=0)
+        self._remaining = array('q', table.burst)
+        self.update_table.emit([dict(table[pid], remaining=table.burst[pid])
+                                for pid in sorted(range(len(table)), key=table.arrival.__getitem__)])
+        if probe.enabled:
+            probe.lap('table')
+        # The numbers are known right away, only the drawing is paced
+        self.update_stats.emit(engine_metrics(self.engine))
+        if probe.enabled:
+            probe.lap('metrics')
+
+        self._clock.start()
+        self._timer.start(self.FRAME_MS)
+
+    def isRunning(self):
+        return self._timer.isActive()
+
+    def add_process(self, process):
+        # The schedule is already computed; new processes need a live simulation
+        return False
+
+    def add_processes(self, processes):
+        return []
+
+    def set_speed(self, speed):
+        self._base_time = self._playback_time()
+        self._clock.restart()
+        self.speed = speed
+
+    def jump_to_end(self):
+        self._show_until(float('inf'))
+
+    @property
+    def end_time(self):
+        return self._end
+
+    def seek(self, t):
+        """
+        Jumps playback to time t, back or forward, and keeps playing from there.
+        Going back restores the engine from its nearest checkpoint, cuts the
+        chart at t (rewound) and resends every row with its remaining time at t.
+        """
+        t = max(0, min(int(t), self._end))
+        if t < self.current_time:
+            engine = self.engine
+            engine.seek(t)
+            table = engine.table
+            self._index = bisect_left(self._starts, t)
+            self._active = []
+            self._remaining = array('q', (engine.remaining_of(pid) for pid in range(len(table))))
+            for cpu, pid, start in engine.running_slices():
+                if start >= t:
+                    continue
+                # The slice it is in at t is only partly shown
+                i = bisect_left(self._starts, start)
+                while self.timeline[i]['name'] != table.names[pid] or self.timeline[i].get('cpu', 0) != cpu:
+                    i += 1
+                entry = self.timeline[i]
+                self._active.append(i)
+                self._remaining[pid] += max(0, t - entry['start'] - entry.get('migration', 0))
+            self._active.sort()
+            self.rewound.emit(t)
+            self.update_table.emit([dict(table[pid], remaining=engine.remaining_of(pid)) for pid in range(len(table))])
+            self.current_time = t
+            if self._finished:
+                self._finished = False
+                self._timer.start(self.FRAME_MS)
+        self._show_until(t)
+        self._base_time = t
+        self._clock.restart()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _playback_time(self):
+        return self._base_time + self._clock.elapsed() / 1000 * self.speed
+
+    def _frame(self):
+        self._show_until(self._playback_time())
+
+    def _show_until(self, target):
+        if self._finished:
+            return
+        probe = self.probe
+        if probe.enabled:
+            probe.mark()
+            probe.count('frames')
+        timeline = self.timeline
+        table = self.engine.table
+        rows = {}
+        done = []
+        live = []
+
+        candidates = self._active
+        self._active = []
+        while self._index < len(timeline) and timeline[self._index]['start'] < target:
+            candidates.append(self._index)
+            self._index += 1
+
+        # In start order, so each CPU lane gets its slices in order and a live
+        # slice always comes after the completed ones of its lane
+        for i in candidates:
+            entry = timeline[i]
+            pid = table.pid(entry['name'])
+            shown = int(min(entry['duration'], target - entry['start']))
+            item = (entry['name'], entry['start'], shown, entry.get('cpu', 0))
+            overhead = entry.get('migration', 0)   # no progress while migrating
+            if shown < entry['duration']:
+                # Slice still being played: show the partial progress only
+                self._active.append(i)
+                if shown > 0:
+                    live.append(item)
+                    rows[pid] = self._remaining[pid] - max(0, shown - overhead)
+                continue
+            done.append(item)
+            self._remaining[pid] -= entry['duration'] - overhead
+            rows[pid] = self._remaining[pid]
+
+        if self.engine.cpus > 1:
+            done += live
+            live = []
+        if probe.enabled:
+            probe.lap('table')
+            probe.sample('active_slices', len(self._active))
+        if done:
+            self.update_slices.emit(done)
+        for name, start, shown, _ in live:
+            self.update_slice.emit(name, start, shown)
+        if rows:
+            self.update_table.emit([dict(table[pid], remaining=remaining) for pid, remaining in rows.items()])
+        if probe.enabled:
+            probe.lap('signals')
+
+        if self._index >= len(timeline) and not self._active:
+            self._timer.stop()
+            self._finished = True
+            self.current_time = self._end
+            probe.stop(self.engine.events)
+            self.simulation_done.emit()
+        else:
+            self.current_time = int(min(target, self._end))
+        self.time_changed.emit(self.current_time)
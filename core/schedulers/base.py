@@ -0,0 +1,108 @@
+import heapq
+
+
+class Scheduler:
+    """
+    Common interface of the scheduler classes. A scheduler names its policy
+    (see core.engine.policies.policy_for), whose ready queue makes the
+    decisions when core.engine.Engine runs it, e.g. in the GUI simulators.
+
+    schedule() computes a whole schedule at once. Policies without a quantum
+    order their ready queue by rank alone (see core.engine.policies), so they
+    take a dedicated heap loop on that rank that only stops at arrivals and
+    completions, a few times faster than the general engine loop; it returns
+    the same slices as the engine (tests/test_schedulers.py checks both
+    agree, tests/test_benchmarks.py that it stays fast).
+    """
+    is_preemptive = False
+
+    def schedule(self, processes):
+        """
+        Returns a list of dicts, one per contiguous run, in time order.
+        Each dict contains: name, arrival, burst (the whole burst), start, duration.
+        The caller's list is left untouched.
+        """
+        # Imported here: core.engine.policies imports the scheduler modules
+        from core.engine.engine import simulate
+        from core.engine.policies import policy_for
+        policy = policy_for(self)
+        if policy.quantum is None:
+            return heap_schedule(processes, policy.rank, policy.is_preemptive)
+        return simulate(processes, policy)['timeline']
+
+
+def heap_schedule(processes, rank, preemptive):
+    """
+    Schedules processes with a ready heap on (rank, arrival, pid), pid being
+    the position in `processes`, as the engine's KeyedQueue; rank is a
+    policy rank ('burst', 'remaining' re-queued with the time left,
+    'priority', None for arrival order). With preemptive, an arrival whose
+    rank is strictly smaller takes the CPU. Zero bursts finish on arrival
+    without a slice, as in the engine.
+    """
+    names = [p['name'] for p in processes]
+    if len(set(names)) != len(names):
+        seen = set()
+        for name in names:
+            if name in seen:
+                raise ValueError(f"Duplicate process name: {name}")
+            seen.add(name)
+    arrival = [p['arrival'] for p in processes]
+    burst = [p['burst'] for p in processes]
+    if rank == 'priority':
+        key = [p.get('priority', 0) for p in processes]
+    elif rank is None:
+        key = arrival
+    else:
+        key = burst
+    by_remaining = rank == 'remaining'
+
+    n = len(processes)
+    order = sorted(range(n), key=arrival.__getitem__)   # stable: ties by pid
+    remaining = list(burst)
+    heappush, heappop = heapq.heappush, heapq.heappop
+    ready = []
+    timeline = []
+    t = 0
+    i = 0
+    while i < n or ready:
+        # CPU idle: jump to the next arrival
+        if not ready:
+            t = max(t, arrival[order[i]])
+        while i < n and arrival[order[i]] <= t:
+            pid = order[i]
+            i += 1
+            if burst[pid] > 0:
+                heappush(ready, (key[pid], arrival[pid], pid))
+        if not ready:
+            continue
+
+        rank_now, _, pid = heappop(ready)
+        start = t
+        finish = t + remaining[pid]
+        if preemptive:
+            # Only an arrival before it finishes can take the CPU
+            while i < n and arrival[order[i]] < finish:
+                other = order[i]
+                i += 1
+                if burst[other] <= 0:
+                    continue
+                at = arrival[other]
+                heappush(ready, (key[other], at, other))
+                if key[other] < (rank_now - (at - start) if by_remaining else rank_now):
+                    finish = at
+                    break
+
+        left = remaining[pid] - (finish - start)
+        remaining[pid] = left
+        if left > 0:
+            heappush(ready, (left if by_remaining else key[pid], arrival[pid], pid))
+        timeline.append({
+            'name': names[pid],
+            'arrival': arrival[pid],
+            'burst': burst[pid],
+            'start': start,
+            'duration': finish - start
+        })
+        t = finish
+    return timeline
@@ -1,21 +1,6 @@
-class FCFSScheduler:
-    is_preemptive = False
-
-    def schedule(self, processes):
-        # Sort by arrival
-        processes = sorted(processes, key=lambda p: p['arrival'])
+from core.schedulers.base import Scheduler
 
-        current_time = max([p.get('ran', 0) + p['arrival'] for p in processes], default=0)
 
-        for p in processes:
-            ran = p.get('ran', 0)
-            if ran < p['burst']:
-                return [{
-                    'name': p['name'],
-                    'arrival': p['arrival'],
-                    'burst': p['burst'],
-                    'duration': 1,
-                    'start': None
-                }]
-
-        return []
+class FCFSScheduler(Scheduler):
+    """First come, first served"""
+    is_preemptive = False
@@ -0,0 +1,18 @@
+from core.schedulers.base import Scheduler
+
+
+class MLFQScheduler(Scheduler):
+    is_preemptive = True
+
+    def __init__(self, quanta=(2, 4, 8), boost=50):
+        """
+        quanta[i] is the time a process may use on level i before it is
+        demoted (one level per quantum); boost is the period at which every
+        process goes back to the top level (None: never).
+        """
+        self.quanta = tuple(quanta)
+        self.boost = boost
+
+    @property
+    def levels(self):
+        return len(self.quanta)
@@ -1,176 +1,165 @@
-from PyQt5.QtCore import QThread, pyqtSignal, QWaitCondition, QMutex
-import time
+from PyQt5.QtCore import QThread, pyqtSignal
 import threading
-from PyQt5.QtCore import pyqtSignal, QThread
-from utils.helper_functions import sleep_or_mwait, calculate_stats, get_live_table
+from core.engine.engine import Engine
+from core.engine.policies import policy_for
+from utils.helper_functions import sleep_or_mwait
+from utils.instrument import DISABLED
+from utils.metrics import engine_metrics
 
 
 
 class Simulator(QThread):
-    update_gantt = pyqtSignal(str, int)
-    update_table = pyqtSignal(list)
-    update_stats = pyqtSignal(float, float)
+    """
+    Thin QThread adapter over core.engine.Engine.
+    The engine decides what runs; this thread only paces it one time unit at a
+    time and forwards the result to the GUI through signals.
+    Processes submitted while it runs wait in a queue that the simulation
+    thread drains at the start of every time unit, so submitting never
+    pauses the simulation and the engine is only touched by this thread.
+    An optional utils.instrument.Instrument (probe) times each part of a tick.
+    """
+    update_slice = pyqtSignal(str, int, int)   # name, start, duration of the live slice
+    update_table = pyqtSignal(list)   # only the rows that changed
+    update_stats = pyqtSignal(dict)   # utils.metrics.compute_metrics result
     simulation_done = pyqtSignal()
 
-    # Add a pause signal
-    pause_simulation = pyqtSignal()
-
-    def __init__(self, scheduler, processes, time_unit=1, live=True):
+    def __init__(self, scheduler, processes, time_unit=1, live=True, quantum=None, probe=DISABLED):
         super().__init__()
         self.scheduler = scheduler
         self.processes = processes.copy()
         self.time_unit = time_unit
         self.live = live
+        self.probe = probe
 
         self.running = True
-        self.paused = False
 
         self.current_time = 0
-        self.new_processes = []
-        self._executed_time = {}
-        self._run_time = {}
+        self._slice_pid = None
+        self._slice_start = 0
+        self._slice_end = 0
 
-        self.lock = threading.Lock()
-        self.mutex = QMutex()
-        self.pause_condition = QWaitCondition()
+        # Submission queue, shared with the GUI thread
+        self._submit_lock = threading.Lock()
+        self._submitted = []
+        self._names = {p['name'] for p in self.processes}   # every name ever accepted
 
-        self.reschedule_needed = True
+        self.engine = Engine(policy_for(scheduler, quantum), self.processes)
 
     def add_process(self, process):
-        print(f"Request to add: {process['name']}")
-
-        
-        self.paused = True  
-
-        with self.lock:
-            if any(p['name'] == process['name'] for p in self.processes + self.new_processes):
-                print(f"Duplicate: {process['name']}")
-                self.paused = False
-                self.pause_condition.wakeAll()
-                return False
-
-            print(f"Added: {process['name']}")
-            self.new_processes.append(process)
-            self.processes.extend(self.new_processes)
-            self.new_processes.clear()
-
-            self.reschedule_needed = True
-            self.update_table.emit(get_live_table(self.processes, self._run_time))
-
-        # Resume simulation (we're still in the GUI thread here)
-        self.paused = False
-        self.pause_condition.wakeAll()
-
-        return True
-
-
-    def wait_if_paused(self):
-        self.mutex.lock()
-        while self.paused:
-            print("Simulation paused. Waiting...")
-            self.pause_condition.wait(self.mutex)
-        self.mutex.unlock()
+        """Queues one process; returns False if the name is already taken"""
+        return bool(self.add_processes([process]))
+
+    def add_processes(self, processes):
+        """
+        Queues a batch of processes for the simulation thread without pausing it.
+        Names already taken (or repeated in the batch) are skipped.
+        Returns the list of accepted processes.
+        """
+        accepted = []
+        with self._submit_lock:
+            for process in processes:
+                if process['name'] in self._names:
+                    continue
+                self._names.add(process['name'])
+                accepted.append(process)
+            self._submitted.extend(accepted)
+        return accepted
+
+    def _drain_submissions(self):
+        # Simulation thread only: moves queued processes into the engine
+        with self._submit_lock:
+            if not self._submitted:
+                return
+            batch = self._submitted
+            self._submitted = []
+        # Submitted as of the GUI's clock, which may be behind the engine's
+        earliest = self.engine.earliest_arrival()
+        batch = [p if p['arrival'] >= earliest else dict(p, arrival=earliest) for p in batch]
+        self.processes.extend(batch)
+        pids = [self.engine.add(process) for process in batch]
+        self.update_table.emit([dict(self.engine.table[pid]) for pid in pids])
+        if self.probe.enabled:
+            self.probe.count('injected', len(batch))
 
 
     def run(self):
+        probe = self.probe
+        timed = probe.enabled
+        probe.start()
         try:
-            scheduled = []
-            current_process = None
-
-            for p in self.processes:
-                if p['burst'] == 0 and p['name'] not in self._executed_time:
-                    self._executed_time[p['name']] = 0  # Or some appropriate time
+            table = self.engine.table
+            self.update_table.emit([dict(table[pid]) for pid in sorted(range(len(table)), key=table.arrival.__getitem__)])
+            if timed:
+                probe.lap('table')
 
             while self.running:
-                if all(p['name'] in self._executed_time for p in self.processes):
-                    print("leaving the while loop")
+                self._drain_submissions()
+                if timed:
+                    probe.lap('inject')
+
+                self.engine.advance(self.current_time)
+                if timed:
+                    probe.lap('schedule')
+                    probe.count('ticks')
+                    probe.sample('ready_queue', self.engine.queue_length())
+                if self.engine.done():
                     break
+                pid = self.engine.running
 
-
-                self.wait_if_paused()
-
-                with self.lock:
-                    if self.reschedule_needed or not scheduled:
-                        scheduled = self.scheduler.schedule(self.processes)
-                        scheduled = [
-                            p for p in scheduled
-                            if self._run_time.get(p['name'], 0) < p['burst']
-                        ]
-                        self.reschedule_needed = False
-
-                if not scheduled:
-                    for p in self.processes:
-                        p['ran'] = self._run_time.get(p['name'], 0)
-                    continue
-
-                current_process = scheduled.pop(0)
-
-                if current_process['arrival'] > self.current_time:
-                    sleep_or_mwait(self.live, self.time_unit)
-                    self.current_time += 1
+                if pid is None and not self.live:
+                    # CPU idle: jump straight to the next arrival
+                    self.current_time = self.engine.next_event_time()
                     continue
-                
-
-                already_ran = self._run_time.get(current_process['name'], 0)
-                remaining = current_process['burst'] - already_ran
-
-                for _ in range(remaining):
-                    if not self.running:
-                        break
-
-                    self.wait_if_paused()
-
-                    if self.reschedule_needed:
-                        for p in self.processes:
-                            p['ran'] = self._run_time.get(p['name'], 0)
-
-                        print(f"Preempting {current_process['name']} due to reschedule.")
-
-                        
-                        if hasattr(self.scheduler, 'is_preemptive') and self.scheduler.is_preemptive:
-                            
-                            scheduled.append(current_process)
-                        else:
-                            
-                            scheduled.insert(0, current_process)  
-
-                        break
 
-                    # Simulate one unit of execution
-                    self._run_time[current_process['name']] = self._run_time.get(current_process['name'], 0) + 1
-                    self.update_gantt.emit(current_process['name'], self.current_time)
-                    self.update_table.emit(get_live_table(self.processes, self._run_time))
+                if pid is not None:
+                    self.emit_slice(pid)
+                    if timed:
+                        probe.lap('signals')
+                    # Row as it will be once this time unit has been played
+                    row = [dict(self.engine.table[pid], remaining=self.engine.remaining_of(pid) - 1)]
+                    if timed:
+                        probe.lap('table')
+                    self.update_table.emit(row)
+                    if timed:
+                        probe.lap('signals')
 
-                    sleep_or_mwait(self.live, self.time_unit)
-                    self.current_time += 1
+                sleep_or_mwait(self.live, self.time_unit)
+                if timed:
+                    probe.lap('sleep')
+                self.current_time += 1
 
-                # If process completed
-                if self._run_time[current_process['name']] >= current_process['burst']:
-                    self._executed_time[current_process['name']] = self.current_time
-                    self.reschedule_needed = True
-                    continue
+            metrics = engine_metrics(self.engine)
+            if timed:
+                probe.lap('metrics')
 
-                
 
-            avg_wt, avg_tat = calculate_stats(self.processes, self._executed_time)
-            self.update_stats.emit(avg_wt, avg_tat)
-            self.simulation_done.emit()
-            
-            
         except Exception as e:
             print(f"Simulation crashed: {e}")
-            self.running = False
+            metrics = None
 
 
         finally:
             self.running = False
-            print(f"Simulation ended")
+            probe.stop(self.engine.events)
+
+        # After the probe stopped: simulation_done shows its report
+        if metrics is not None:
+            self.update_stats.emit(metrics)
+            self.simulation_done.emit()
+
 
 
-    
+
+    def emit_slice(self, pid):
+        # One Gantt slice per contiguous run: grow it while the same process keeps running
+        if pid != self._slice_pid or self._slice_end != self.current_time:
+            self._slice_pid = pid
+            self._slice_start = self.current_time
+        self._slice_end = self.current_time + 1
+        self.update_slice.emit(self.engine.names[pid], self._slice_start, self._slice_end - self._slice_start)
 
     def current_sim_time(self):
         return self.current_time
-    
+
     def stop(self):
-        self.running = False
\ No newline at end of file
+        self.running = False
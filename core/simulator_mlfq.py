@@ -0,0 +1,5 @@
+from core.simulator import Simulator
+
+
+class SimulatorMLFQ(Simulator):
+    """MLFQ simulator: the engine's feedback queue handles demotion, preemption and boosts."""
@@ -0,0 +1,181 @@
+# gui/compare.py
+
+from PyQt5.QtWidgets import (QDialog, QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem,
+                             QHeaderView, QScrollArea, QSplitter, QMessageBox)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+from core.engine.compare import PolicyComparison
+from core.engine.pool import Cancelled
+from gui.gantt import GanttChartWidget
+from gui.sweep import stop_worker
+
+
+class CompareWorker(QThread):
+    """
+    Runs the comparison (which fans out to worker processes) off the GUI
+    thread. cancel() terminates the worker processes, as in SweepWorker.
+    """
+    compare_done = pyqtSignal(list)
+    compare_failed = pyqtSignal(str)
+
+    def __init__(self, processes, policies):
+        super().__init__()
+        self.processes = processes
+        self.policies = policies
+        self._comparison = None
+        self._cancelled = False
+
+    def run(self):
+        try:
+            with PolicyComparison(self.processes, self.policies) as comparison:
+                self._comparison = comparison
+                if self._cancelled:
+                    return
+                results = comparison.run()
+            self.compare_done.emit(results)
+        except Cancelled:
+            pass
+        except Exception as e:
+            self.compare_failed.emit(str(e))
+
+    def cancel(self):
+        self._cancelled = True
+        if self._comparison is not None:
+            self._comparison.close()
+
+
+# (header, metric getter, format spec, True when lower is better)
+COLUMNS = [
+    ("Avg Waiting", lambda m: m['waiting']['mean'], '.2f', True),
+    ("P95 Waiting", lambda m: m['waiting']['p95'], '.2f', True),
+    ("Avg Turnaround", lambda m: m['turnaround']['mean'], '.2f', True),
+    ("Avg Response", lambda m: m['response']['mean'], '.2f', True),
+    ("Makespan", lambda m: m['makespan'], 'd', True),
+    ("Throughput", lambda m: m['throughput'], '.4f', False),
+    ("CPU Utilization", lambda m: m['cpu_utilization'], '.1%', False),
+    ("Context Switches", lambda m: m['context_switches'], 'd', True),
+]
+
+
+class PolicyComparisonDialog(QDialog):
+    """
+    Runs the current processes under every policy at once and shows one Gantt
+    chart per policy, stacked on a shared time axis (zooming or panning one
+    moves them all), above a metrics table with the best value of each
+    column highlighted. `note`, if given, is shown below the status line.
+    """
+    CHART_HEIGHT = 150
+
+    def __init__(self, processes, policies, parent=None, note=None):
+        super().__init__(parent)
+        self.setWindowTitle("Compare All Policies")
+        self.resize(1000, 800)
+        self.processes = processes
+        self.charts = []
+        self._syncing = False
+
+        layout = QVBoxLayout()
+        self.status_label = QLabel(f"Running {len(policies)} policies on {len(processes)} processes...")
+        layout.addWidget(self.status_label)
+        if note:
+            layout.addWidget(QLabel(note))
+
+        splitter = QSplitter(Qt.Vertical)
+        self.chart_area = QScrollArea()
+        self.chart_area.setWidgetResizable(True)
+        self.chart_box = QWidget()
+        self.chart_layout = QVBoxLayout()
+        self.chart_box.setLayout(self.chart_layout)
+        self.chart_area.setWidget(self.chart_box)
+        splitter.addWidget(self.chart_area)
+
+        self.metrics_table = QTableWidget(0, len(COLUMNS))
+        self.metrics_table.setHorizontalHeaderLabels([column[0] for column in COLUMNS])
+        self.metrics_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.metrics_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        splitter.addWidget(self.metrics_table)
+        splitter.setSizes([550, 250])
+        layout.addWidget(splitter)
+        self.setLayout(layout)
+
+        self.worker = CompareWorker(processes, policies)
+        self.worker.compare_done.connect(self.show_results)
+        self.worker.compare_failed.connect(self.show_error)
+        self.worker.start()
+
+    def show_results(self, results):
+        names = [p['name'] for p in self.processes]
+        end = max((r['start'][-1] + r['duration'][-1] for r in results if len(r['pid'])), default=0)
+        colors = {}
+
+        for result in results:
+            title = QLabel(f"{result['policy']}  ({result['seconds']:.2f} s)")
+            title.setFont(QFont("Segoe UI", 11, QFont.Bold))
+            self.chart_layout.addWidget(title)
+
+            chart = GanttChartWidget()
+            chart.set_lanes(1)
+            chart.setFixedHeight(self.CHART_HEIGHT)
+            chart.add_slices([(names[pid], start, duration)
+                              for pid, start, duration in zip(result['pid'], result['start'], result['duration'])])
+            # Same color for a process in every chart
+            for name, color in chart.process_colors.items():
+                chart.process_colors[name] = colors.setdefault(name, color)
+            chart.extend_to(end)
+            chart.zoom_changed.connect(lambda zoom, source=chart: self._sync_zoom(source, zoom))
+            chart.horizontalScrollBar().valueChanged.connect(lambda value, source=chart: self._sync_scroll(source, value))
+            self.chart_layout.addWidget(chart)
+            self.charts.append(chart)
+
+        self._fill_table(results)
+        slowest = max((r['seconds'] for r in results), default=0.0)
+        self.status_label.setText(f"{len(results)} policies on {len(self.processes)} processes "
+                                  f"(slowest run {slowest:.2f} s). Ctrl + wheel zooms all charts.")
+        if self.charts:
+            # Whole schedule in view once the charts are laid out (the others follow)
+            QTimer.singleShot(0, self.charts[0].fit_to_view)
+
+    def _fill_table(self, results):
+        self.metrics_table.setRowCount(len(results))
+        self.metrics_table.setVerticalHeaderLabels([r['policy'] for r in results])
+        for column, (_, value_of, spec, lower_is_better) in enumerate(COLUMNS):
+            values = [value_of(r['metrics']) for r in results]
+            best = min(values) if lower_is_better else max(values)
+            for row, value in enumerate(values):
+                item = QTableWidgetItem(format(value, spec))
+                item.setTextAlignment(Qt.AlignCenter)
+                if value == best:
+                    item.setForeground(QColor("#81c784"))
+                    item.setFont(QFont("Segoe UI", 10, QFont.Bold))
+                self.metrics_table.setItem(row, column, item)
+
+    def _sync_zoom(self, source, zoom):
+        if self._syncing:
+            return
+        self._syncing = True
+        value = source.horizontalScrollBar().value()
+        for chart in self.charts:
+            if chart is not source:
+                chart.set_zoom(zoom)
+                chart.horizontalScrollBar().setValue(value)
+        self._syncing = False
+
+    def _sync_scroll(self, source, value):
+        if self._syncing:
+            return
+        self._syncing = True
+        for chart in self.charts:
+            if chart is not source:
+                chart.horizontalScrollBar().setValue(value)
+        self._syncing = False
+
+    def show_error(self, message):
+        self.status_label.setText("")
+        QMessageBox.critical(self, "Error", message)
+
+    def done(self, result):
+        # Closing must not wait for the runs (see stop_worker)
+        if self.worker is not None:
+            stop_worker(self.worker)
+            self.worker = None
+        super().done(result)
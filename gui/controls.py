@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QComboBox, QPushButton, QCheckBox, QTableWidget, 
-                            QTableWidgetItem, QSpinBox, QHeaderView, QMessageBox)
+                            QTableWidgetItem, QSpinBox, QHeaderView, QMessageBox, QLineEdit)
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtCore import pyqtSignal, Qt
 from PyQt5.QtGui import QIcon
@@ -10,6 +10,11 @@ import math
 class ControlsWidget(QWidget):
     start_clicked = pyqtSignal()
     process_confirmed = pyqtSignal(dict)
+    speed_changed = pyqtSignal(float)
+    jump_clicked = pyqtSignal()
+    sweep_clicked = pyqtSignal()
+    compare_clicked = pyqtSignal()
+    open_schedule_clicked = pyqtSignal()
 
     def __init__(self):
         super().__init__()
@@ -28,7 +33,7 @@ class ControlsWidget(QWidget):
         hlayout = QHBoxLayout()
         hlayout.addWidget(QLabel("Scheduler Type:"))
         self.scheduler_box = QComboBox()
-        self.scheduler_box.addItems(["FCFS", "SJF", "SRTF", "Priority (preemptive)", "Priority (non-preemptive)", "Round Robin"])
+        self.scheduler_box.addItems(["FCFS", "SJF", "SRTF", "Priority (preemptive)", "Priority (non-preemptive)", "Round Robin", "MLFQ"])
         self.scheduler_box.currentIndexChanged.connect(self.update_scheduler_fields)
         hlayout.addWidget(self.scheduler_box)
 
@@ -37,8 +42,43 @@ class ControlsWidget(QWidget):
         self.live_checkbox.setChecked(True)
         self.live_checkbox.stateChanged.connect(self.toggle_live_mode)
         hlayout.addWidget(self.live_checkbox)
+        # Time every part of the simulation loop and show a report at the end
+        self.profile_checkbox = QCheckBox("Profile Run")
+        hlayout.addWidget(self.profile_checkbox)
         controls_layout.addLayout(hlayout)
 
+        # CPUs: with more than one, the schedule is computed for all of them and replayed
+        cpu_layout = QHBoxLayout()
+        cpu_layout.addWidget(QLabel("CPUs:"))
+        self.cpu_input = QSpinBox()
+        self.cpu_input.setRange(1, 64)
+        self.cpu_input.setValue(1)
+        self.cpu_input.valueChanged.connect(self.update_cpu_fields)
+        cpu_layout.addWidget(self.cpu_input)
+        self.migration_label = QLabel("Migration Cost:")
+        cpu_layout.addWidget(self.migration_label)
+        self.migration_input = QSpinBox()
+        self.migration_input.setRange(0, 100)
+        cpu_layout.addWidget(self.migration_input)
+        self.per_core_checkbox = QCheckBox("Per-core queues")
+        cpu_layout.addWidget(self.per_core_checkbox)
+        controls_layout.addLayout(cpu_layout)
+
+        # Playback speed: without live simulation the schedule is computed at once and replayed
+        speed_layout = QHBoxLayout()
+        self.speed_label = QLabel("Playback Speed:")
+        speed_layout.addWidget(self.speed_label)
+        self.speed_box = QComboBox()
+        self.speed_box.addItems(["1x", "10x", "100x", "1000x", "10000x"])
+        self.speed_box.currentIndexChanged.connect(lambda: self.speed_changed.emit(self.get_playback_speed()))
+        speed_layout.addWidget(self.speed_box)
+        self.jump_button = QPushButton("Jump to End")
+        self.jump_button.clicked.connect(self.jump_clicked.emit)
+        speed_layout.addWidget(self.jump_button)
+        controls_layout.addLayout(speed_layout)
+        for widget in (self.speed_label, self.speed_box, self.jump_button):
+            widget.setVisible(False)
+
 
 
 
@@ -82,6 +122,16 @@ class ControlsWidget(QWidget):
         self.start_button.clicked.connect(self.start_clicked.emit)
         controls_layout.addWidget(self.start_button)
 
+        # Every policy on the current processes at once, side by side
+        self.compare_button = QPushButton("Compare All Policies...")
+        self.compare_button.clicked.connect(self.compare_clicked.emit)
+        controls_layout.addWidget(self.compare_button)
+
+        # A saved schedule file (batch.py --schedules) in the Gantt chart
+        self.open_schedule_button = QPushButton("Open Schedule...")
+        self.open_schedule_button.clicked.connect(self.open_schedule_clicked.emit)
+        controls_layout.addWidget(self.open_schedule_button)
+
         main_layout.addLayout(controls_layout)
 
         
@@ -99,15 +149,29 @@ class ControlsWidget(QWidget):
 
         self.setLayout(main_layout)
         self.update_scheduler_fields()
+        self.update_cpu_fields()
 
 
     def set_simulator(self, simulator):
         self.simulator = simulator
 
+    def set_adding_enabled(self, enabled):
+        """Process injection is only possible in live runs (a replay's schedule is computed up front)"""
+        for button in (self.add_row_button, self.confirm_add_button):
+            button.setEnabled(enabled)
+            button.setToolTip("" if enabled else "Processes cannot be added to a replayed (multi-CPU) schedule")
+
     def toggle_live_mode(self, state):
         self.add_row_button.setVisible(state == Qt.Checked)
+        for widget in (self.speed_label, self.speed_box, self.jump_button):
+            widget.setVisible(state != Qt.Checked)
+
 
 
+    def update_cpu_fields(self):
+        multi = self.cpu_input.value() > 1
+        for widget in (self.migration_label, self.migration_input, self.per_core_checkbox):
+            widget.setVisible(multi)
 
     def update_scheduler_fields(self):
         for i in reversed(range(self.dynamic_layout.count())):
@@ -124,6 +188,27 @@ class ControlsWidget(QWidget):
             self.quantum_input.setRange(1, 100)
             self.dynamic_layout.addWidget(self.quantum_label)
             self.dynamic_layout.addWidget(self.quantum_input)
+            self.sweep_button = QPushButton("Quantum Sweep...")
+            self.sweep_button.clicked.connect(self.sweep_clicked.emit)
+            self.dynamic_layout.addWidget(self.sweep_button)
+            self.process_table.setColumnCount(3)
+            self.process_table.setHorizontalHeaderLabels(["Name", "Arrival", "Burst"])
+
+        elif scheduler_type == "MLFQ":
+            # One quantum per level, top level first
+            self.quanta_label = QLabel("Level Quanta:")
+            self.quanta_input = QLineEdit("2, 4, 8")
+            self.quanta_input.setFixedWidth(120)
+            self.dynamic_layout.addWidget(self.quanta_label)
+            self.dynamic_layout.addWidget(self.quanta_input)
+            self.boost_label = QLabel("Priority Boost Every:")
+            self.boost_input = QSpinBox()
+            self.boost_input.setFixedWidth(80)
+            self.boost_input.setRange(0, 10000)
+            self.boost_input.setSpecialValueText("Off")
+            self.boost_input.setValue(50)
+            self.dynamic_layout.addWidget(self.boost_label)
+            self.dynamic_layout.addWidget(self.boost_input)
             self.process_table.setColumnCount(3)
             self.process_table.setHorizontalHeaderLabels(["Name", "Arrival", "Burst"])
 
@@ -135,6 +220,12 @@ class ControlsWidget(QWidget):
             self.process_table.setColumnCount(3)
             self.process_table.setHorizontalHeaderLabels(["Name", "Arrival", "Burst"])
 
+        # MLFQ is only simulated on one CPU
+        mlfq = scheduler_type == "MLFQ"
+        if mlfq:
+            self.cpu_input.setValue(1)
+        self.cpu_input.setEnabled(not mlfq)
+
     def _get_item_text(self, row, col):
         item = self.process_table.item(row, col)
         return item.text().strip() if item else "0"
@@ -142,9 +233,44 @@ class ControlsWidget(QWidget):
     def get_scheduler_type(self):
         return self.scheduler_box.currentText()
 
+    def get_mlfq_settings(self):
+        """(quanta, boost period or None) from the MLFQ fields; ValueError if the quanta are invalid"""
+        try:
+            quanta = tuple(int(q) for q in self.quanta_input.text().replace(",", " ").split())
+        except ValueError:
+            raise ValueError("Level quanta must be whole numbers, e.g. 2, 4, 8")
+        if not quanta or min(quanta) < 1:
+            raise ValueError("Enter at least one level quantum, each at least 1")
+        return quanta, self.boost_input.value() or None
+
+    def get_policy_settings(self):
+        """(quantum, MLFQ quanta or None, MLFQ boost) from whichever of those fields are shown"""
+        scheduler_type = self.get_scheduler_type()
+        quantum = self.quantum_input.value() if scheduler_type == "Round Robin" else 2
+        if scheduler_type == "MLFQ":
+            quanta, boost = self.get_mlfq_settings()
+            return quantum, quanta, boost
+        return quantum, None, 50
+
+    def is_profiling(self):
+        return self.profile_checkbox.isChecked()
+
     def is_live_mode(self):
         return self.live_checkbox.isChecked()
 
+    def get_cpu_count(self):
+        return self.cpu_input.value()
+
+    def get_migration_cost(self):
+        return self.migration_input.value()
+
+    def is_per_core_queues(self):
+        return self.per_core_checkbox.isChecked()
+
+    def get_playback_speed(self):
+        # Time units per second
+        return float(self.speed_box.currentText().rstrip("x"))
+
     def get_processes(self):
         processes = []
         has_error = False  # Flag to track if any error occurred
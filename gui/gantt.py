@@ -1,17 +1,212 @@
-from PyQt5.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsTextItem, QGraphicsPathItem, QGraphicsRectItem
-)
+from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
 from PyQt5.QtGui import (
     QColor, QBrush, QPen, QPainter, QPainterPath, QLinearGradient, QFont
 )
-from PyQt5.QtCore import QRectF, Qt
+from PyQt5.QtCore import QRectF, QLineF, Qt, pyqtSignal
+from array import array
+from bisect import bisect_left, bisect_right
 import random
+import numpy as np
 from PyQt5.QtMultimedia import QSoundEffect
 from PyQt5.QtCore import QUrl
 import os
+from utils.schedule_file import ScheduleFile
+
+
+class GanttLane:
+    """Slices of one CPU in compact arrays sorted by time"""
+
+    def __init__(self):
+        self.starts = array('q')
+        self.ends = array('q')
+        self.busy_before = array('q')   # total duration of all earlier slices (prefix sum)
+        self.slice_names = array('l')   # index into GanttChartWidget.names
+
+    def __len__(self):
+        return len(self.starts)
+
+    def append(self, name_id, start, end):
+        # Returns True when a new slice was started, False when the live one grew
+        if self.starts and self.starts[-1] == start and self.slice_names[-1] == name_id:
+            self.ends[-1] = end
+            return False
+        prior = self.busy_before[-1] + self.ends[-1] - self.starts[-1] if self.starts else 0
+        self.starts.append(start)
+        self.ends.append(end)
+        self.busy_before.append(prior)
+        self.slice_names.append(name_id)
+        return True
+
+    def truncate(self, t):
+        """Drops the slices starting at or after t and cuts the one running at t"""
+        i = bisect_left(self.starts, t)
+        del self.starts[i:], self.ends[i:], self.busy_before[i:], self.slice_names[i:]
+        if i and self.ends[-1] > t:
+            self.ends[-1] = t
+
+    def busy_between(self, a, b):
+        """Time spent running anything in [a, b), in O(log n)"""
+        lo = bisect_right(self.ends, a)
+        hi = bisect_left(self.starts, b)
+        if lo >= hi:
+            return 0
+        total = self.busy_before[hi - 1] - self.busy_before[lo] + self.ends[hi - 1] - self.starts[hi - 1]
+        total -= max(0, a - self.starts[lo])
+        total -= max(0, self.ends[hi - 1] - b)
+        return total
+
+    # Drawing interface, shared with MappedLane. A slice's key is its index
+    # into GanttChartWidget.names.
+
+    def visible(self, t0, t1):
+        """Index range of the slices intersecting [t0, t1)"""
+        return bisect_right(self.ends, t0), bisect_left(self.starts, t1)
+
+    def blocks(self, lo, hi):
+        """(start, end, key) of slices lo to hi"""
+        return zip(self.starts[lo:hi], self.ends[lo:hi], self.slice_names[lo:hi])
+
+    def density(self, edges):
+        """
+        (busy fraction, key of the slice started last by the middle) for each
+        bucket between consecutive edges
+        """
+        buckets = []
+        for a, b in zip(edges, edges[1:]):
+            i = bisect_right(self.starts, (a + b) / 2) - 1
+            buckets.append((min(1.0, self.busy_between(a, b) / (b - a)), self.slice_names[max(i, 0)]))
+        return buckets
+
+    def end_time(self):
+        return self.ends[-1] if self.ends else 0
+
+
+class MappedLane:
+    """
+    Slices of one CPU read from a schedule file (utils.schedule_file) through
+    its memory map. Nothing is loaded up front: the slices in view are found
+    by binary search over the start column, so only the pages on screen are
+    ever read. `rows` lists the records of this CPU when the file holds
+    several (None: every record). A slice's key is its pid.
+    """
+    SAMPLES = 4   # points per density bucket
+
+    def __init__(self, schedule, rows=None):
+        self.start = schedule.start
+        self.duration = schedule.duration
+        self.pid = schedule.pid
+        self.rows = rows
+
+    def __len__(self):
+        return len(self.start) if self.rows is None else len(self.rows)
+
+    def _records(self, positions):
+        # Record numbers of lane positions (an int64 array)
+        return positions if self.rows is None else self.rows[positions]
+
+    def _search(self, times, side='right'):
+        """Lane positions where integer times would be inserted, as np.searchsorted"""
+        if self.rows is None:
+            return np.searchsorted(self.start, times, side)
+        # Same search through the row index, all times at once
+        lo = np.zeros(len(times), dtype=np.int64)
+        hi = np.full(len(times), len(self.rows), dtype=np.int64)
+        while True:
+            active = lo < hi
+            if not active.any():
+                return lo
+            mid = (lo + hi) // 2
+            starts = self.start[self.rows[np.minimum(mid, len(self.rows) - 1)]]
+            right = (starts <= times) if side == 'right' else (starts < times)
+            lo = np.where(active & right, mid + 1, lo)
+            hi = np.where(active & ~right, mid, hi)
+
+    def visible(self, t0, t1):
+        """Index range of the slices intersecting [t0, t1)"""
+        lo = int(self._search(np.array([t0], dtype=np.int64))[0])
+        hi = int(self._search(np.array([t1], dtype=np.int64), 'left')[0])
+        # Slices of one CPU never overlap: only the last one started by t0 can still run
+        if lo:
+            row = self._records(np.array([lo - 1]))[0]
+            if self.start[row] + self.duration[row] > t0:
+                lo -= 1
+        return lo, max(lo, hi)
+
+    def blocks(self, lo, hi):
+        """(start, end, key) of slices lo to hi"""
+        rows = self._records(np.arange(lo, hi))
+        starts = self.start[rows]
+        return zip(starts.tolist(), (starts + self.duration[rows]).tolist(), self.pid[rows].tolist())
+
+    def density(self, edges):
+        """
+        (busy fraction, key of the slice started last by the middle) for each
+        bucket between consecutive edges. The busy fraction is sampled at
+        SAMPLES points per bucket, so a repaint costs a few binary searches
+        per bucket however many slices the bucket holds.
+        """
+        edges = np.asarray(edges, dtype=np.float64)
+        offsets = (np.arange(self.SAMPLES) + 0.5) / self.SAMPLES
+        times = (edges[:-1, None] + np.diff(edges)[:, None] * offsets).ravel()
+        last = self._search(np.floor(times).astype(np.int64)) - 1
+        rows = self._records(np.maximum(last, 0))
+        running = (last >= 0) & (self.start[rows] + self.duration[rows] > times)
+        busy = running.reshape(-1, self.SAMPLES).mean(axis=1)
+        keys = self.pid[rows].reshape(-1, self.SAMPLES)[:, self.SAMPLES // 2]
+        return zip(busy.tolist(), keys.tolist())
+
+    def end_time(self):
+        if not len(self):
+            return 0
+        row = self._records(np.array([len(self) - 1]))[0]
+        return int(self.start[row] + self.duration[row])
+
+
+def schedule_lanes(schedule, chunk=1 << 20):
+    """
+    One MappedLane per CPU of a ScheduleFile. A single-CPU file is used as
+    is. With several CPUs each lane views its CPU's records as listed in the
+    file; files written without that list have the records of each CPU
+    listed here, `chunk` records at a time (4 bytes per slice below 2**32
+    slices), which reads the whole cpu column.
+    """
+    cpus = schedule.cpus
+    if cpus <= 1:
+        return [MappedLane(schedule)]
+    lanes = schedule.lanes()
+    if lanes is not None:
+        return [MappedLane(schedule, rows) for rows in lanes]
+    dtype = np.uint32 if len(schedule) < 2 ** 32 else np.int64
+    parts = [[] for _ in range(cpus)]
+    for lo in range(0, len(schedule), chunk):
+        cpu = schedule.cpu[lo:lo + chunk]
+        # Stable: each CPU keeps its records in file order, which is start order
+        order = np.argsort(cpu, kind='stable').astype(dtype) + dtype(lo)
+        bounds = np.cumsum(np.bincount(cpu, minlength=cpus)).tolist()
+        for part, a, b in zip(parts, [0] + bounds[:-1], bounds):
+            part.append(order[a:b])
+    return [MappedLane(schedule, np.concatenate(part)) for part in parts]
 
 
 class GanttChartWidget(QGraphicsView):
+    """
+    Virtualized Gantt chart, one lane per CPU.
+    Slices are kept in compact arrays sorted by time and painted on demand in
+    drawForeground, so only the visible window is ever drawn and the scene holds
+    no items. When zoomed out, slices narrower than MIN_BLOCK_PX are merged into
+    density bars (busy fraction per bucket of BUCKET_PX pixels).
+    A saved schedule file can be shown instead (open_schedule): its lanes read
+    the memory-mapped file directly, whatever its size.
+    Ctrl + wheel zooms around the cursor, wheel / drag pans.
+    """
+    zoom_changed = pyqtSignal(float)   # lets stacked charts share one time axis
+    MIN_BLOCK_PX = 6
+    MIN_LANE_PX = 16
+    LANE_GAP = 4
+    BUCKET_PX = 4
+    LABEL_SPACING_PX = 80
+    MAX_SCENE_PX = 2 ** 30   # keeps the scroll bar range inside an int
+
     def __init__(self):
         super().__init__()
         self.scene = QGraphicsScene()
@@ -28,66 +223,264 @@ class GanttChartWidget(QGraphicsView):
 
         self.setMinimumHeight(120)
         self.setRenderHint(QPainter.Antialiasing)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
 
-        # Zoom
+        # Zoom: pixels per time unit = block_width * _zoom
         self._zoom = 1.0
+        self.schedule = None      # ScheduleFile on display, if any
+        self._reset_slices()
 
-    def add_block(self, process_name, time_unit):
-        if process_name not in self.process_colors:
-            self.process_colors[process_name] = self._random_color()
+    def _reset_slices(self, lanes=1):
+        schedule = self.schedule
+        self.lanes = [GanttLane() for _ in range(lanes)]
+        self.names = []
+        self._name_ids = {}
+        self.schedule = None
+        self._pid_colors = {}     # its process colors, by pid
+        if schedule is not None:
+            schedule.close()      # now that its lanes, which view the file, are gone
 
-        color = self.process_colors[process_name]
-        x = time_unit * self.block_width
+    # ---- data ------------------------------------------------------------
 
-        # Rounded block with gradient fill
-        rect = QRectF(x, 0, self.block_width, self.block_height)
-        path = QPainterPath()
-        path.addRoundedRect(rect, 18, 18)
+    def add_slice(self, process_name, start, duration, cpu=0):
+        """Adds the slice [start, start + duration) on a CPU lane, or grows it if it is the live one"""
+        if self._append_slice(process_name, start, start + duration, cpu):
+            self.sound.play()
+        self._refresh()
 
-        gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-        gradient.setColorAt(0, color.lighter(120))
-        gradient.setColorAt(1, color.darker(110))
+    def add_slices(self, slices):
+        """Bulk version of add_slice for a list of (name, start, duration[, cpu]), with a single repaint"""
+        for s in slices:
+            self._append_slice(s[0], s[1], s[1] + s[2], s[3] if len(s) > 3 else 0)
+        self._refresh()
+
+    def truncate(self, t):
+        """Shows the chart as it was at time t (slices after t are dropped, colors are kept)"""
+        for lane in self.lanes:
+            lane.truncate(t)
+        self.current_time = max((lane.ends[-1] for lane in self.lanes if lane.ends), default=0)
+        self._update_scene_rect()
+        self.viewport().update()
+
+    def extend_to(self, t):
+        """Makes the time axis reach at least t, e.g. so stacked charts share one axis"""
+        self.current_time = max(self.current_time, t)
+        self._update_scene_rect()
+        self.viewport().update()
 
-        rounded_rect = QGraphicsPathItem(path)
-        rounded_rect.setBrush(QBrush(gradient))
-        rounded_rect.setPen(QPen(Qt.transparent))
-        rounded_rect.setToolTip(f"Process: {process_name}\nTime: {time_unit}")
-        self.scene.addItem(rounded_rect)
-
-        # Adaptive text color (based on background)
-        text_color = Qt.white if color.lightness() < 128 else Qt.black
-
-        # Process label (inside block)
-        text = QGraphicsTextItem(process_name)
-        text.setDefaultTextColor(text_color)
-        text.setFont(QFont("Poppins", 20))
-        text.setPos(x + 8, 8)
-        text.setZValue(1)
-        self.scene.addItem(text)
-
-        # Time label (below block)
-        time_text = QGraphicsTextItem(str(time_unit))
-        time_text.setDefaultTextColor(Qt.white)
-        time_text.setFont(QFont("Segoe UI", 15))
-        time_text.setPos(x , self.block_height + 5)
-        self.scene.addItem(time_text)
-        self.sound.play()
-
-        # Grid line
-        line = self.scene.addLine(x, 0, x, self.block_height + 30, QPen(Qt.lightGray, 0.5))
-        line.setZValue(-1)
-
-        self.current_time += 1
-        self.setSceneRect(0, 0, (time_unit + 2) * self.block_width, self.block_height + 40)
-
-        # Auto scroll to latest block
-        self.horizontalScrollBar().setValue(self.horizontalScrollBar().maximum())
-        
+    def open_schedule(self, path):
+        """
+        Shows the schedule file at `path` (see utils.schedule_file) in place of
+        the current slices. The file is memory-mapped and only the slices in
+        view are read, so memory follows the screen, not the file, and the
+        file opens at once (but see schedule_lanes for older multi-CPU files).
+        A process name is looked up in the file when its label is drawn.
+        set_lanes / clear_chart go back to live slices; they, or opening
+        another file, close the file.
+        """
+        schedule = ScheduleFile(path)
+        lanes = schedule_lanes(schedule)
+        schedule.advise_random()
+        self.clear_chart()
+        self.lanes = lanes
+        self.schedule = schedule
+        self.current_time = max(lane.end_time() for lane in lanes)
+        self.setMinimumHeight(min(400, max(120, self._axis_y() + 60)))
+        self.fit_to_view()
+        return schedule
+
+    def set_lanes(self, count):
+        """Clears the chart and shows `count` CPU lanes"""
+        self.clear_chart()
+        self._reset_slices(count)
+        self.setMinimumHeight(min(400, max(120, self._axis_y() + 60)))
+        self._update_scene_rect()
+
+    def _append_slice(self, process_name, start, end, cpu=0):
+        # Returns True when a new slice was started
+        self.current_time = max(self.current_time, end)
+        if process_name not in self._name_ids:
+            self._name_ids[process_name] = len(self.names)
+            self.names.append(process_name)
+            self.process_colors[process_name] = self._random_color()
+        while cpu >= len(self.lanes):
+            self.lanes.append(GanttLane())
+        return self.lanes[cpu].append(self._name_ids[process_name], start, end)
+
+    def _refresh(self):
+        bar = self.horizontalScrollBar()
+        follow = bar.value() >= bar.maximum()
+        self._update_scene_rect()
+
+        # Auto scroll to latest block, unless the user panned away
+        if follow:
+            bar.setValue(bar.maximum())
+        self.viewport().update()
 
     def clear_chart(self):
-        self.scene.clear()
+        self._reset_slices(len(self.lanes))
         self.current_time = 0
         self.process_colors = {}
+        self._update_scene_rect()
+        self.viewport().update()
+
+    def busy_between(self, a, b, cpu=0):
+        """Time CPU `cpu` spent running anything in [a, b), in O(log n)"""
+        return self.lanes[cpu].busy_between(a, b)
+
+    def _process(self, key):
+        # (name, color) of a slice key: a name id, or a pid of the open schedule file
+        if self.schedule is None:
+            name = self.names[key]
+            return name, self.process_colors[name]
+        color = self._pid_colors.get(key)
+        if color is None:
+            color = self._pid_colors[key] = self._random_color()
+        return None, color
+
+    def _label(self, key):
+        return self.names[key] if self.schedule is None else self.schedule.name(key)
+
+    def lane_height(self):
+        # Full height for a single CPU, thinner lanes (down to MIN_LANE_PX) for more
+        return max(self.MIN_LANE_PX, 2 * self.block_height // (len(self.lanes) + 1))
+
+    def _axis_y(self):
+        return len(self.lanes) * (self.lane_height() + self.LANE_GAP) - self.LANE_GAP
+
+    # ---- zoom / pan -------------------------------------------------------
+
+    def time_scale(self):
+        return self.block_width * self._zoom
+
+    def set_zoom(self, zoom, anchor_x=None):
+        """Changes the zoom while keeping the time under anchor_x (viewport pixels) in place"""
+        bar = self.horizontalScrollBar()
+        if anchor_x is None:
+            anchor_x = self.viewport().width() / 2
+        anchor_time = (bar.value() + anchor_x) / self.time_scale()
+
+        span = (self.current_time + 2) * self.block_width
+        max_zoom = min(4.0, self.MAX_SCENE_PX / span)
+        fit_zoom = min(self.viewport().width() / span, max_zoom)
+        old = self._zoom
+        self._zoom = min(max(zoom, fit_zoom), max_zoom)
+
+        self._update_scene_rect()
+        bar.setValue(int(anchor_time * self.time_scale() - anchor_x))
+        self.viewport().update()
+        if self._zoom != old:
+            self.zoom_changed.emit(self._zoom)
+
+    def fit_to_view(self):
+        self.set_zoom(0)
+        self.horizontalScrollBar().setValue(0)
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.ControlModifier:
+            factor = 1.25 if event.angleDelta().y() > 0 else 0.8
+            self.set_zoom(self._zoom * factor, event.pos().x())
+        else:
+            bar = self.horizontalScrollBar()
+            bar.setValue(bar.value() - event.angleDelta().y())
+
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        self.viewport().update()
+
+    def _update_scene_rect(self):
+        span = (self.current_time + 2) * self.block_width
+        if span * self._zoom > self.MAX_SCENE_PX:
+            self._zoom = self.MAX_SCENE_PX / span
+        width = span * self._zoom
+        self.setSceneRect(0, 0, width, self._axis_y() + 40)
+
+    # ---- painting ---------------------------------------------------------
+
+    def drawForeground(self, painter, rect):
+        scale = self.time_scale()
+        t0 = max(0, int(rect.left() / scale))
+        t1 = int(rect.right() / scale) + 1
+        height = self.lane_height()
+
+        for cpu, lane in enumerate(self.lanes):
+            top = cpu * (height + self.LANE_GAP)
+            if top > rect.bottom() or top + height < rect.top():
+                continue
+            lo, hi = lane.visible(t0, t1)
+            if hi - lo > rect.width() / self.MIN_BLOCK_PX:
+                self._draw_density(painter, rect, scale, lane, top, height)
+            else:
+                for start, end, key in lane.blocks(lo, hi):
+                    self._draw_block(painter, key, start, end, scale, top, height)
+            if len(self.lanes) > 1:
+                painter.setPen(QPen(Qt.lightGray))
+                painter.setFont(QFont("Segoe UI", max(7, min(12, height // 2))))
+                painter.drawText(QRectF(rect.left() + 4, top, 80, height), Qt.AlignLeft | Qt.AlignTop, f"CPU {cpu}")
+        self._draw_time_axis(painter, t0, t1, scale)
+
+    def _draw_block(self, painter, key, start, end, scale, top, height):
+        name, color = self._process(key)
+        x = start * scale
+        width = (end - start) * scale
+        block = QRectF(x, top, width, height)
+
+        gradient = QLinearGradient(block.topLeft(), block.bottomLeft())
+        gradient.setColorAt(0, color.lighter(120))
+        gradient.setColorAt(1, color.darker(110))
+        painter.setBrush(QBrush(gradient))
+        painter.setPen(QPen(Qt.transparent))
+        if width >= 36:
+            path = QPainterPath()
+            radius = min(18, height / 3)
+            path.addRoundedRect(block, radius, radius)
+            painter.drawPath(path)
+        else:
+            painter.drawRect(block)
+
+        # Process label (inside block) when it fits, adaptive text color
+        if width >= 30 and height >= self.MIN_LANE_PX:
+            painter.setPen(QPen(Qt.white if color.lightness() < 128 else Qt.black))
+            size = 20 if width >= 55 else 10
+            painter.setFont(QFont("Poppins", min(size, max(7, height // 3))))
+            painter.drawText(block.adjusted(8, 0, 0, 0), Qt.AlignLeft | Qt.AlignVCenter, name or self._label(key))
+
+    def _draw_density(self, painter, rect, scale, lane, top, height):
+        painter.setPen(QPen(Qt.transparent))
+        xs = []
+        x = rect.left() - rect.left() % self.BUCKET_PX
+        while x < rect.right():
+            xs.append(x)
+            x += self.BUCKET_PX
+        edges = [x / scale for x in xs] + [x / scale]
+        for x, (busy, key) in zip(xs, lane.density(edges)):
+            if busy > 0:
+                bar = height * busy
+                # Color of whatever runs in the middle of the bucket
+                painter.setBrush(QBrush(self._process(key)[1]))
+                painter.drawRect(QRectF(x, top + height - bar, self.BUCKET_PX, bar))
+
+    def _draw_time_axis(self, painter, t0, t1, scale):
+        # Label step is the smallest 1/2/5 * 10^k that keeps labels LABEL_SPACING_PX apart
+        step = 1
+        while step * scale < self.LABEL_SPACING_PX:
+            for m in (2, 5, 10):
+                if step * m * scale >= self.LABEL_SPACING_PX or m == 10:
+                    step *= m
+                    break
+
+        painter.setFont(QFont("Segoe UI", 15))
+        axis_y = self._axis_y()
+        t = t0 - t0 % step
+        while t <= t1:
+            x = t * scale
+            painter.setPen(QPen(Qt.lightGray, 0.5))
+            painter.drawLine(QLineF(x, 0, x, axis_y + 30))
+            painter.setPen(QPen(Qt.white))
+            painter.drawText(QRectF(x, axis_y + 5, self.LABEL_SPACING_PX, 30), Qt.AlignLeft, str(t))
+            t += step
 
     def _random_color(self):
         return QColor(
@@ -95,4 +488,3 @@ class GanttChartWidget(QGraphicsView):
             random.randint(70, 200),
             random.randint(70, 200)
         )
-
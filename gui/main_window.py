@@ -2,7 +2,7 @@ from PyQt5 import QtWidgets
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                             QComboBox, QPushButton, QCheckBox, QTableWidget, 
                             QTableWidgetItem, QSpinBox, QHeaderView, QMessageBox)
-from PyQt5.QtWidgets import QMainWindow, QMessageBox, QStackedLayout
+from PyQt5.QtWidgets import QMainWindow, QMessageBox, QStackedLayout, QSlider, QFileDialog
 from gui.controls import ControlsWidget
 from gui.gantt import GanttChartWidget
 from gui.tables import ProcessTableWidget, StatsWidget
@@ -11,12 +11,19 @@ from core.simulator import Simulator
 from core.simulator_RR import SimulatorPreem  # Import the new SimulatorPreem
 from core.simulator_pri import SimulatorPriority
 from core.simulator_preem import SimulatorPreemitives
+from core.simulator_mlfq import SimulatorMLFQ
+from core.replay import ReplaySimulator
+from gui.sweep import QuantumSweepDialog
+from gui.compare import PolicyComparisonDialog
+from core.engine.compare import all_policies
+from utils.instrument import Instrument, DISABLED
 from core.schedulers.fcfs import FCFSScheduler
 from core.schedulers.sjf import SJFScheduler
 from core.schedulers.srtf import SRTFScheduler
 from core.schedulers.priority_preem import priority_preem
 from core.schedulers.priority_nonpreem import PriorityNonPreemptiveScheduler
 from core.schedulers.round_robin import RRScheduler
+from core.schedulers.mlfq import MLFQScheduler
 from PyQt5.QtMultimedia import QSoundEffect
 from PyQt5.QtCore import QUrl
 from PyQt5.QtGui import QIcon
@@ -38,6 +45,7 @@ class MainWindow(QMainWindow):
 
         self.simulator = None
         self.simulation_started = False
+        self.probe = DISABLED
 
 
         self.finish_sound = QSoundEffect()
@@ -83,6 +91,18 @@ class MainWindow(QMainWindow):
 
         # Add the container to your layout
         layout.addWidget(self.gantt_chart)
+
+        # Seek bar for replayed schedules: drag or click to jump to any time
+        seek_layout = QHBoxLayout()
+        self.seek_slider = QSlider(QtCore.Qt.Horizontal)
+        self.seek_slider.valueChanged.connect(self.seek_to)
+        self.seek_label = QLabel("t = 0")
+        self.seek_label.setMinimumWidth(90)
+        seek_layout.addWidget(self.seek_slider)
+        seek_layout.addWidget(self.seek_label)
+        layout.addLayout(seek_layout)
+        self.seek_slider.hide()
+        self.seek_label.hide()
         
 
         h_layout = QHBoxLayout()
@@ -96,6 +116,11 @@ class MainWindow(QMainWindow):
 
         self.controls.start_clicked.connect(self.start_simulation)
         self.controls.process_confirmed.connect(self.handle_confirmed_process)
+        self.controls.speed_changed.connect(self.change_playback_speed)
+        self.controls.jump_clicked.connect(self.jump_to_end)
+        self.controls.sweep_clicked.connect(self.open_quantum_sweep)
+        self.controls.compare_clicked.connect(self.open_comparison)
+        self.controls.open_schedule_clicked.connect(self.open_schedule_file)
 
 
 
@@ -125,56 +150,94 @@ class MainWindow(QMainWindow):
                 scheduler = PriorityNonPreemptiveScheduler()
             elif scheduler_type == "Round Robin":
                 scheduler = RRScheduler()
+            elif scheduler_type == "MLFQ":
+                quanta, boost = self.controls.get_mlfq_settings()
+                scheduler = MLFQScheduler(quanta, boost)
             else:
                 QMessageBox.warning(self, "Error", "Unsupported scheduler")
                 return
 
 
 
+            live = self.controls.is_live_mode()
+            quan = None
+            if scheduler_type == "Round Robin":
+                quan = self.controls.quantum_input.value() if hasattr(self.controls, "quantum_input") else 2
+
+            cpus = self.controls.get_cpu_count()
+            self.probe = Instrument(profile=True) if self.controls.is_profiling() else DISABLED
+
             # Instantiate the chosen simulator
-            if scheduler_type == "FCFS" or scheduler_type == "SJF" :
+            if not live or cpus > 1:
+                # Compute the whole schedule now and replay it at the chosen speed
+                # (live with several CPUs: replayed at 1 unit per second)
+                self.simulator = ReplaySimulator(
+                    scheduler=scheduler,
+                    processes=processes,
+                    quantum=quan,
+                    speed=self.controls.get_playback_speed() if not live else 1.0,
+                    cpus=cpus,
+                    migration_cost=self.controls.get_migration_cost(),
+                    per_core_queues=self.controls.is_per_core_queues(),
+                    probe=self.probe
+                )
+            elif scheduler_type == "FCFS" or scheduler_type == "SJF" :
                 self.simulator = Simulator(
                     scheduler=scheduler,
                     processes=processes,
                     time_unit=1,
-                    live=self.controls.is_live_mode()
+                    live=live,
+                    probe=self.probe
                 )
-            if scheduler_type == "SRTF" :
+            elif scheduler_type == "SRTF" :
                 self.simulator = SimulatorPreemitives(
                     scheduler=scheduler,
                     processes=processes,
                     time_unit=1,
-                    live=self.controls.is_live_mode()
+                    live=live,
+                    probe=self.probe
                 )
             elif  scheduler_type == "Round Robin" :
-                quan = self.controls.quantum_input.value() if hasattr(self.controls, "quantum_input") else 2
                 self.simulator = SimulatorPreem(  # Use SimulatorPreem if selected
                     scheduler=scheduler,
                     processes=processes,
                     time_unit=1,
-                    live=self.controls.is_live_mode(),
-                    quantum=quan
+                    live=live,
+                    quantum=quan,
+                    probe=self.probe
+                )
+            elif scheduler_type == "MLFQ":
+                self.simulator = SimulatorMLFQ(
+                    scheduler=scheduler,
+                    processes=processes,
+                    time_unit=1,
+                    live=live,
+                    probe=self.probe
                 )
             elif scheduler_type == "Priority (preemptive)" or scheduler_type == "Priority (non-preemptive)" :
                 self.simulator = SimulatorPriority(
                     scheduler=scheduler,
                     processes=processes,
                     time_unit=1,
-                    live=self.controls.is_live_mode()
+                    live=live,
+                    probe=self.probe
                 )
 
             self.controls.set_simulator(self.simulator)
+            self.controls.set_adding_enabled(not isinstance(self.simulator, ReplaySimulator))
             self.controls.has_pending_process = False  
 
 
-            self.simulator.update_gantt.connect(self.gantt_chart.add_block)
+            self.simulator.update_slice.connect(self.gantt_chart.add_slice)
+            if isinstance(self.simulator, ReplaySimulator):
+                self.simulator.update_slices.connect(self.gantt_chart.add_slices)
             self.simulator.update_table.connect(self.table_widget.update_table)
             self.simulator.update_stats.connect(self.stats_widget.update_stats)
             self.simulator.simulation_done.connect(self.simulation_complete)
 
-            self.gantt_chart.clear_chart()
-            self.table_widget.update_table([])
-            self.stats_widget.update_stats(0, 0)
+            self.gantt_chart.set_lanes(cpus)
+            self.table_widget.clear_table()
+            self.stats_widget.clear_stats()
 
             self.simulation_started = True
 
@@ -184,6 +247,17 @@ class MainWindow(QMainWindow):
 
             self.simulator.start()
 
+            replay = isinstance(self.simulator, ReplaySimulator)
+            self.seek_slider.setVisible(replay)
+            self.seek_label.setVisible(replay)
+            if replay:
+                self.simulator.time_changed.connect(self.show_playback_time)
+                self.simulator.rewound.connect(self.gantt_chart.truncate)
+                self.seek_slider.blockSignals(True)
+                self.seek_slider.setRange(0, self.simulator.end_time)
+                self.seek_slider.setValue(0)
+                self.seek_slider.blockSignals(False)
+
             
 
         except Exception as e:
@@ -193,6 +267,9 @@ class MainWindow(QMainWindow):
         if not self.simulation_started or not self.simulator or not self.simulator.isRunning():
             QMessageBox.warning(self, "Error", "Simulation not running")
             return
+        if isinstance(self.simulator, ReplaySimulator):
+            QMessageBox.warning(self, "Error", "Adding processes is not supported in a multi-CPU replay")
+            return
 
         try:
             if self.simulator.add_process(process):
@@ -202,13 +279,80 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", str(e))
 
+    def change_playback_speed(self, speed):
+        if isinstance(self.simulator, ReplaySimulator):
+            self.simulator.set_speed(speed)
+
+    def jump_to_end(self):
+        if isinstance(self.simulator, ReplaySimulator):
+            self.simulator.jump_to_end()
+
+    def seek_to(self, t):
+        if isinstance(self.simulator, ReplaySimulator):
+            self.simulator.seek(t)
+
+    def show_playback_time(self, t):
+        # Follows playback without seeking
+        self.seek_slider.blockSignals(True)
+        self.seek_slider.setValue(t)
+        self.seek_slider.blockSignals(False)
+        self.seek_label.setText(f"t = {t}")
+
+    def open_quantum_sweep(self):
+        processes = self.controls.get_processes()
+        if not processes:
+            QMessageBox.warning(self, "Error", "Enter valid processes before sweeping the quantum")
+            return
+        dialog = QuantumSweepDialog(processes, self)
+        dialog.quantum_chosen.connect(self.controls.quantum_input.setValue)
+        dialog.exec_()
+
+    def open_comparison(self):
+        processes = self.controls.get_processes()
+        if not processes:
+            QMessageBox.warning(self, "Error", "Enter valid processes before comparing the policies")
+            return
+        try:
+            quantum, quanta, boost = self.controls.get_policy_settings()
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid Input", str(e))
+            return
+        # Without a Priority column every process has priority 0: the priority policies would tell nothing
+        priorities = any('priority' in p for p in processes)
+        note = None if priorities else "Priority policies left out: the process table has no priorities."
+        dialog = PolicyComparisonDialog(processes, all_policies(quantum, quanta, boost, priorities), self,
+                                        note=note)
+        dialog.exec_()
+
+    def open_schedule_file(self):
+        if self.simulator is not None and self.simulator.isRunning():
+            QMessageBox.warning(self, "Error", "Wait for the simulation to finish before opening a schedule")
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "Open Schedule", "", "Schedule files (*.sched);;All files (*)")
+        if not path:
+            return
+        try:
+            self.gantt_chart.open_schedule(path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        # The chart no longer shows the last simulation: stop driving it
+        self.simulator = None
+        self.controls.set_adding_enabled(True)
+        self.simulation_started = False
+        self.seek_slider.hide()
+        self.seek_label.hide()
+
     def simulation_complete(self):
         self.controls.set_arrival_column_readonly(False)
+        self.controls.set_adding_enabled(True)
         self.controls.has_pending_process = False  
  
         msg = QMessageBox(self)
         msg.setWindowTitle("Done")
         msg.setText("Simulation finished!")
+        if self.probe.enabled:
+            msg.setDetailedText(self.probe.report())
         self.finish_sound.play()
 
         
@@ -0,0 +1,221 @@
+# gui/sweep.py
+
+from PyQt5.QtWidgets import (QApplication, QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox,
+                             QComboBox, QCheckBox, QPushButton, QMessageBox)
+from PyQt5.QtCore import Qt, QThread, QRectF, QPointF, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
+from core.engine.pool import Cancelled
+from core.engine.sweep import QuantumSweep, OBJECTIVES
+
+
+class SweepWorker(QThread):
+    """
+    Runs the sweep (which fans out to worker processes) off the GUI thread.
+    cancel() terminates the worker processes; the thread then ends without
+    emitting anything.
+    """
+    sweep_done = pyqtSignal(dict)
+    sweep_failed = pyqtSignal(str)
+
+    def __init__(self, processes, lo, hi, objective, exhaustive):
+        super().__init__()
+        self.processes = processes
+        self.args = (lo, hi, objective, exhaustive)
+        self._sweep = None
+        self._cancelled = False
+
+    def run(self):
+        try:
+            with QuantumSweep(self.processes) as sweep:
+                self._sweep = sweep
+                if self._cancelled:
+                    return
+                result = sweep.run(*self.args)
+            self.sweep_done.emit(result)
+        except Cancelled:
+            pass
+        except Exception as e:
+            self.sweep_failed.emit(str(e))
+
+    def cancel(self):
+        self._cancelled = True
+        if self._sweep is not None:
+            self._sweep.close()
+
+
+def stop_worker(worker):
+    """
+    Cancels a dialog's worker thread without waiting for it (a closed dialog
+    must not block the GUI): its signals are cut and, if it still runs, the
+    application owns it until it ends.
+    """
+    worker.disconnect()
+    worker.cancel()
+    if worker.isRunning():
+        worker.setParent(QApplication.instance())
+        worker.finished.connect(worker.deleteLater)
+
+
+class SweepPlot(QWidget):
+    """One small line chart per metric, sharing the quantum axis, with the optimum marked"""
+    SERIES = [
+        ('avg_waiting', "Avg Waiting", QColor("#4fc3f7")),
+        ('avg_response', "Avg Response", QColor("#81c784")),
+        ('context_switches', "Context Switches", QColor("#ffb74d")),
+    ]
+    MARGIN = 40
+
+    def __init__(self):
+        super().__init__()
+        self.points = []
+        self.best = None
+        self.setMinimumSize(500, 360)
+
+    def set_result(self, points, best):
+        self.points = points
+        self.best = best
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), QColor("#121212"))
+        if not self.points:
+            painter.setPen(QColor("#888888"))
+            painter.drawText(self.rect(), Qt.AlignCenter, "Run a sweep to see the curves")
+            return
+
+        q_min = self.points[0]['quantum']
+        q_max = max(self.points[-1]['quantum'], q_min + 1)
+        left, right = self.MARGIN + 30, self.width() - 10
+        panel_h = (self.height() - self.MARGIN) / len(self.SERIES)
+
+        def x_of(q):
+            return left + (q - q_min) / (q_max - q_min) * (right - left)
+
+        for i, (key, title, color) in enumerate(self.SERIES):
+            top = i * panel_h + 18
+            bottom = (i + 1) * panel_h - 6
+            values = [p[key] for p in self.points]
+            v_min, v_max = min(values), max(values)
+            span = (v_max - v_min) or 1
+
+            def y_of(v):
+                return bottom - (v - v_min) / span * (bottom - top)
+
+            painter.setPen(QColor("#555555"))
+            painter.drawRect(QRectF(left, top, right - left, bottom - top))
+            painter.setPen(color)
+            painter.drawText(QPointF(left, top - 4), title)
+            painter.setPen(QColor("#aaaaaa"))
+            painter.drawText(QRectF(0, top - 8, left - 4, 16), Qt.AlignRight | Qt.AlignVCenter, f"{v_max:.4g}")
+            painter.drawText(QRectF(0, bottom - 8, left - 4, 16), Qt.AlignRight | Qt.AlignVCenter, f"{v_min:.4g}")
+
+            painter.setPen(QPen(color, 2))
+            painter.drawPolyline(QPolygonF([QPointF(x_of(p['quantum']), y_of(p[key])) for p in self.points]))
+            for p in self.points:
+                painter.drawEllipse(QPointF(x_of(p['quantum']), y_of(p[key])), 2, 2)
+
+        # Optimum across all panels
+        if self.best is not None:
+            x = x_of(self.best['quantum'])
+            painter.setPen(QPen(QColor("#e57373"), 1, Qt.DashLine))
+            painter.drawLine(QPointF(x, 14), QPointF(x, self.height() - self.MARGIN + 4))
+
+        # Quantum axis
+        painter.setPen(QColor("#aaaaaa"))
+        axis_y = self.height() - self.MARGIN + 18
+        painter.drawText(QPointF(left, axis_y), str(q_min))
+        painter.drawText(QRectF(right - 60, axis_y - 12, 60, 16), Qt.AlignRight, str(q_max))
+        painter.drawText(QRectF(left, axis_y - 12, right - left, 16), Qt.AlignHCenter, "Quantum")
+
+
+class QuantumSweepDialog(QDialog):
+    """
+    Sweeps the Round Robin quantum over a range for the current processes and
+    plots the results. Emits quantum_chosen when the optimum is applied.
+    """
+    quantum_chosen = pyqtSignal(int)
+
+    def __init__(self, processes, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Round Robin Quantum Sweep")
+        self.processes = processes
+        self.worker = None
+        self.best = None
+
+        layout = QVBoxLayout()
+        form = QHBoxLayout()
+        form.addWidget(QLabel("Quantum from"))
+        self.lo_input = QSpinBox()
+        self.lo_input.setRange(1, 100)
+        self.lo_input.setValue(1)
+        form.addWidget(self.lo_input)
+        form.addWidget(QLabel("to"))
+        self.hi_input = QSpinBox()
+        self.hi_input.setRange(1, 100)
+        self.hi_input.setValue(100)
+        form.addWidget(self.hi_input)
+        form.addWidget(QLabel("Minimize"))
+        self.objective_box = QComboBox()
+        self.objective_box.addItems(OBJECTIVES)
+        form.addWidget(self.objective_box)
+        self.exhaustive_checkbox = QCheckBox("Every quantum")
+        form.addWidget(self.exhaustive_checkbox)
+        self.run_button = QPushButton("Run Sweep")
+        self.run_button.clicked.connect(self.run_sweep)
+        form.addWidget(self.run_button)
+        layout.addLayout(form)
+
+        self.plot = SweepPlot()
+        layout.addWidget(self.plot)
+
+        bottom = QHBoxLayout()
+        self.result_label = QLabel("")
+        bottom.addWidget(self.result_label)
+        self.apply_button = QPushButton("Use Best Quantum")
+        self.apply_button.setEnabled(False)
+        self.apply_button.clicked.connect(self.apply_best)
+        bottom.addWidget(self.apply_button)
+        layout.addLayout(bottom)
+        self.setLayout(layout)
+
+    def run_sweep(self):
+        lo, hi = self.lo_input.value(), self.hi_input.value()
+        if hi < lo:
+            QMessageBox.warning(self, "Invalid Input", "The quantum range is empty!")
+            return
+        self.run_button.setEnabled(False)
+        self.apply_button.setEnabled(False)
+        self.result_label.setText("Running...")
+        self.worker = SweepWorker(self.processes, lo, hi, self.objective_box.currentText(),
+                                  self.exhaustive_checkbox.isChecked())
+        self.worker.sweep_done.connect(self.show_result)
+        self.worker.sweep_failed.connect(self.show_error)
+        self.worker.start()
+
+    def show_result(self, result):
+        self.best = result['best']
+        self.plot.set_result(result['points'], self.best)
+        objective = self.objective_box.currentText()
+        self.result_label.setText(f"Best quantum: {self.best['quantum']} "
+                                  f"({objective} = {self.best[objective]:.2f}, {len(result['points'])} runs)")
+        self.run_button.setEnabled(True)
+        self.apply_button.setEnabled(True)
+
+    def show_error(self, message):
+        self.result_label.setText("")
+        self.run_button.setEnabled(True)
+        QMessageBox.critical(self, "Error", message)
+
+    def apply_best(self):
+        if self.best is not None:
+            self.quantum_chosen.emit(self.best['quantum'])
+            self.accept()
+
+    def done(self, result):
+        # Every way out (apply, Esc, the close button) ends here
+        if self.worker is not None:
+            stop_worker(self.worker)
+            self.worker = None
+        super().done(result)
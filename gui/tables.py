@@ -1,7 +1,90 @@
 # gui/tables.py
 
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QSizePolicy
-from PyQt5.QtCore import  Qt
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QTableView, QHeaderView, QSizePolicy
+from PyQt5.QtCore import  Qt, QAbstractTableModel, QModelIndex
+from array import array
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """
+    Process status rows kept in compact columns (one array per field).
+    update_rows only touches the rows it is given and emits one dataChanged
+    per run of consecutive changed rows, so a tick costs O(changed rows)
+    instead of O(n), in as few signals as the rows allow.
+    """
+    HEADERS = ["Name", "Arrival", "Burst", "Remaining"]
+
+    def __init__(self):
+        super().__init__()
+        self._reset_columns()
+
+    def _reset_columns(self):
+        self.names = []
+        self.arrival = array('q')
+        self.burst = array('q')
+        self.remaining = array('q')
+        self._rows = {}  # name -> row
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        column = (self.names, self.arrival, self.burst, self.remaining)[index.column()]
+        return str(column[row])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable  # read-only
+
+    def update_rows(self, data):
+        first = len(self.names)
+        new_rows = [proc for proc in data if proc['name'] not in self._rows]
+        if new_rows:
+            self.beginInsertRows(QModelIndex(), first, first + len(new_rows) - 1)
+            for proc in new_rows:
+                self._rows[proc['name']] = len(self.names)
+                self.names.append(proc['name'])
+                self.arrival.append(proc['arrival'])
+                self.burst.append(proc['burst'])
+                self.remaining.append(proc['remaining'])
+            self.endInsertRows()
+
+        changed = []
+        for proc in data:
+            row = self._rows[proc['name']]
+            if row >= first:
+                continue  # just inserted
+            self.arrival[row] = proc['arrival']
+            self.burst[row] = proc['burst']
+            self.remaining[row] = proc['remaining']
+            changed.append(row)
+        if not changed:
+            return
+        changed.sort()
+        last_column = len(self.HEADERS) - 1
+        top = bottom = changed[0]
+        for row in changed[1:]:
+            if row > bottom + 1:
+                self.dataChanged.emit(self.index(top, 0), self.index(bottom, last_column))
+                top = row
+            bottom = row
+        self.dataChanged.emit(self.index(top, 0), self.index(bottom, last_column))
+
+    def clear(self):
+        self.beginResetModel()
+        self._reset_columns()
+        self.endResetModel()
+
 
 class ProcessTableWidget(QWidget):
     def __init__(self):
@@ -13,52 +96,31 @@ class ProcessTableWidget(QWidget):
         self.label = QLabel("Process Status")
         layout.addWidget(self.label)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
+        self.model = ProcessTableModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
         self.table.setFixedHeight(200)  # or any value that fits your layout
         self.table.setFixedWidth(450)
-        
-        self.table.setHorizontalHeaderLabels(["Name", "Arrival", "Burst", "Remaining"])
+
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Fixed row height so the view never measures 50k rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
         layout.addWidget(self.table)
 
         self.setLayout(layout)
 
     def update_table(self, data):
-        """Properly update table without duplicates and keep row order consistent"""
+        """Updates (or appends) only the given rows; rows keep the order they were first sent in"""
+        self.model.update_rows(data)
 
-        # Sort processes by name to ensure consistent order
-        data.sort(key=lambda p: p['arrival'])
+    def clear_table(self):
+        self.model.clear()
 
-        # Create mapping of process names to rows
-        existing_rows = {}
-        for row in range(self.table.rowCount()):
-            if item := self.table.item(row, 0):
-                existing_rows[item.text()] = row
 
-        # Update or add rows
-        for proc in data:
-            if proc['name'] in existing_rows:
-                row = existing_rows[proc['name']]
-            else:
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-
-            # Add items and make them read-only
-            for col, key in enumerate(['name', 'arrival', 'burst', 'remaining']):
-                item = QTableWidgetItem(str(proc[key]))
-                item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # Make cell read-only
-                self.table.setItem(row, col, item)
-
-        # Remove finished processes
-        current_processes = {p['name'] for p in data}
-        for name, row in sorted(existing_rows.items(), key=lambda x: -x[1]):
-            if name not in current_processes:
-                self.table.removeRow(row)
-
-        
 
 class StatsWidget(QWidget):
+    PRIORITY_LINES = 8   # priority levels listed one by one; the others share an "Other" line
+
     def __init__(self):
         super().__init__()
         self.init_ui()
@@ -70,13 +132,66 @@ class StatsWidget(QWidget):
 
         self.avg_wt_label = QLabel("Average Waiting Time: -")
         self.avg_tat_label = QLabel("Average Turnaround Time: -")
+        self.avg_rt_label = QLabel("Average Response Time: -")
+        self.cpu_label = QLabel("CPU Utilization: -")
+        self.cores_label = QLabel("")
+        self.priority_label = QLabel("")
 
         layout.addWidget(self.avg_wt_label)
         layout.addWidget(self.avg_tat_label)
+        layout.addWidget(self.avg_rt_label)
+        layout.addWidget(self.cpu_label)
+        layout.addWidget(self.cores_label)
+        layout.addWidget(self.priority_label)
 
 
         self.setLayout(layout)
 
-    def update_stats(self, avg_wt, avg_tat):
-        self.avg_wt_label.setText(f"Average Waiting Time: {avg_wt:.2f}")
-        self.avg_tat_label.setText(f"Average Turnaround Time: {avg_tat:.2f}")
+    def update_stats(self, metrics):
+        """Shows a utils.metrics.compute_metrics result"""
+        for label, title, key in ((self.avg_wt_label, "Waiting", 'waiting'),
+                                  (self.avg_tat_label, "Turnaround", 'turnaround'),
+                                  (self.avg_rt_label, "Response", 'response')):
+            m = metrics[key]
+            label.setText(f"Average {title} Time: {m['mean']:.2f}  "
+                          f"(p50 {m['p50']:.0f} / p95 {m['p95']:.0f} / p99 {m['p99']:.0f})")
+
+        self.cpu_label.setText(f"CPU Utilization: {metrics['cpu_utilization'] * 100:.1f}%  "
+                               f"Throughput: {metrics['throughput']:.3f}/unit  "
+                               f"Context Switches: {metrics['context_switches']}")
+
+        per_cpu = metrics.get('per_cpu_utilization')
+        if per_cpu:
+            cores = [f"CPU {i}: {u * 100:.0f}%" for i, u in enumerate(per_cpu)]
+            lines = ["  ".join(cores[i:i + 8]) for i in range(0, len(cores), 8)]
+            self.cores_label.setText("\n".join(lines + [f"Migrations: {metrics['migrations']}"]))
+        else:
+            self.cores_label.setText("")
+
+        by_priority = metrics['by_priority']
+        if len(by_priority) > 1:
+            self.priority_label.setText("\n".join(self._priority_lines(by_priority)))
+        else:
+            self.priority_label.setText("")
+
+    def _priority_lines(self, by_priority):
+        # The most populated levels in level order, then the rest merged (count-weighted means)
+        levels = sorted(by_priority, key=lambda level: (-by_priority[level]['count'], level))
+        shown, rest = sorted(levels[:self.PRIORITY_LINES]), levels[self.PRIORITY_LINES:]
+        rows = [(f"Priority {level}", by_priority[level]) for level in shown]
+        if rest:
+            count = sum(by_priority[level]['count'] for level in rest)
+            merged = {'count': count}
+            for key in ('avg_waiting', 'avg_turnaround', 'avg_response'):
+                merged[key] = sum(by_priority[level][key] * by_priority[level]['count'] for level in rest) / count
+            rows.append((f"Other ({len(rest)} levels)", merged))
+        return [f"{title}: n={m['count']}  WT {m['avg_waiting']:.2f}  "
+                f"TAT {m['avg_turnaround']:.2f}  RT {m['avg_response']:.2f}" for title, m in rows]
+
+    def clear_stats(self):
+        self.avg_wt_label.setText("Average Waiting Time: -")
+        self.avg_tat_label.setText("Average Turnaround Time: -")
+        self.avg_rt_label.setText("Average Response Time: -")
+        self.cpu_label.setText("CPU Utilization: -")
+        self.cores_label.setText("")
+        self.priority_label.setText("")
@@ -0,0 +1,150 @@
+import random
+from collections import deque
+
+# Reference schedulers for the tests: the whole schedule computed one time
+# unit at a time, as plainly as possible, to check the event-driven engines
+# against. At every time t, in this order:
+#   1. the running process finishes if it has no work left
+#   2. MLFQ: every process goes back to level 0 on multiples of `boost`
+#   3. processes arriving at t join the queue (zero bursts finish at once)
+#   4. the running process may be preempted (it then joins the queue after
+#      the arrivals of step 3)
+#   5. an idle CPU takes the next process
+# then the running process makes one unit of progress.
+
+POLICIES = ('fcfs', 'sjf', 'srtf', 'priority', 'priority_preemptive', 'rr', 'mlfq')
+
+
+def reference_schedule(processes, policy, quantum=2, quanta=(2, 4, 8), boost=None):
+    """
+    Returns (slices, completion, first_run, context_switches): slices are
+    (name, start, duration) in time order, completion and first_run map
+    names to times.
+    """
+    if policy not in POLICIES:
+        raise ValueError(policy)
+    n = len(processes)
+    names = [p['name'] for p in processes]
+    arrival = [p['arrival'] for p in processes]
+    burst = [p['burst'] for p in processes]
+    priority = [p.get('priority', 0) for p in processes]
+    remaining = list(burst)
+    order = sorted(range(n), key=lambda pid: (arrival[pid], pid))
+
+    fifo = deque()                              # fcfs, rr
+    keyed = []                                  # sjf, srtf, priority: pids, searched for the minimum key
+    levels = [deque() for _ in quanta]          # mlfq
+    level = [0] * n
+    used = [0] * n                              # mlfq: time used at the current level
+
+    def key(pid):
+        if policy == 'sjf':
+            return burst[pid], arrival[pid], pid
+        if policy == 'srtf':
+            return remaining[pid], arrival[pid], pid
+        return priority[pid], arrival[pid], pid
+
+    def enqueue(pid):
+        if policy in ('fcfs', 'rr'):
+            fifo.append(pid)
+        elif policy == 'mlfq':
+            levels[level[pid]].append(pid)
+        else:
+            keyed.append(pid)
+
+    def waiting():
+        return len(fifo) + len(keyed) + sum(len(queue) for queue in levels)
+
+    def pick():
+        if policy in ('fcfs', 'rr'):
+            return fifo.popleft()
+        if policy == 'mlfq':
+            return next(queue for queue in levels if queue).popleft()
+        pid = min(keyed, key=key)
+        keyed.remove(pid)
+        return pid
+
+    slices = []
+    completion = {}
+    first_run = {}
+    switches = 0
+    last = None
+    running = None
+    start = 0
+    ran = 0            # time run since dispatch (rr)
+    admitted = 0
+    t = 0
+
+    def leave():
+        if t > start:
+            slices.append((names[running], start, t - start))
+
+    while True:
+        if running is not None and remaining[running] == 0:
+            completion[names[running]] = t
+            leave()
+            running = None
+
+        if policy == 'mlfq' and boost and t > 0 and t % boost == 0:
+            merged = deque(pid for queue in levels for pid in queue)
+            levels[0] = merged
+            for queue in levels[1:]:
+                queue.clear()
+            for pid in list(merged) + ([running] if running is not None else []):
+                level[pid] = 0
+                used[pid] = 0
+
+        while admitted < n and arrival[order[admitted]] <= t:
+            pid = order[admitted]
+            admitted += 1
+            if burst[pid] <= 0:
+                completion[names[pid]] = t
+            else:
+                enqueue(pid)
+
+        if running is not None:
+            preempt = False
+            if policy == 'rr':
+                preempt = ran > 0 and ran % quantum == 0 and waiting() > 0
+            elif policy == 'mlfq':
+                top = min((lvl for lvl, queue in enumerate(levels) if queue), default=None)
+                if used[running] >= quanta[level[running]]:
+                    # Allotment used up: one level down (the last level is round robin)
+                    level[running] = min(level[running] + 1, len(quanta) - 1)
+                    used[running] = 0
+                    preempt = top is not None and top <= level[running]
+                else:
+                    preempt = top is not None and top < level[running]
+            elif policy in ('srtf', 'priority_preemptive') and keyed:
+                preempt = key(min(keyed, key=key))[0] < key(running)[0]
+            if preempt:
+                leave()
+                enqueue(running)
+                running = None
+
+        if running is None and waiting():
+            running = pick()
+            first_run.setdefault(names[running], t)
+            if running != last:
+                if last is not None:
+                    switches += 1
+                last = running
+            start = t
+            ran = 0
+
+        if running is None and not waiting() and admitted == n:
+            return slices, completion, first_run, switches
+
+        if running is not None:
+            remaining[running] -= 1
+            ran += 1
+            used[running] += 1
+        t += 1
+
+
+def random_workloads(seed, count=200, size=12, horizon=40):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield [{'name': f'P{k}', 'arrival': rng.randint(0, horizon),
+                'burst': rng.randint(0 if rng.random() < 0.1 else 1, 10), 'priority': rng.randint(0, 3)}
+               for k in range(rng.randint(0, size))]
@@ -0,0 +1,75 @@
+import csv
+import json
+
+import pytest
+
+from batch import main, run_batch
+from utils.schedule_file import ScheduleFile
+
+
+def _write(path, processes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix == '.json':
+        path.write_text(json.dumps(processes))
+    else:
+        path.write_text('name,arrival,burst\n' + ''.join(f"{p['name']},{p['arrival']},{p['burst']}\n"
+                                                         for p in processes))
+
+
+def test_same_stem_workloads_keep_their_schedules(tmp_path):
+    inputs = {
+        tmp_path / 'a' / 'w.json': [{'name': 'A', 'arrival': 0, 'burst': 3}],
+        tmp_path / 'b' / 'w.csv': [{'name': 'B', 'arrival': 0, 'burst': 5}],
+        tmp_path / 'b' / 'w.json': [{'name': 'C', 'arrival': 0, 'burst': 7}],
+    }
+    for path, processes in inputs.items():
+        _write(path, processes)
+    schedules = tmp_path / 'schedules'
+    rows = list(run_batch([str(path) for path in inputs], ['FCFSScheduler', 'SJFScheduler'],
+                          jobs=2, schedules=str(schedules)))
+    assert [row['status'] for row in rows] == ['ok'] * 6
+
+    for name, burst in (('a__w.json', 3), ('b__w.csv', 5), ('b__w.json', 7)):
+        for policy in ('FCFSScheduler', 'SJFScheduler'):
+            with ScheduleFile(schedules / f'{name}.{policy}.sched') as schedule:
+                assert [(s['start'], s['duration']) for s in schedule.timeline()] == [(0, burst)]
+
+
+def test_same_workload_twice_refused_before_running(tmp_path):
+    path = tmp_path / 'w.csv'
+    _write(path, [{'name': 'A', 'arrival': 0, 'burst': 3}])
+    with pytest.raises(ValueError):
+        next(run_batch([str(path), str(path)], ['FCFSScheduler'], schedules=str(tmp_path / 'out')))
+    assert not (tmp_path / 'out').exists()
+
+
+def test_failed_runs_are_error_rows_and_exit_code(tmp_path, capsys):
+    good = tmp_path / 'good.csv'
+    _write(good, [{'name': 'A', 'arrival': 0, 'burst': 3}, {'name': 'B', 'arrival': 1, 'burst': 2}])
+    bad = tmp_path / 'bad.csv'
+    _write(bad, [{'name': 'A', 'arrival': 0, 'burst': 0}])
+    other = tmp_path / 'w.txt'
+    other.write_text('A 0 3\n')
+    missing = tmp_path / 'missing.json'
+    out = tmp_path / 'results.csv'
+
+    paths = [str(good), str(bad), str(other), str(missing)]
+    assert main(paths + ['--policies', 'FCFSScheduler', 'RRScheduler', '--jobs', '2', '--out', str(out)]) == 1
+    with open(out, newline='') as f:
+        rows = list(csv.DictReader(f))
+    # One row per (file, policy), in input order, failures included
+    assert [(row['workload'], row['policy']) for row in rows] == \
+           [(path, policy) for path in paths for policy in ('FCFSScheduler', 'RRScheduler')]
+    assert [row['status'] for row in rows] == ['ok'] * 2 + ['error'] * 6
+    assert rows[0]['count'] == '2' and rows[0]['error'] == ''
+    assert 'burst time must be positive' in rows[2]['error']
+    assert "unsupported workload format '.txt'" in rows[4]['error']
+    assert rows[6]['error'] and rows[6]['count'] == '' and rows[6]['avg_waiting'] == ''
+    captured = capsys.readouterr()
+    assert captured.err.count('\n') == 6 and f"{bad} [FCFSScheduler]:" in captured.err
+    assert '(6 failed)' in captured.out
+
+    out = tmp_path / 'results.json'
+    assert main([str(good), '--policies', 'SJFScheduler', '--jobs', '1', '--out', str(out)]) == 0
+    assert [row['status'] for row in json.loads(out.read_text())] == ['ok']
+    assert capsys.readouterr().out == f"Results written to {out}\n"
@@ -0,0 +1,48 @@
+import random
+import time
+
+import pytest
+
+from core.engine.engine import Engine
+from core.engine.policies import policy_for
+from core.schedulers.fcfs import FCFSScheduler
+from core.schedulers.sjf import SJFScheduler
+from core.schedulers.srtf import SRTFScheduler
+from core.schedulers.priority_preem import priority_preem
+from core.schedulers.priority_nonpreem import PriorityNonPreemptiveScheduler
+
+# Speed guards for schedule(): 100k processes with bursts up to a million
+# ticks must take well under a second, and the heap fast path must stay
+# clearly ahead of running the general engine loop.
+
+COUNT = 100_000
+LIMIT = 1.0          # seconds, best of three
+ENGINE_RATIO = 0.6   # fast path time / engine time
+
+SCHEDULERS = [FCFSScheduler, SJFScheduler, SRTFScheduler, priority_preem, PriorityNonPreemptiveScheduler]
+
+
+@pytest.fixture(scope='module')
+def workload():
+    rng = random.Random(1)
+    return [{'name': f'P{i}', 'arrival': rng.randint(0, 10 ** 9), 'burst': rng.randint(1, 10 ** 6),
+             'priority': rng.randint(0, 9)} for i in range(COUNT)]
+
+
+def _seconds(run, repeat=1):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('scheduler_class', SCHEDULERS, ids=lambda c: c.__name__)
+def test_schedule_fast_path(scheduler_class, workload):
+    scheduler = scheduler_class()
+    fast = _seconds(lambda: scheduler.schedule(workload), repeat=3)
+    engine = _seconds(lambda: Engine(policy_for(scheduler), workload).run())
+    assert fast < LIMIT, f"{scheduler_class.__name__}.schedule took {fast:.2f} s"
+    assert fast < ENGINE_RATIO * engine, f"fast path {fast:.2f} s vs engine {engine:.2f} s"
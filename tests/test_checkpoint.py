@@ -0,0 +1,120 @@
+import random
+
+import pytest
+
+from core.engine.engine import Engine
+from core.engine.smp import SMPEngine
+from core.engine.policies import (FCFSPolicy, SJFPolicy, SRTFPolicy, PriorityPolicy, RRPolicy, MLFQPolicy)
+from reference import random_workloads
+
+POLICIES = [FCFSPolicy, SJFPolicy, SRTFPolicy, lambda: PriorityPolicy(preemptive=True),
+            lambda: RRPolicy(2), lambda: MLFQPolicy((1, 3, 6), 12)]
+SMP_POLICIES = POLICIES[:-1]
+
+
+def state(engine):
+    """Everything a seek must restore (output such as the timeline aside)"""
+    queues = [list(queue) for queue in engine._ready_queues()]
+    levels = [[queue.level_of(pid) for pid in range(len(engine))]
+              for queue in engine._ready_queues() if hasattr(queue, 'level_of')]
+    return (engine.time, engine.running, [engine.remaining_of(pid) for pid in range(len(engine))],
+            list(engine.first_run), list(engine.completion), queues, levels, engine.context_switches,
+            getattr(engine, 'migrations', 0))
+
+
+def check_seeks(make_engine, processes, rng, seeks=12):
+    engine = make_engine(checkpoint_every=rng.randint(1, 6))
+    engine.advance()
+    end = engine.time
+    for _ in range(seeks):
+        t = rng.randint(0, end + 3)
+        engine.seek(t)
+        fresh = make_engine()
+        fresh.advance(t)
+        assert state(engine) == state(fresh), (processes, t)
+    # Running on from the last seek gives the same schedule, each slice once
+    engine.advance()
+    whole = make_engine().run()
+    assert engine.result() == whole
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+def test_engine_seek_matches_fresh_engine(policy):
+    rng = random.Random(policy)
+    for processes in random_workloads(20 + policy, count=80):
+        check_seeks(lambda **options: Engine(POLICIES[policy](), processes, **options), processes, rng)
+
+
+@pytest.mark.parametrize('policy', range(len(SMP_POLICIES)))
+@pytest.mark.parametrize('per_core_queues', [False, True])
+def test_smp_seek_matches_fresh_engine(policy, per_core_queues):
+    rng = random.Random(policy)
+    for processes in random_workloads(40 + policy, count=60, size=16):
+        cpus = rng.randint(1, 4)
+        cost = rng.randint(0, 2)
+        check_seeks(lambda **options: SMPEngine(SMP_POLICIES[policy](), processes, cpus, cost, per_core_queues,
+                                                **options), processes, rng)
+
+
+def check_seeks_after_add(make_engine, processes, rng, seeks=12):
+    # Half the processes are added live at time `at`, arriving after it (one
+    # arriving at `at` itself would miss the decisions already taken then)
+    at = rng.randint(0, 30)
+    split = len(processes) // 2
+    late = [dict(p, arrival=max(p['arrival'], at + 1)) for p in processes[split:]]
+    engine = make_engine(processes[:split], checkpoint_every=rng.randint(1, 6))
+    engine.advance(at)
+    for p in late:
+        engine.add(p)
+    engine.advance()
+    end = engine.time
+    everything = processes[:split] + late
+    for _ in range(seeks):
+        t = rng.randint(0, end + 3)
+        engine.seek(t)
+        fresh = make_engine(everything)
+        fresh.advance(t)
+        assert state(engine) == state(fresh), (processes, at, t)
+    engine.advance()
+    assert engine.result() == make_engine(everything).run()
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+def test_engine_seek_before_add(policy):
+    rng = random.Random(policy)
+    for processes in random_workloads(60 + policy, count=80):
+        check_seeks_after_add(lambda processes, **options: Engine(POLICIES[policy](), processes, **options),
+                              processes, rng)
+
+
+@pytest.mark.parametrize('policy', range(len(SMP_POLICIES)))
+@pytest.mark.parametrize('per_core_queues', [False, True])
+def test_smp_seek_before_add(policy, per_core_queues):
+    rng = random.Random(policy)
+    for processes in random_workloads(80 + policy, count=60, size=16):
+        cpus = rng.randint(1, 4)
+        cost = rng.randint(0, 2)
+        check_seeks_after_add(lambda processes, **options: SMPEngine(SMP_POLICIES[policy](), processes, cpus, cost,
+                                                                     per_core_queues, **options),
+                              processes, rng)
+
+
+def test_checkpoints_store_deltas():
+    # Long run, few processes alive at once: snapshots between whole copies
+    # only hold the rows that changed
+    processes = [{'name': f'P{i}', 'arrival': 2 * i, 'burst': 3} for i in range(2000)]
+    engine = Engine(RRPolicy(2), processes, checkpoint_every=10)
+    engine.run()
+    rows = sum(len(state[5][1][0]) for state in engine.checkpoints._states)
+    assert len(engine.checkpoints) > 300
+    assert rows < 10 * len(processes)
+    engine.seek(1999)
+    fresh = Engine(RRPolicy(2), processes)
+    fresh.advance(1999)
+    assert state(engine) == state(fresh)
+
+
+def test_seek_without_checkpoints_is_refused():
+    engine = Engine(FCFSPolicy(), [{'name': 'A', 'arrival': 0, 'burst': 3}])
+    with pytest.raises(ValueError):
+        engine.seek(1)
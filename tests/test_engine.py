@@ -0,0 +1,130 @@
+import gc
+import random
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from core.engine.arrivals import arrival_order
+from core.engine.engine import Engine
+from core.engine.policies import (FCFSPolicy, SJFPolicy, SRTFPolicy, PriorityPolicy, RRPolicy, MLFQPolicy)
+from core.process_table import ProcessTable
+from reference import random_workloads, reference_schedule
+
+
+CASES = [
+    ('fcfs', lambda: FCFSPolicy(), {}),
+    ('sjf', lambda: SJFPolicy(), {}),
+    ('srtf', lambda: SRTFPolicy(), {}),
+    ('priority', lambda: PriorityPolicy(preemptive=False), {}),
+    ('priority_preemptive', lambda: PriorityPolicy(preemptive=True), {}),
+    ('rr', lambda: RRPolicy(1), {'quantum': 1}),
+    ('rr', lambda: RRPolicy(3), {'quantum': 3}),
+    ('mlfq', lambda: MLFQPolicy((2, 4, 8), None), {'quanta': (2, 4, 8)}),
+    ('mlfq', lambda: MLFQPolicy((1, 3), 10), {'quanta': (1, 3), 'boost': 10}),
+    ('mlfq', lambda: MLFQPolicy((3,), 7), {'quanta': (3,), 'boost': 7}),
+]
+
+
+def engine_schedule(engine):
+    result = engine.run()
+    slices = [(s['name'], s['start'], s['duration']) for s in result['timeline']]
+    first_run = {engine.names[pid]: t for pid, t in enumerate(engine.first_run) if t >= 0}
+    return slices, result['completion'], first_run, engine.context_switches
+
+
+@pytest.mark.parametrize('case', range(len(CASES)), ids=[f'{name}-{i}' for i, (name, _, _) in enumerate(CASES)])
+def test_engine_matches_tick_reference(case):
+    name, make_policy, options = CASES[case]
+    for processes in random_workloads(case):
+        expected = reference_schedule(processes, name, **options)
+        assert engine_schedule(Engine(make_policy(), processes)) == expected, processes
+
+
+def test_stepwise_advance_matches_one_run():
+    rng = random.Random(3)
+    for processes in random_workloads(11, count=60):
+        for make_policy in (SRTFPolicy, lambda: RRPolicy(2), lambda: MLFQPolicy((1, 2, 4), 9)):
+            whole = Engine(make_policy(), processes).run()
+            engine = Engine(make_policy(), processes)
+            t = 0
+            while not engine.done():
+                t += rng.randint(1, 5)
+                engine.advance(t)
+            assert engine.result() == whole
+
+
+def test_shared_arrival_order_is_not_consumed():
+    for processes in random_workloads(12, count=40):
+        table = ProcessTable(processes)
+        order = arrival_order(table.arrival)
+        expected = Engine(RRPolicy(2), processes).run()
+        for _ in range(2):
+            table.reset()
+            assert Engine(RRPolicy(2), table, arrivals=order).run() == expected
+
+
+def test_memory_per_process():
+    # As dicts (plus per-name runtime state) a process costs about 360 bytes;
+    # a table built from columns holds 6 int64 fields and the engine's arrival
+    # order one more, whatever the policy
+    n = 100000
+    arrival = np.arange(n, dtype=np.int64) * 3
+    burst = 1 + np.arange(n, dtype=np.int64) % 50
+    gc.collect()
+    tracemalloc.start()
+    try:
+        table = ProcessTable.from_columns(arrival, burst)
+        engine = Engine(RRPolicy(2), table)
+        held, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert held / n <= 64
+    assert peak / n <= 72
+    assert len(engine) == n
+
+
+def check_added_batches(make_engine, make_policy, rng, seed):
+    # Processes added while the engine runs (a Simulator.add_processes batch)
+    # are scheduled as if they had been in the workload from the start
+    for processes in random_workloads(seed, count=120):
+        cut = rng.randint(0, len(processes))
+        initial, later = processes[:cut], processes[cut:]
+        engine = make_engine(make_policy(), initial)
+        engine.advance(rng.randint(0, 45))
+        earliest = engine.earliest_arrival()
+        batch = [dict(p, arrival=max(p['arrival'], earliest)) for p in later]
+        for process in batch:
+            engine.add(process)
+        engine.advance()
+        assert engine.result() == make_engine(make_policy(), initial + batch).run(), (initial, batch)
+
+
+@pytest.mark.parametrize('case', range(len(CASES)), ids=[f'{name}-{i}' for i, (name, _, _) in enumerate(CASES)])
+def test_added_batch_matches_workload_known_from_start(case):
+    _, make_policy, _ = CASES[case]
+    check_added_batches(Engine, make_policy, random.Random(case), 30 + case)
+
+
+def test_add_at_current_time():
+    # Nothing was decided at t=2 (A alone, its quantum boundaries skipped):
+    # a batch arriving then takes the CPU at A's boundary, as if known from the start
+    engine = Engine(RRPolicy(2), [{'name': 'A', 'arrival': 0, 'burst': 6}])
+    engine.advance(2)
+    assert engine.earliest_arrival() == 2
+    engine.add({'name': 'B', 'arrival': 2, 'burst': 2})
+    engine.add({'name': 'C', 'arrival': 2, 'burst': 1})
+    assert [(s['name'], s['start'], s['duration']) for s in engine.run()['timeline']] == [
+        ('A', 0, 2), ('B', 2, 2), ('C', 4, 1), ('A', 5, 4)]
+
+    # At t=2 A's quantum ends and C, waiting, takes over: that is decided, so
+    # a process can no longer arrive at 2
+    engine = Engine(RRPolicy(2), [{'name': 'A', 'arrival': 0, 'burst': 6}, {'name': 'C', 'arrival': 0, 'burst': 2}])
+    engine.advance(2)
+    assert engine.earliest_arrival() == 3
+    with pytest.raises(ValueError):
+        engine.add({'name': 'B', 'arrival': 2, 'burst': 2})
+    assert 'B' not in engine
+    engine.add({'name': 'B', 'arrival': 3, 'burst': 2})
+    assert [(s['name'], s['start'], s['duration']) for s in engine.run()['timeline']] == [
+        ('A', 0, 2), ('C', 2, 2), ('A', 4, 2), ('B', 6, 2), ('A', 8, 2)]
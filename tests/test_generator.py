@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from utils.generator import ARRIVALS, BURSTS, PRIORITIES, generate, generate_columns, main
+from utils.trace import read_trace
+
+
+@pytest.mark.parametrize('arrivals,bursts,priorities', list(itertools.product(ARRIVALS, BURSTS, PRIORITIES)))
+def test_same_seed_same_workload(arrivals, bursts, priorities):
+    options = dict(arrivals=arrivals, bursts=bursts, priorities=priorities, seed=11, cluster=20)
+    first = generate_columns(5000, **options)
+    for column, again in zip(first, generate_columns(5000, **options)):
+        assert column.dtype == np.int64
+        assert np.array_equal(column, again)
+    arrival, burst, priority = first
+    assert np.all(np.diff(arrival) >= 0) and arrival[0] >= 0
+    assert burst.min() >= 1
+    assert 0 <= priority.min() and priority.max() < 10
+    if arrivals != 'zero' or bursts != 'uniform' or priorities != 'constant':
+        other = generate_columns(5000, **dict(options, seed=12))
+        assert any(not np.array_equal(a, b) for a, b in zip(first, other))
+
+
+@pytest.mark.parametrize('bursts,tolerance', [('exponential', 0.05), ('lognormal', 0.08), ('uniform', 0.03),
+                                              ('pareto', 0.25)])
+def test_bursts_average_mean_burst(bursts, tolerance):
+    _, burst, _ = generate_columns(200000, bursts=bursts, mean_burst=20, seed=1)
+    assert abs(burst.mean() / 20 - 1) < tolerance
+
+
+@pytest.mark.parametrize('arrivals', ['poisson', 'bursty', 'uniform'])
+def test_arrivals_follow_the_load(arrivals):
+    # load / mean_burst processes per time unit
+    arrival, _, _ = generate_columns(200000, arrivals=arrivals, mean_burst=10, load=0.5, seed=2)
+    assert abs(len(arrival) / arrival[-1] / 0.05 - 1) < 0.05
+
+
+def test_priority_distributions():
+    _, _, uniform = generate_columns(100000, priorities='uniform', levels=4, seed=3)
+    assert np.all(np.abs(np.bincount(uniform, minlength=4) / 100000 - 0.25) < 0.01)
+    _, _, skewed = generate_columns(100000, priorities='skewed', levels=4, seed=3)
+    # Halving from level 0, the lowest level taking the whole tail
+    assert np.all(np.abs(np.bincount(skewed, minlength=4) / 100000 - [0.5, 0.25, 0.125, 0.125]) < 0.01)
+
+
+def test_table_and_trace_match_the_columns(tmp_path):
+    arrival, burst, priority = generate_columns(300, seed=5, levels=3)
+    table = generate(300, seed=5, levels=3)
+    assert (list(table.arrival), list(table.burst), list(table.priority)) == \
+           (arrival.tolist(), burst.tolist(), priority.tolist())
+    assert (table.names[0], table.names[299]) == ('P0', 'P299')
+
+    path = tmp_path / 'w.trace'
+    main(['300', str(path), '--seed', '5', '--levels', '3'])
+    assert [(p['arrival'], p['burst'], p['priority']) for p in read_trace(str(path))] == \
+           list(zip(arrival.tolist(), burst.tolist(), priority.tolist()))
@@ -0,0 +1,76 @@
+import pytest
+
+import utils.schedule_file as schedule_file
+from core.engine.engine import Engine
+from core.engine.policies import RRPolicy
+from core.engine.smp import SMPEngine
+from core.engine.stream import StreamingEngine
+from utils.schedule_file import HEADER, HEADER_SIZE, ScheduleFile, record_schedule
+
+
+def test_round_trip_and_close(tmp_path):
+    processes = [{'name': f'P{i}', 'arrival': i, 'burst': 3} for i in range(50)]
+    engine = Engine(RRPolicy(2), processes)
+    path = tmp_path / 'run.sched'
+    with record_schedule(engine, path):
+        timeline = engine.run()['timeline']
+    with ScheduleFile(path) as schedule:
+        schedule.advise_random()
+        assert [(s['name'], s['start'], s['duration']) for s in schedule.timeline()] == \
+               [(s['name'], s['start'], s['duration']) for s in timeline]
+    assert len(schedule) == 0
+    schedule.close()   # again: nothing to do
+
+
+def test_close_refuses_live_views(tmp_path):
+    engine = Engine(RRPolicy(2), [{'name': 'A', 'arrival': 0, 'burst': 5}])
+    path = tmp_path / 'run.sched'
+    with record_schedule(engine, path):
+        engine.run()
+    schedule = ScheduleFile(path)
+    start = schedule.start
+    with pytest.raises(BufferError):
+        schedule.close()
+    del start
+    schedule.close()
+
+
+def test_writer_names_stay_bounded(tmp_path, monkeypatch):
+    # A streamed run: pids keep growing, the writer only remembers one chunk of them
+    monkeypatch.setattr(schedule_file, 'CHUNK_RECORDS', 64)
+    engine = StreamingEngine(RRPolicy(2))
+    path = tmp_path / 'run.sched'
+    with record_schedule(engine, path) as writer:
+        engine.feed({'name': f'P{i}', 'arrival': 2 * i, 'burst': 5} for i in range(5000))
+        assert len(writer._named) <= 64
+    with ScheduleFile(path) as schedule:
+        assert len(schedule._index_pids) == 5000   # one entry per process, not per chunk
+        assert all(schedule.name(pid) == f'P{pid}' for pid in range(5000))
+
+
+def test_multi_cpu_lanes_and_names_stored(tmp_path, monkeypatch):
+    monkeypatch.setattr(schedule_file, 'CHUNK_RECORDS', 16)
+    processes = [{'name': f'P{i}', 'arrival': i // 3, 'burst': 1 + i % 7} for i in range(300)]
+    engine = SMPEngine(RRPolicy(2), processes, cpus=3, migration_cost=1)
+    path = tmp_path / 'run.sched'
+    with record_schedule(engine, path):
+        timeline = engine.run()['timeline']
+    with ScheduleFile(path) as schedule:
+        lanes = schedule.lanes()
+        assert len(lanes) == 3
+        cpus = schedule.cpu.tolist()
+        for cpu, rows in enumerate(lanes):
+            assert rows.tolist() == [i for i, c in enumerate(cpus) if c == cpu]
+        assert sorted(((s['name'], s['start'], s['cpu']) for s in schedule.timeline()), key=lambda s: s[1:]) == \
+               sorted(((s['name'], s['start'], s['cpu']) for s in timeline), key=lambda s: s[1:])
+        with pytest.raises(KeyError):
+            schedule.name(len(processes))
+        del lanes, rows
+
+    # A file written before the index and lanes were: names parsed, lanes not stored
+    data = path.read_bytes()
+    index_offset = HEADER.unpack_from(data)[5]
+    path.write_bytes(data[:HEADER_SIZE - 16] + bytes(16) + data[HEADER_SIZE:data.rindex(b'\n', 0, index_offset) + 1])
+    with ScheduleFile(path) as schedule:
+        assert schedule.lanes() is None
+        assert all(schedule.name(pid) == f'P{pid}' for pid in range(len(processes)))
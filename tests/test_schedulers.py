@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+from core.engine.engine import simulate
+from core.engine.policies import policy_for
+from core.schedulers.fcfs import FCFSScheduler
+from core.schedulers.sjf import SJFScheduler
+from core.schedulers.srtf import SRTFScheduler
+from core.schedulers.priority_preem import priority_preem
+from core.schedulers.priority_nonpreem import PriorityNonPreemptiveScheduler
+from core.schedulers.round_robin import RRScheduler
+from core.schedulers.mlfq import MLFQScheduler
+
+HEAP_SCHEDULERS = [FCFSScheduler, SJFScheduler, SRTFScheduler, priority_preem, PriorityNonPreemptiveScheduler]
+
+
+def random_workloads(seed, count=300):
+    rng = random.Random(seed)
+    for _ in range(count):
+        horizon = rng.choice([5, 30, 200])
+        processes = [{'name': f'P{k}', 'arrival': rng.randint(0, horizon),
+                      'burst': rng.randint(0 if rng.random() < 0.2 else 1, 15), 'priority': rng.randint(0, 3)}
+                     for k in range(rng.randint(0, 30))]
+        rng.shuffle(processes)
+        yield processes
+
+
+@pytest.mark.parametrize('scheduler_class', HEAP_SCHEDULERS, ids=lambda c: c.__name__)
+def test_heap_fast_path_matches_engine(scheduler_class):
+    scheduler = scheduler_class()
+    for processes in random_workloads(7):
+        assert scheduler.schedule(processes) == simulate(processes, policy_for(scheduler))['timeline']
+
+
+def test_schedule_leaves_input_untouched():
+    processes = [{'name': 'A', 'arrival': 3, 'burst': 2, 'priority': 1},
+                 {'name': 'B', 'arrival': 0, 'burst': 5, 'priority': 0}]
+    copy = [dict(p) for p in processes]
+    for scheduler in [cls() for cls in HEAP_SCHEDULERS] + [RRScheduler(2), MLFQScheduler()]:
+        scheduler.schedule(processes)
+        assert processes == copy
+
+
+@pytest.mark.parametrize('scheduler_class', HEAP_SCHEDULERS, ids=lambda c: c.__name__)
+def test_duplicate_names_rejected(scheduler_class):
+    with pytest.raises(ValueError):
+        scheduler_class().schedule([{'name': 'A', 'arrival': 0, 'burst': 1}, {'name': 'A', 'arrival': 1, 'burst': 1}])
+
+
+def test_round_robin_queues_arrivals_before_the_preempted_process():
+    processes = [{'name': 'A', 'arrival': 0, 'burst': 4}, {'name': 'B', 'arrival': 2, 'burst': 2}]
+    slices = [(s['name'], s['start'], s['duration']) for s in RRScheduler(2).schedule(processes)]
+    assert slices == [('A', 0, 2), ('B', 2, 2), ('A', 4, 2)]
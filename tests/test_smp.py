@@ -0,0 +1,114 @@
+import random
+from collections import defaultdict
+
+import pytest
+
+from core.engine.engine import Engine
+from core.engine.smp import SMPEngine
+from core.engine.policies import (FCFSPolicy, SJFPolicy, SRTFPolicy, PriorityPolicy, RRPolicy, MLFQPolicy)
+from reference import random_workloads
+
+POLICIES = [FCFSPolicy, SJFPolicy, SRTFPolicy, lambda: PriorityPolicy(preemptive=False),
+            lambda: PriorityPolicy(preemptive=True), lambda: RRPolicy(1), lambda: RRPolicy(3)]
+
+
+def runs(seed, count=80):
+    rng = random.Random(seed)
+    for processes in random_workloads(seed, count=count, size=20, horizon=30):
+        yield processes, rng.randint(2, 4), rng.randint(0, 2), rng.random() < 0.5
+
+
+def no_overlap(slices):
+    slices = sorted(slices)
+    return all(start + duration <= next_start for (start, duration), (next_start, _) in zip(slices, slices[1:]))
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+def test_smp_invariants(policy):
+    for processes, cpus, cost, per_core in runs(policy):
+        engine = SMPEngine(POLICIES[policy](), processes, cpus, cost, per_core)
+        result = engine.run()
+        by_cpu, by_name = defaultdict(list), defaultdict(list)
+        progress = defaultdict(int)
+        for s in result['timeline']:
+            assert 0 <= s['cpu'] < cpus
+            assert 0 <= s['migration'] <= min(cost, s['duration'])
+            by_cpu[s['cpu']].append((s['start'], s['duration']))
+            by_name[s['name']].append((s['start'], s['duration']))
+            progress[s['name']] += s['duration'] - s['migration']
+
+        # One process per CPU at a time, and one CPU per process at a time
+        assert all(no_overlap(slices) for slices in by_cpu.values())
+        assert all(no_overlap(slices) for slices in by_name.values())
+
+        # Every process runs exactly its burst, after arriving, and finishes with its last slice
+        for p in processes:
+            name = p['name']
+            assert progress[name] == p['burst']
+            assert all(start >= p['arrival'] for start, _ in by_name[name])
+            end = max((start + duration for start, duration in by_name[name]), default=p['arrival'])
+            assert result['completion'][name] == end
+
+        # Work conserving: nobody waits while a CPU is idle
+        finish = max(result['completion'].values(), default=0)
+        for t in range(finish):
+            busy = {s['name'] for s in result['timeline'] if s['start'] <= t < s['start'] + s['duration']}
+            waiting = [p['name'] for p in processes
+                       if p['arrival'] <= t < result['completion'][p['name']] and p['name'] not in busy]
+            assert not waiting or len(busy) == cpus, (processes, cpus, per_core, t)
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+@pytest.mark.parametrize('per_core_queues', [False, True])
+def test_one_cpu_matches_engine(policy, per_core_queues):
+    for processes in random_workloads(60 + policy, count=150):
+        smp = SMPEngine(POLICIES[policy](), processes, 1, 2, per_core_queues)
+        single = Engine(POLICIES[policy](), processes)
+        smp_result, single_result = smp.run(), single.run()
+        assert [(s['name'], s['start'], s['duration']) for s in smp_result['timeline']] == \
+               [(s['name'], s['start'], s['duration']) for s in single_result['timeline']]
+        assert smp_result['completion'] == single_result['completion']
+        assert list(smp.first_run) == list(single.first_run)
+        assert smp.context_switches == single.context_switches
+        assert smp.migrations == 0
+
+
+def test_shared_queue_preempts_last_ranked():
+    # B (shortest) and A start; C beats both and takes the CPU of A, which has the most time left
+    processes = [{'name': 'A', 'arrival': 0, 'burst': 10}, {'name': 'B', 'arrival': 0, 'burst': 5},
+                 {'name': 'C', 'arrival': 1, 'burst': 1}]
+    timeline = SMPEngine(SRTFPolicy(), processes, cpus=2).run()['timeline']
+    assert [(s['name'], s['start'], s['duration'], s['cpu']) for s in timeline] == \
+           [('B', 0, 5, 0), ('A', 0, 1, 1), ('C', 1, 1, 1), ('A', 2, 9, 1)]
+
+
+def test_round_robin_on_shared_queue():
+    # C waits for the first quantum boundary; at the next one A is done, its CPU
+    # takes B and nobody is left waiting for C's
+    processes = [{'name': name, 'arrival': 0, 'burst': 4} for name in 'ABC']
+    timeline = SMPEngine(RRPolicy(2), processes, cpus=2).run()['timeline']
+    assert [(s['name'], s['start'], s['duration'], s['cpu']) for s in timeline] == \
+           [('A', 0, 2, 0), ('B', 0, 2, 1), ('C', 2, 4, 0), ('A', 2, 2, 1), ('B', 4, 2, 1)]
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+def test_added_batch_matches_workload_known_from_start(policy):
+    # As for Engine (tests/test_engine.py)
+    rng = random.Random(policy)
+    for processes, cpus, cost, per_core in runs(80 + policy):
+        cut = rng.randint(0, len(processes))
+        initial, later = processes[:cut], processes[cut:]
+        make = lambda processes: SMPEngine(POLICIES[policy](), processes, cpus, cost, per_core)
+        engine = make(initial)
+        engine.advance(rng.randint(0, 35))
+        earliest = engine.earliest_arrival()
+        batch = [dict(p, arrival=max(p['arrival'], earliest)) for p in later]
+        for process in batch:
+            engine.add(process)
+        engine.advance()
+        assert engine.result() == make(initial + batch).run(), (initial, batch, cpus, cost, per_core)
+
+
+def test_mlfq_is_refused():
+    with pytest.raises(ValueError):
+        SMPEngine(MLFQPolicy(), [], cpus=2)
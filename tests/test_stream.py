@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from core.engine.engine import Engine
+from core.engine.stream import StreamingEngine, run_trace
+from core.engine.policies import (FCFSPolicy, SJFPolicy, SRTFPolicy, PriorityPolicy, RRPolicy, MLFQPolicy)
+from utils.metrics import engine_metrics, PERCENTILES
+from reference import random_workloads
+
+POLICIES = [FCFSPolicy, SJFPolicy, SRTFPolicy, lambda: PriorityPolicy(preemptive=False),
+            lambda: PriorityPolicy(preemptive=True), lambda: RRPolicy(2), lambda: MLFQPolicy((1, 3, 6), 15)]
+
+
+def nearest_rank(values, p):
+    # StreamingMetrics percentiles: nearest rank, exact below 128
+    return float(np.percentile(values, p, method='inverted_cdf')) if len(values) else 0.0
+
+
+@pytest.mark.parametrize('policy', range(len(POLICIES)))
+def test_streaming_metrics_match_engine(policy):
+    for processes in random_workloads(80 + policy, count=120, size=25):
+        processes.sort(key=lambda p: p['arrival'])
+        engine = Engine(POLICIES[policy](), processes)
+        engine.run()
+        expected = engine_metrics(engine)
+        streamed = run_trace(POLICIES[policy](), iter(processes))
+
+        for field in ('count', 'makespan', 'context_switches'):
+            assert streamed[field] == expected[field]
+        for field in ('throughput', 'cpu_utilization'):
+            assert streamed[field] == pytest.approx(expected[field])
+        assert streamed['by_priority'].keys() == expected['by_priority'].keys()
+        for level, stats in expected['by_priority'].items():
+            assert streamed['by_priority'][level] == pytest.approx(stats)
+
+        done = [pid for pid in range(len(engine)) if engine.completion[pid] >= 0]
+        turnaround = [engine.completion[pid] - engine.arrival[pid] for pid in done]
+        waiting = [tat - engine.burst[pid] for tat, pid in zip(turnaround, done)]
+        response = [(engine.first_run[pid] if engine.first_run[pid] >= 0 else engine.completion[pid])
+                    - engine.arrival[pid] for pid in done]
+        for name, values in (('turnaround', turnaround), ('waiting', waiting), ('response', response)):
+            assert streamed[name]['mean'] == pytest.approx(expected[name]['mean'])
+            assert streamed[name]['max'] == expected[name]['max']
+            for p in PERCENTILES:
+                assert streamed[name][f'p{p}'] == nearest_rank(values, p)
+
+
+def test_streaming_memory_follows_live_processes():
+    # One process at a time alive: the table never holds more than a couple
+    processes = [{'name': f'P{i}', 'arrival': 10 * i, 'burst': 5} for i in range(1000)]
+    engine = StreamingEngine(FCFSPolicy())
+    metrics = engine.feed(iter(processes))
+    assert metrics['count'] == 1000
+    assert engine.peak_alive <= 2
+
+
+def test_streaming_rejects_unsorted_input():
+    with pytest.raises(ValueError):
+        run_trace(FCFSPolicy(), [{'name': 'A', 'arrival': 5, 'burst': 1}, {'name': 'B', 'arrival': 1, 'burst': 1}])
@@ -0,0 +1,44 @@
+import pytest
+
+from core.engine.sweep import OBJECTIVES, QuantumSweep
+from reference import random_workloads
+
+
+def exhaustive(processes, lo, hi):
+    with QuantumSweep(processes, jobs=1) as sweep:
+        sweep.evaluate(range(lo, hi + 1))
+        return sweep
+
+
+@pytest.mark.parametrize('objective', OBJECTIVES)
+def test_search_matches_exhaustive_sweep_on_small_ranges(objective):
+    # Ranges no wider than the samples are swept whole on the first pass
+    for processes in random_workloads(7, count=60, size=8, horizon=20):
+        for lo, hi in ((1, 4), (3, 8), (5, 5)):
+            with QuantumSweep(processes, jobs=1) as sweep:
+                best = sweep.search(lo, hi, objective, samples=6)
+            assert best == exhaustive(processes, lo, hi).best(objective)
+
+
+@pytest.mark.parametrize('objective', OBJECTIVES)
+def test_search_finds_a_minimum_of_the_exhaustive_curve(objective):
+    # On wider ranges the coarse passes may step over a narrow dip, but the
+    # answer is always at least as good as both its neighbours
+    agree = 0
+    for processes in random_workloads(8, count=60, size=8, horizon=20):
+        with QuantumSweep(processes, jobs=1) as sweep:
+            best = sweep.search(1, 30, objective, samples=4)
+            searched = sweep.curve()
+        points = exhaustive(processes, 1, 30).points
+        assert all(point == points[point['quantum']] for point in searched)
+        q = best['quantum']
+        assert all(best[objective] <= points[n][objective] for n in (q - 1, q + 1) if n in points)
+        agree += best[objective] == min(p[objective] for p in points.values())
+    assert agree >= 55
+
+
+def test_parallel_sweep_matches_one_process():
+    processes = next(random_workloads(9, count=1, size=30, horizon=60))
+    with QuantumSweep(processes, jobs=2) as sweep:
+        parallel = sweep.evaluate(range(1, 13))
+    assert parallel == exhaustive(processes, 1, 12).curve()
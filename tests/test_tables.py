@@ -0,0 +1,96 @@
+import os
+
+import numpy as np
+import pytest
+from PyQt5.QtWidgets import QApplication
+
+from gui.tables import ProcessTableModel, StatsWidget
+from utils.metrics import compute_metrics
+
+
+def row(name, remaining, arrival=0, burst=9):
+    return {'name': name, 'arrival': arrival, 'burst': burst, 'remaining': remaining}
+
+
+@pytest.fixture
+def model():
+    # Ten rows P0..P9, and every signal the view would get from here on
+    model = ProcessTableModel()
+    model.update_rows([row(f'P{i}', 9) for i in range(10)])
+    model.changed, model.inserted = [], []
+    model.dataChanged.connect(lambda top, bottom, roles=(): model.changed.append(
+        ((top.row(), top.column()), (bottom.row(), bottom.column()))))
+    model.rowsInserted.connect(lambda parent, first, last: model.inserted.append((first, last)))
+    return model
+
+
+def test_consecutive_rows_are_one_signal(model):
+    model.update_rows([row(f'P{i}', 5) for i in (3, 4, 5, 6)])
+    assert model.changed == [((3, 0), (6, 3))]
+    assert list(model.remaining) == [9, 9, 9, 5, 5, 5, 5, 9, 9, 9]
+
+
+def test_gaps_split_the_signals(model):
+    model.update_rows([row(f'P{i}', 1) for i in (0, 1, 4, 6, 7, 9)])
+    assert model.changed == [((0, 0), (1, 3)), ((4, 0), (4, 3)), ((6, 0), (7, 3)), ((9, 0), (9, 3))]
+
+
+def test_unsorted_rows_are_coalesced(model):
+    model.update_rows([row(f'P{i}', i) for i in (8, 2, 7, 3, 9)])
+    assert model.changed == [((2, 0), (3, 3)), ((7, 0), (9, 3))]
+    assert list(model.remaining) == [9, 9, 2, 3, 9, 9, 9, 7, 8, 9]
+
+
+def test_new_rows_are_inserted_not_changed(model):
+    model.update_rows([row('P5', 4), row('N1', 6, arrival=3), row('P6', 4), row('N0', 7), row('P2', 4)])
+    assert model.inserted == [(10, 11)]
+    assert model.changed == [((2, 0), (2, 3)), ((5, 0), (6, 3))]
+    assert model.names[10:] == ['N1', 'N0']
+    assert (model.arrival[10], model.remaining[10], model.remaining[11]) == (3, 6, 7)
+    assert model.rowCount() == 12
+
+
+def test_only_new_rows_emit_nothing_changed(model):
+    model.update_rows([row('N0', 1)])
+    assert model.inserted == [(10, 10)]
+    assert model.changed == []
+
+
+@pytest.fixture(scope='module')
+def app():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return QApplication.instance() or QApplication([])
+
+
+def priority_metrics(waiting):
+    # waiting: priority -> waiting times of its processes (arrival 0, burst 1)
+    priority = [level for level, times in waiting.items() for _ in times]
+    first_run = np.array([t for times in waiting.values() for t in times])
+    zeros = np.zeros(len(priority), dtype=np.int64)
+    return compute_metrics(zeros, zeros + 1, first_run + 1, first_run, np.array(priority))
+
+
+def test_priority_lines_merge_the_least_populated_levels(app):
+    # 11 levels: the eight with 5 processes are listed, 1, 3 and 7 share "Other"
+    waiting = {level: [level] * 5 for level in range(11)}
+    waiting.update({1: [10], 3: [1, 3], 7: [30]})
+    stats = StatsWidget()
+    assert stats.PRIORITY_LINES == 8
+    lines = stats._priority_lines(priority_metrics(waiting)['by_priority'])
+    assert lines[:-1] == [f"Priority {level}: n=5  WT {level:.2f}  TAT {level + 1:.2f}  RT {level:.2f}"
+                          for level in (0, 2, 4, 5, 6, 8, 9, 10)]
+    # Means over the 4 merged processes, not over the 3 levels' means (14.00)
+    assert lines[-1] == "Other (3 levels): n=4  WT 11.00  TAT 12.00  RT 11.00"
+
+
+def test_priority_lines_without_other(app):
+    stats = StatsWidget()
+    metrics = priority_metrics({level: [level, level + 2] for level in range(8)})
+    lines = stats._priority_lines(metrics['by_priority'])
+    assert len(lines) == 8 and not any(line.startswith("Other") for line in lines)
+    assert lines[3] == "Priority 3: n=2  WT 4.00  TAT 5.00  RT 4.00"
+
+    stats.update_stats(metrics)
+    assert stats.priority_label.text() == "\n".join(lines)
+    stats.update_stats(priority_metrics({0: [1, 2]}))
+    assert stats.priority_label.text() == ""
@@ -0,0 +1,151 @@
+# utils/generator.py
+
+import argparse
+import sys
+
+import numpy as np
+
+from core.process_table import ProcessTable
+from utils.trace import MAGIC
+
+# Synthetic workloads drawn with NumPy in one vectorized pass per column, for
+# load-testing the policies with millions of processes. The result is a
+# core.process_table.ProcessTable sorted by arrival, built straight from the
+# columns (process i is named P<i>), so no per-process dict is ever made.
+#
+# Arrivals keep the CPU about `load` busy on average: processes arrive at a
+# rate of load / mean_burst.
+
+ARRIVALS = ('poisson', 'bursty', 'uniform', 'zero')
+BURSTS = ('exponential', 'lognormal', 'pareto', 'uniform')
+PRIORITIES = ('uniform', 'skewed', 'constant')
+
+TRACE_DTYPE = np.dtype([('arrival', '<i8'), ('burst', '<i8'), ('priority', '<i4')])   # utils.trace RECORD
+
+
+def _arrivals(rng, n, kind, rate, cluster, spread):
+    if kind == 'poisson':
+        # Exponential inter-arrival times
+        return np.cumsum(rng.exponential(1 / rate, n))
+    if kind == 'bursty':
+        # Clusters of about `cluster` processes (geometric sizes) start as a
+        # Poisson process; inside a cluster arrivals are `spread` times denser
+        sizes = rng.geometric(1 / cluster, n // cluster + 16)
+        while sizes.sum() < n:
+            sizes = np.concatenate((sizes, rng.geometric(1 / cluster, n // cluster + 16)))
+        starts = np.cumsum(rng.exponential(cluster / rate, len(sizes)))
+        owner = np.repeat(np.arange(len(sizes)), sizes)[:n]
+        times = starts[owner] + rng.exponential(1 / (rate * spread), n)
+        times.sort()
+        return times
+    if kind == 'uniform':
+        times = rng.uniform(0, n / rate, n)
+        times.sort()
+        return times
+    if kind == 'zero':
+        return np.zeros(n)
+    raise ValueError(f"Unknown arrival pattern: {kind} (use one of {', '.join(ARRIVALS)})")
+
+
+def _bursts(rng, n, kind, mean, sigma, alpha):
+    if kind == 'exponential':
+        return rng.exponential(mean, n)
+    if kind == 'lognormal':
+        # mu chosen so that the mean is `mean` whatever sigma is
+        return rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, n)
+    if kind == 'pareto':
+        # Classic Pareto (NumPy draws the Lomax form): most jobs short, a few huge
+        if alpha <= 1:
+            raise ValueError("Pareto shape must be above 1 for the mean burst to exist")
+        return mean * (alpha - 1) / alpha * (1 + rng.pareto(alpha, n))
+    if kind == 'uniform':
+        return rng.uniform(1, 2 * mean - 1, n)
+    raise ValueError(f"Unknown burst distribution: {kind} (use one of {', '.join(BURSTS)})")
+
+
+def _priorities(rng, n, kind, levels):
+    if kind == 'uniform':
+        return rng.integers(0, levels, n)
+    if kind == 'skewed':
+        # Geometric: each level half as likely as the one above, capped at the lowest
+        return np.minimum(rng.geometric(0.5, n) - 1, levels - 1)
+    if kind == 'constant':
+        return np.zeros(n, dtype=np.int64)
+    raise ValueError(f"Unknown priority distribution: {kind} (use one of {', '.join(PRIORITIES)})")
+
+
+def generate_columns(n, arrivals='poisson', bursts='exponential', mean_burst=10.0, load=0.9,
+                     priorities='uniform', levels=10, seed=None, sigma=1.0, alpha=1.5, cluster=50, spread=20.0):
+    """
+    Draws n processes and returns (arrival, burst, priority) int64 arrays,
+    sorted by arrival. Bursts are at least 1 and average about mean_burst.
+
+    arrivals: poisson, bursty (clusters of about `cluster` processes arriving
+    `spread` times faster than average), uniform or zero (all at t=0).
+    bursts: exponential, lognormal (shape sigma), pareto (shape alpha > 1) or
+    uniform. priorities: uniform over `levels`, skewed (geometric, level 0
+    most common) or constant. The same seed gives the same workload.
+    """
+    if n < 0:
+        raise ValueError("Process count cannot be negative")
+    if mean_burst < 1:
+        raise ValueError("Mean burst must be at least 1")
+    if load <= 0:
+        raise ValueError("Load must be positive")
+    if levels < 1:
+        raise ValueError("At least one priority level is needed")
+    if cluster < 1 or spread <= 0:
+        raise ValueError("Cluster size must be at least 1 and spread positive")
+
+    rng = np.random.default_rng(seed)
+    rate = load / mean_burst
+    arrival = np.floor(_arrivals(rng, n, arrivals, rate, cluster, spread)).astype(np.int64)
+    burst = np.maximum(1, np.rint(_bursts(rng, n, bursts, mean_burst, sigma, alpha))).astype(np.int64)
+    priority = _priorities(rng, n, priorities, levels).astype(np.int64)
+    return arrival, burst, priority
+
+
+def generate(n, **options):
+    """Same as generate_columns, as a ProcessTable ready for the engines"""
+    arrival, burst, priority = generate_columns(n, **options)
+    return ProcessTable.from_columns(arrival, burst, priority)
+
+
+def write_trace(path, arrival, burst, priority):
+    """
+    Writes arrival-sorted columns as a utils.trace binary trace in one block
+    (readable with read_trace, or batch.py --stream)
+    """
+    records = np.empty(len(arrival), dtype=TRACE_DTYPE)
+    records['arrival'] = arrival
+    records['burst'] = burst
+    records['priority'] = priority
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        records.tofile(f)
+    return len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic workload as a binary trace")
+    parser.add_argument('count', type=int, help="number of processes")
+    parser.add_argument('out', help="output .trace file")
+    parser.add_argument('--arrivals', default='poisson', choices=ARRIVALS)
+    parser.add_argument('--bursts', default='exponential', choices=BURSTS)
+    parser.add_argument('--priorities', default='uniform', choices=PRIORITIES)
+    parser.add_argument('--mean-burst', type=float, default=10.0)
+    parser.add_argument('--load', type=float, default=0.9, help="average CPU demand (1 = saturated)")
+    parser.add_argument('--levels', type=int, default=10, help="priority levels")
+    parser.add_argument('--sigma', type=float, default=1.0, help="lognormal shape")
+    parser.add_argument('--alpha', type=float, default=1.5, help="Pareto shape")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    columns = generate_columns(args.count, arrivals=args.arrivals, bursts=args.bursts, mean_burst=args.mean_burst,
+                               load=args.load, priorities=args.priorities, levels=args.levels, seed=args.seed,
+                               sigma=args.sigma, alpha=args.alpha)
+    print(f"{write_trace(args.out, *columns)} processes written to {args.out}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
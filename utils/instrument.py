@@ -0,0 +1,156 @@
+# utils/instrument.py
+
+import argparse
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+
+
+class Instrument:
+    """
+    Per-run timers, counters and samples for the simulators' hot loops.
+
+    Call sites guard every probe with `if probe.enabled`, so a disabled
+    instrument costs one attribute check per section and nothing else.
+    lap(name) charges the time since the previous lap (or mark()) to a
+    section, so consecutive laps cover the loop without gaps.
+    profile=True / memory=True also wrap the run in cProfile (simulation
+    thread only) / tracemalloc.
+    """
+
+    def __init__(self, enabled=True, profile=False, memory=False):
+        self.enabled = enabled
+        self.profile = enabled and profile
+        self.memory = enabled and memory
+        self.sections = {}   # name -> [calls, seconds]
+        self.counters = {}   # name -> count
+        self.samples = {}    # name -> [count, total, max]
+        self.wall = 0.0
+        self.events = 0
+        self.peak_bytes = None
+        self.profile_text = ''
+        self._last = 0.0
+        self._started = None
+        self._profiler = None
+
+    def mark(self):
+        self._last = time.perf_counter()
+
+    def lap(self, name):
+        now = time.perf_counter()
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = [0, 0.0]
+        section[0] += 1
+        section[1] += now - self._last
+        self._last = now
+
+    def count(self, name, n=1):
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def sample(self, name, value):
+        sample = self.samples.get(name)
+        if sample is None:
+            sample = self.samples[name] = [0, 0, value]
+        sample[0] += 1
+        sample[1] += value
+        if value > sample[2]:
+            sample[2] = value
+
+    def start(self):
+        if not self.enabled:
+            return
+        if self.memory:
+            tracemalloc.start()
+        if self.profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._started = time.perf_counter()
+        self._last = self._started
+
+    def stop(self, events=0):
+        """Ends the run; events is the number of engine events it processed"""
+        if self._started is None:
+            return
+        self.wall = time.perf_counter() - self._started
+        self._started = None
+        self.events = events
+        if self._profiler is not None:
+            self._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(self._profiler, stream=out).sort_stats('cumulative').print_stats(15)
+            self.profile_text = out.getvalue()
+            self._profiler = None
+        if self.memory and tracemalloc.is_tracing():
+            self.peak_bytes = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+    def result(self):
+        return {
+            'wall': self.wall,
+            'events': self.events,
+            'events_per_sec': self.events / self.wall if self.wall else 0.0,
+            'sections': {name: {'calls': calls, 'seconds': seconds}
+                         for name, (calls, seconds) in self.sections.items()},
+            'counters': dict(self.counters),
+            'samples': {name: {'mean': total / count, 'max': peak}
+                        for name, (count, total, peak) in self.samples.items()},
+            'peak_bytes': self.peak_bytes,
+        }
+
+    def report(self):
+        """Plain-text report of the run"""
+        r = self.result()
+        lines = [f"Wall time {r['wall']:.3f} s, {r['events']} engine events ({r['events_per_sec']:.0f}/s)", ""]
+        if r['sections']:
+            lines.append(f"{'section':<12}{'calls':>10}{'total s':>10}{'mean us':>10}{'share':>8}")
+            for name, s in sorted(r['sections'].items(), key=lambda item: -item[1]['seconds']):
+                share = s['seconds'] / r['wall'] if r['wall'] else 0.0
+                lines.append(f"{name:<12}{s['calls']:>10}{s['seconds']:>10.3f}"
+                             f"{s['seconds'] / s['calls'] * 1e6:>10.1f}{share:>8.1%}")
+            # Outside every section, e.g. waiting for the next replay frame
+            other = max(0.0, r['wall'] - sum(s['seconds'] for s in r['sections'].values()))
+            lines.append(f"{'unaccounted':<12}{'':>10}{other:>10.3f}{'':>10}"
+                         f"{other / r['wall'] if r['wall'] else 0.0:>8.1%}")
+            lines.append("")
+        for name, s in sorted(r['samples'].items()):
+            lines.append(f"{name}: mean {s['mean']:.1f}, max {s['max']}")
+        for name, count in sorted(r['counters'].items()):
+            lines.append(f"{name}: {count}")
+        if r['peak_bytes'] is not None:
+            lines.append(f"Peak traced memory: {r['peak_bytes'] / 2**20:.1f} MiB")
+        if self.profile_text:
+            lines += ["", self.profile_text]
+        return "\n".join(lines)
+
+
+DISABLED = Instrument(enabled=False)
+
+
+def main(argv=None):
+    # Runs the live simulator loop without the GUI (and without pacing by default)
+    from core.engine.policies import POLICIES, policy_by_name
+    from core.simulator import Simulator
+    from utils.workload_files import read_workload
+
+    parser = argparse.ArgumentParser(description="Instrumented headless run of the live simulator")
+    parser.add_argument('workload', help="CSV or JSON workload file")
+    parser.add_argument('--policy', default='RRScheduler', choices=list(POLICIES))
+    parser.add_argument('--quantum', type=int, default=2)
+    parser.add_argument('--time-unit', type=float, default=0.0, help="seconds slept per time unit")
+    parser.add_argument('--profile', action='store_true', help="add a cProfile summary")
+    parser.add_argument('--memory', action='store_true', help="trace peak memory (slow)")
+    args = parser.parse_args(argv)
+
+    probe = Instrument(profile=args.profile, memory=args.memory)
+    simulator = Simulator(policy_by_name(args.policy, args.quantum), read_workload(args.workload),
+                          time_unit=args.time_unit, probe=probe)
+    simulator.run()
+    print(probe.report())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,206 @@
+# utils/metrics.py
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+
+
+def _summary(values):
+    if values.size == 0:
+        return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+    p50, p95, p99 = np.percentile(values, PERCENTILES)
+    return {
+        'mean': float(values.mean()),
+        'p50': float(p50),
+        'p95': float(p95),
+        'p99': float(p99),
+        'max': float(values.max()),
+    }
+
+
+def compute_metrics(arrival, burst, completion, first_run, priority=None, context_switches=0, cpus=1):
+    """
+    Computes every schedule metric in one vectorized pass.
+
+    arrival, burst, completion, first_run are per-process arrays; unfinished
+    processes have completion < 0 and are left out. Returns a dict with
+    waiting / turnaround / response summaries (mean, p50, p95, p99, max),
+    throughput, CPU utilization (over all `cpus`), makespan, context switches
+    and, when priority is given, a per-priority breakdown.
+    """
+    arrival = np.asarray(arrival, dtype=np.int64)
+    burst = np.asarray(burst, dtype=np.int64)
+    completion = np.asarray(completion, dtype=np.int64)
+    first_run = np.asarray(first_run, dtype=np.int64)
+
+    done = completion >= 0
+    arrival, burst, completion, first_run = arrival[done], burst[done], completion[done], first_run[done]
+    # Zero-burst processes never run: they respond at completion
+    first_run = np.where(first_run < 0, completion, first_run)
+
+    turnaround = completion - arrival
+    waiting = turnaround - burst
+    response = first_run - arrival
+
+    count = int(done.sum())
+    if count:
+        start = int(arrival.min())
+        makespan = int(completion.max()) - start
+    else:
+        makespan = 0
+    busy = int(burst.sum())
+
+    metrics = {
+        'count': count,
+        'waiting': _summary(waiting),
+        'turnaround': _summary(turnaround),
+        'response': _summary(response),
+        'makespan': makespan,
+        'throughput': count / makespan if makespan else 0.0,
+        'cpu_utilization': busy / (makespan * cpus) if makespan else 0.0,
+        'context_switches': int(context_switches),
+        'by_priority': {},
+    }
+
+    if priority is not None and count:
+        priority = np.asarray(priority, dtype=np.int64)[done]
+        levels, group = np.unique(priority, return_inverse=True)
+        sizes = np.bincount(group)
+        avg_wt = np.bincount(group, weights=waiting) / sizes
+        avg_tat = np.bincount(group, weights=turnaround) / sizes
+        avg_rt = np.bincount(group, weights=response) / sizes
+        for i, level in enumerate(levels.tolist()):
+            metrics['by_priority'][level] = {
+                'count': int(sizes[i]),
+                'avg_waiting': float(avg_wt[i]),
+                'avg_turnaround': float(avg_tat[i]),
+                'avg_response': float(avg_rt[i]),
+            }
+
+    return metrics
+
+
+def engine_metrics(engine):
+    """
+    compute_metrics over a core.engine Engine or SMPEngine run; multi-CPU
+    runs also get per_cpu_utilization and migrations
+    """
+    metrics = compute_metrics(engine.arrival, engine.burst, engine.completion, engine.first_run,
+                              engine.priority, engine.context_switches, engine.cpus)
+    if engine.cpus > 1:
+        makespan = metrics['makespan']
+        metrics['per_cpu_utilization'] = [busy / makespan if makespan else 0.0 for busy in engine.cpu_busy]
+        metrics['migrations'] = engine.migrations
+    return metrics
+
+
+class _Histogram:
+    # Integer values: exact below 2**SUB_BITS, then 2**SUB_BITS buckets per
+    # power of two (relative error < 1 / 2**SUB_BITS)
+    SUB_BITS = 7
+
+    def __init__(self):
+        self.counts = {}
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def add(self, value):
+        bucket = self._bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.total += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def _bucket(self, value):
+        if value < 1 << self.SUB_BITS:
+            return value
+        shift = value.bit_length() - self.SUB_BITS - 1
+        return (shift + 1 << self.SUB_BITS) + (value >> shift) - (1 << self.SUB_BITS)
+
+    def _lower(self, bucket):
+        if bucket < 1 << self.SUB_BITS:
+            return bucket
+        shift = (bucket >> self.SUB_BITS) - 1
+        return ((bucket & ((1 << self.SUB_BITS) - 1)) + (1 << self.SUB_BITS)) << shift
+
+    def percentile(self, p):
+        # Nearest rank, reported as the lower bound of its bucket
+        rank = max(1, -(-self.total * p // 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return float(self._lower(bucket))
+        return float(self.max)
+
+    def summary(self):
+        if not self.total:
+            return {'mean': 0.0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+        summary = {'mean': self.sum / self.total}
+        for p in PERCENTILES:
+            summary[f'p{p}'] = self.percentile(p)
+        summary['max'] = float(self.max)
+        return summary
+
+
+class StreamingMetrics:
+    """
+    compute_metrics for runs too long to keep every process: add() each
+    process as it finishes, result() returns the same dict. Means, max,
+    makespan and the per-priority averages are exact; percentiles come from
+    log-bucketed histograms (exact below 128, within 1% above).
+    """
+
+    def __init__(self):
+        self.waiting = _Histogram()
+        self.turnaround = _Histogram()
+        self.response = _Histogram()
+        self.first_arrival = None
+        self.last_completion = 0
+        self.busy = 0
+        self._by_priority = {}   # priority -> [count, waiting, turnaround, response]
+
+    def add(self, arrival, burst, completion, first_run, priority=0):
+        if first_run < 0:
+            first_run = completion   # zero-burst processes respond at completion
+        turnaround = completion - arrival
+        waiting = turnaround - burst
+        response = first_run - arrival
+        self.waiting.add(waiting)
+        self.turnaround.add(turnaround)
+        self.response.add(response)
+        self.busy += burst
+        if self.first_arrival is None or arrival < self.first_arrival:
+            self.first_arrival = arrival
+        self.last_completion = max(self.last_completion, completion)
+
+        sums = self._by_priority.setdefault(priority, [0, 0, 0, 0])
+        sums[0] += 1
+        sums[1] += waiting
+        sums[2] += turnaround
+        sums[3] += response
+
+    def result(self, context_switches=0, cpus=1):
+        count = self.waiting.total
+        makespan = self.last_completion - self.first_arrival if count else 0
+        metrics = {
+            'count': count,
+            'waiting': self.waiting.summary(),
+            'turnaround': self.turnaround.summary(),
+            'response': self.response.summary(),
+            'makespan': makespan,
+            'throughput': count / makespan if makespan else 0.0,
+            'cpu_utilization': self.busy / (makespan * cpus) if makespan else 0.0,
+            'context_switches': int(context_switches),
+            'by_priority': {},
+        }
+        for level in sorted(self._by_priority):
+            n, wt, tat, rt = self._by_priority[level]
+            metrics['by_priority'][level] = {
+                'count': n,
+                'avg_waiting': wt / n,
+                'avg_turnaround': tat / n,
+                'avg_response': rt / n,
+            }
+        return metrics
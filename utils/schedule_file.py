@@ -0,0 +1,328 @@
+# utils/schedule_file.py
+
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+# Schedule files: every slice of a run as a fixed-width little-endian record,
+# written while the engine runs and read back through a memory map, so the
+# columns are NumPy views on the file and nothing is parsed or copied.
+#
+#   header:  MAGIC padded to 16 bytes, then count, names offset, flags, CPU
+#            count, name index offset, lanes offset (uint64)
+#   records: SLICE_DTYPE, in the order the engine ended them
+#   names:   JSON [pid, name] lines for the processes that ran, one per
+#            process and chunk of CHUNK_RECORDS records it ran in (a pid may
+#            repeat, always with the same name)
+#   index:   the pids that ran, sorted (int64), then the file offset of one
+#            of their names lines (int64), padded to start on 8 bytes
+#   lanes:   with several CPUs only: CPU count + 1 bounds (int64), then the
+#            record numbers of CPU 0's slices, of CPU 1's... (LANE_DTYPE), so
+#            CPU c's slices are records rows[bounds[c]:bounds[c + 1]]
+#
+# FLAG_SORTED is set when the start column is non-decreasing (always the case
+# for a single CPU). Within one CPU, slices are always stored in the order
+# they ran. Files from before a field was stored have 0 there.
+
+MAGIC = b'CPUSCHED1\n'
+HEADER = struct.Struct('<16sQQQQQQ')
+HEADER_SIZE = 64
+SLICE_DTYPE = np.dtype([
+    ('pid', '<i8'),
+    ('start', '<i8'),
+    ('duration', '<i8'),
+    ('cpu', '<i4'),
+    ('migration', '<i4'),
+])
+RECORD = struct.Struct('<qqqii')
+CHUNK_RECORDS = 65536
+FLAG_SORTED = 1
+INDEX_ENTRY = struct.Struct('<qq')
+INDEX_DTYPE = np.dtype([('pid', '<i8'), ('offset', '<i8')])   # the writer's unsorted pairs
+
+
+def lane_dtype(count):
+    """Record number type of the lanes section of a file of `count` records"""
+    return np.dtype('<u4') if count < 2 ** 32 else np.dtype('<i8')
+
+
+class ScheduleWriter:
+    """
+    Slice sink for Engine / SMPEngine (their on_slice hook): appends each
+    slice to a schedule file as it ends. `names` is the engine's pid -> name
+    column; a process name is stored the first time the process runs in each
+    chunk of records, so memory stays at one chunk of records and of pids
+    whatever the length of the run (StreamingEngine pids never stop growing).
+    close() sorts the name index and lists each CPU's records through
+    temporary files and the file itself, a chunk at a time.
+    """
+
+    def __init__(self, path, names):
+        self.path = path
+        self.names = names
+        self.count = 0
+        self._file = open(path, 'w+b')
+        self._file.write(bytes(HEADER_SIZE))   # filled in by close()
+        self._buffer = bytearray()
+        self._named = set()                    # pids whose name is stored, in this chunk
+        self._names_file = tempfile.TemporaryFile()
+        self._names_size = 0
+        self._index_file = tempfile.TemporaryFile()   # (pid, offset in _names_file) pairs
+        self._last_start = None
+        self._sorted = True
+        self._cpus = 0
+
+    def __call__(self, pid, cpu, start, duration, migration=0):
+        if pid not in self._named:
+            self._named.add(pid)
+            line = (json.dumps([pid, self.names[pid]]) + '\n').encode('utf-8')
+            self._names_file.write(line)
+            self._index_file.write(INDEX_ENTRY.pack(pid, self._names_size))
+            self._names_size += len(line)
+        if self._last_start is not None and start < self._last_start:
+            self._sorted = False
+        self._last_start = start
+        if cpu >= self._cpus:
+            self._cpus = cpu + 1
+
+        self._buffer += RECORD.pack(pid, start, duration, cpu, migration)
+        self.count += 1
+        if len(self._buffer) >= RECORD.size * CHUNK_RECORDS:
+            self._file.write(self._buffer)
+            self._buffer.clear()
+            self._named.clear()
+
+    def close(self):
+        if self._file.closed:
+            return
+        f = self._file
+        f.write(self._buffer)
+        self._buffer.clear()
+        names_offset = f.tell()
+        self._names_file.seek(0)
+        shutil.copyfileobj(self._names_file, f)
+        self._names_file.close()
+        f.write(bytes(-f.tell() % 8))
+        index_offset = f.tell()
+        self._write_index(names_offset)
+        lanes_offset = self._write_lanes() if self._cpus > 1 else 0
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, self.count, names_offset, FLAG_SORTED if self._sorted else 0, self._cpus,
+                            index_offset, lanes_offset))
+        f.close()
+
+    def _write_index(self, names_offset):
+        # Sort the (pid, offset) pairs in place in their temporary file, then
+        # copy one pair per pid: all the pids, then all the offsets
+        f, pairs_file = self._file, self._index_file
+        pairs_file.flush()
+        entries = pairs_file.seek(0, 2) // INDEX_DTYPE.itemsize
+        if entries:
+            pairs = np.memmap(pairs_file, dtype=INDEX_DTYPE, mode='r+', shape=(entries,))
+            pairs.sort(order='pid', kind='stable')
+            for field, shift in (('pid', 0), ('offset', names_offset)):
+                last = None
+                for lo in range(0, entries, CHUNK_RECORDS):
+                    pids = pairs['pid'][lo:lo + CHUNK_RECORDS]
+                    first = pids != np.concatenate(([pids[0] - 1 if last is None else last], pids[:-1]))
+                    f.write((pairs[field][lo:lo + CHUNK_RECORDS][first] + shift).astype('<i8').tobytes())
+                    last = pids[-1]
+            del pairs
+        pairs_file.close()
+
+    def _write_lanes(self):
+        # Each CPU's records, in file order: count them, then place every
+        # chunk's records of each CPU after those of the chunks before
+        f, count, cpus = self._file, self.count, self._cpus
+        f.flush()
+        records = np.memmap(f, dtype=SLICE_DTYPE, mode='r', offset=HEADER_SIZE, shape=(count,))
+        sizes = np.zeros(cpus, dtype=np.int64)
+        for lo in range(0, count, CHUNK_RECORDS):
+            sizes += np.bincount(records['cpu'][lo:lo + CHUNK_RECORDS], minlength=cpus)
+        bounds = np.concatenate(([0], np.cumsum(sizes))).astype('<i8')
+        lanes_offset = f.seek(0, 2)
+        f.write(bounds.tobytes())
+        dtype = lane_dtype(count)
+        rows_offset = f.tell()
+        filled = bounds[:-1].copy()
+        for lo in range(0, count, CHUNK_RECORDS):
+            cpu = records['cpu'][lo:lo + CHUNK_RECORDS]
+            rows = (np.argsort(cpu, kind='stable') + lo).astype(dtype)
+            at = 0
+            for c, size in enumerate(np.bincount(cpu, minlength=cpus).tolist()):
+                if size:
+                    f.seek(rows_offset + int(filled[c]) * dtype.itemsize)
+                    f.write(rows[at:at + size].tobytes())
+                    filled[c] += size
+                    at += size
+        del records
+        return lanes_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def record_schedule(engine, path):
+    """
+    Streams every slice of `engine` to a schedule file. Returns the writer,
+    to be closed once the run is over.
+    """
+    writer = ScheduleWriter(path, engine.names)
+    engine.on_slice = writer
+    return writer
+
+
+class ScheduleFile:
+    """
+    Read-only view of a schedule file. slices is a structured array mapped
+    from the file; pid, cpu, start, duration and migration are its columns
+    (views, not copies). name(pid) looks a process name up in the file's
+    name index, lanes() lists each CPU's records. close() (or leaving a with
+    block) unmaps the file; views taken from it must be dropped first.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE or not header.startswith(MAGIC):
+            raise ValueError(f"{path}: not a schedule file")
+        _, count, self._names_offset, flags, self._cpus, index_offset, self._lanes_offset = \
+            HEADER.unpack_from(header)
+        if self._names_offset != HEADER_SIZE + count * SLICE_DTYPE.itemsize:
+            raise ValueError(f"{path}: truncated schedule file")
+        self.sorted_by_start = bool(flags & FLAG_SORTED)
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.slices = np.frombuffer(self._map, dtype=SLICE_DTYPE, count=count, offset=HEADER_SIZE)
+        self._index_pids = self._name_offsets = None
+        if index_offset:
+            entries = ((self._lanes_offset or len(self._map)) - index_offset) // INDEX_DTYPE.itemsize
+            self._index_pids = np.frombuffer(self._map, dtype='<i8', count=entries, offset=index_offset)
+            self._name_offsets = np.frombuffer(self._map, dtype='<i8', count=entries,
+                                               offset=index_offset + 8 * entries)
+        self._names = None   # pid -> name, for files without an index
+
+    def __len__(self):
+        return len(self.slices)
+
+    def close(self):
+        if self._map is None:
+            return
+        self.slices = np.empty(0, dtype=SLICE_DTYPE)
+        self._index_pids = self._name_offsets = None
+        self._map.close()   # BufferError while column views are still alive
+        self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getattr__(self, field):
+        # Column views: pid, start, duration, cpu, migration
+        if field in SLICE_DTYPE.names:
+            return self.slices[field]
+        raise AttributeError(field)
+
+    def advise_random(self):
+        """
+        Tells the OS that records will now be read here and there (binary
+        searches) rather than in order: a page fault reads one page, not the
+        pages after it, and the pages read so far are let go. Each hint is
+        skipped where the platform lacks it.
+        """
+        if hasattr(mmap, 'MADV_DONTNEED'):
+            self._map.madvise(mmap.MADV_DONTNEED)
+        if hasattr(mmap, 'MADV_RANDOM'):
+            self._map.madvise(mmap.MADV_RANDOM)
+
+    def name(self, pid):
+        """Name of process pid (KeyError if it never ran), by binary search over the name index"""
+        pids = self._index_pids
+        if pids is None:
+            return self._parse_names()[pid]
+        i = int(np.searchsorted(pids, pid))
+        if i == len(pids) or pids[i] != pid:
+            raise KeyError(pid)
+        offset = int(self._name_offsets[i])
+        return json.loads(self._map[offset:self._map.find(b'\n', offset)])[1]
+
+    def _parse_names(self):
+        # Older file: read the whole names section once
+        if self._names is None:
+            self._names = {}
+            with open(self.path, 'rb') as f:
+                f.seek(self._names_offset)
+                for line in f:
+                    pid, name = json.loads(line)
+                    self._names[pid] = name
+        return self._names
+
+    @property
+    def cpus(self):
+        if not self._cpus and len(self):
+            self._cpus = int(self.cpu.max()) + 1   # older file: scan the cpu column
+        return self._cpus
+
+    def lanes(self):
+        """
+        Record numbers of each CPU's slices in the order they ran, one view
+        per CPU, or None for a single-CPU file (every record, in order) or
+        one written without them
+        """
+        if not self._lanes_offset:
+            return None
+        cpus = self.cpus
+        bounds = np.frombuffer(self._map, dtype='<i8', count=cpus + 1, offset=self._lanes_offset).tolist()
+        rows = np.frombuffer(self._map, dtype=lane_dtype(len(self)), count=len(self),
+                             offset=self._lanes_offset + 8 * (cpus + 1))
+        return [rows[a:b] for a, b in zip(bounds, bounds[1:])]
+
+    def timeline(self):
+        """Yields the slices as timeline dicts (name, start, duration, cpu, migration)"""
+        for start in range(0, len(self), CHUNK_RECORDS):
+            records = self.slices[start:start + CHUNK_RECORDS]
+            # Names of this chunk's processes only
+            names = {pid: self.name(pid) for pid in np.unique(records['pid']).tolist()}
+            for pid, begin, duration, cpu, migration in records.tolist():
+                yield {'name': names[pid], 'start': begin, 'duration': duration, 'cpu': cpu, 'migration': migration}
+
+
+def write_chrome_trace(path, schedule, time_scale=1):
+    """
+    Writes a ScheduleFile as Chrome / Perfetto trace JSON (open it in
+    chrome://tracing or ui.perfetto.dev): one complete event per slice, one
+    track per CPU. One simulation time unit becomes time_scale microseconds.
+    """
+    with open(path, 'w') as f:
+        f.write('{"displayTimeUnit": "ms", "traceEvents": [\n')
+        f.write(json.dumps({'ph': 'M', 'pid': 0, 'name': 'process_name', 'args': {'name': 'Schedule'}}))
+        for cpu in range(schedule.cpus):
+            f.write(',\n' + json.dumps({'ph': 'M', 'pid': 0, 'tid': cpu, 'name': 'thread_name',
+                                        'args': {'name': f'CPU {cpu}'}}))
+        for s in schedule.timeline():
+            event = {'ph': 'X', 'pid': 0, 'tid': s['cpu'], 'name': s['name'],
+                     'ts': s['start'] * time_scale, 'dur': s['duration'] * time_scale}
+            if s['migration']:
+                event['args'] = {'migration': s['migration']}
+            f.write(',\n' + json.dumps(event))
+        f.write('\n]}\n')
+
+
+if __name__ == '__main__':
+    # python -m utils.schedule_file run.sched trace.json
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m utils.schedule_file IN.sched OUT.json")
+    with ScheduleFile(sys.argv[1]) as schedule:
+        write_chrome_trace(sys.argv[2], schedule)
+        print(f"{len(schedule)} slices written to {sys.argv[2]}")
@@ -0,0 +1,94 @@
+# utils/trace.py
+
+import csv
+import os
+import struct
+import sys
+
+from utils.workload_files import parse_process
+
+# Streaming workload traces, sorted by arrival. Readers are generators that
+# hold one chunk of the file at a time, never the whole trace.
+#
+#   CSV:    same columns as utils/workload_files.py
+#   binary: MAGIC, then fixed-width little-endian records
+#           (arrival int64, burst int64, priority int32); process i is named P<i>
+
+MAGIC = b'CPUTRACE1\n'
+RECORD = struct.Struct('<qqi')
+CHUNK_RECORDS = 65536
+
+
+def read_trace(path):
+    """Yields process dicts from a .csv or binary (.trace / .bin) trace"""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return read_csv_trace(path)
+    if ext in ('.trace', '.bin'):
+        return read_binary_trace(path)
+    raise ValueError(f"{path}: unsupported trace format '{ext}' (use .csv, .trace or .bin)")
+
+
+def read_csv_trace(path):
+    last = None
+    with open(path, newline='') as f:
+        reader = csv.DictReader(f)
+        for record in reader:
+            where = f"{path} line {reader.line_num}"
+            process = parse_process(record, where)
+            if last is not None and process['arrival'] < last:
+                raise ValueError(f"{where}: trace is not sorted by arrival")
+            last = process['arrival']
+            yield process
+
+
+def read_binary_trace(path):
+    with open(path, 'rb') as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path}: not a binary trace")
+        index = 0
+        last = None
+        while True:
+            chunk = f.read(RECORD.size * CHUNK_RECORDS)
+            if not chunk:
+                return
+            if len(chunk) % RECORD.size:
+                raise ValueError(f"{path}: truncated record at process {index + len(chunk) // RECORD.size}")
+            for arrival, burst, priority in RECORD.iter_unpack(chunk):
+                if last is not None and arrival < last:
+                    raise ValueError(f"{path}: trace is not sorted by arrival (process {index})")
+                if arrival < 0 or burst <= 0 or priority < 0:
+                    raise ValueError(f"{path}: invalid values for process {index}")
+                last = arrival
+                yield {'name': f'P{index}', 'arrival': arrival, 'burst': burst, 'priority': priority}
+                index += 1
+
+
+def write_binary_trace(path, processes):
+    """
+    Writes an arrival-sorted iterable of process dicts as a binary trace
+    (names are not stored). Returns the number of processes written.
+    """
+    count = 0
+    last = None
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        buffer = bytearray()
+        for p in processes:
+            if last is not None and p['arrival'] < last:
+                raise ValueError(f"Process {p['name']} breaks the arrival order")
+            last = p['arrival']
+            buffer += RECORD.pack(p['arrival'], p['burst'], p.get('priority', 0))
+            count += 1
+            if len(buffer) >= RECORD.size * CHUNK_RECORDS:
+                f.write(buffer)
+                buffer.clear()
+        f.write(buffer)
+    return count
+
+
+if __name__ == '__main__':
+    # python -m utils.trace in.csv out.trace
+    if len(sys.argv) != 3:
+        sys.exit("usage: python -m utils.trace IN.csv OUT.trace")
+    print(f"{write_binary_trace(sys.argv[2], read_trace(sys.argv[1]))} processes written to {sys.argv[2]}")
@@ -0,0 +1,73 @@
+# utils/workload_files.py
+
+import csv
+import json
+import os
+
+# Workload files hold one process per row / object:
+#   CSV:  header with name, arrival, burst and optionally priority
+#   JSON: a list of {"name", "arrival", "burst", "priority"} objects,
+#         or an object with that list under "processes"
+
+
+def parse_process(record, where):
+    """Validates one raw record (dict of strings or numbers); `where` prefixes error messages"""
+    try:
+        name = str(record['name']).strip()
+        process = {
+            'name': name,
+            'arrival': int(record['arrival']),
+            'burst': int(record['burst']),
+            'priority': int(record.get('priority') or 0),
+        }
+    except KeyError as e:
+        raise ValueError(f"{where}: missing field {e}") from None
+    except (TypeError, ValueError):
+        raise ValueError(f"{where}: invalid number format") from None
+
+    # Same rules as the process table in the GUI
+    if not name:
+        raise ValueError(f"{where}: empty process name")
+    if process['arrival'] < 0:
+        raise ValueError(f"{where}: arrival time cannot be negative for process '{name}'")
+    if process['burst'] <= 0:
+        raise ValueError(f"{where}: burst time must be positive for process '{name}'")
+    if process['priority'] < 0:
+        raise ValueError(f"{where}: priority cannot be negative for process '{name}'")
+    return process
+
+
+def read_workload(path):
+    """
+    Reads a CSV or JSON workload file.
+    Returns a list of dicts:
+    [{'name': str, 'arrival': int, 'burst': int, 'priority': int}, ...]
+    Raises ValueError on malformed rows or duplicate names.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = data.get('processes', [])
+        if not isinstance(data, list):
+            raise ValueError(f"{path}: expected a list of processes")
+        records = [(f"{path} item {i}", r) for i, r in enumerate(data)]
+    elif ext == '.csv':
+        with open(path, newline='') as f:
+            reader = csv.DictReader(f)
+            records = [(f"{path} line {reader.line_num}", r) for r in reader]
+    else:
+        raise ValueError(f"{path}: unsupported workload format '{ext}' (use .csv or .json)")
+
+    processes = []
+    seen = set()
+    for where, record in records:
+        if not isinstance(record, dict):
+            raise ValueError(f"{where}: expected an object")
+        process = parse_process(record, where)
+        if process['name'] in seen:
+            raise ValueError(f"{where}: duplicate process name '{process['name']}'")
+        seen.add(process['name'])
+        processes.append(process)
+    return processes